@@ -0,0 +1,263 @@
+import json
+from copy import deepcopy
+from os.path import exists
+from timeit import default_timer
+
+from numpy import int8
+from numpy.random import default_rng
+
+from Engine.HeadlessControllerClass import HeadlessController
+from Engine.SimulationClass import Simulation
+from FieldObjects.PlayerClass import Player
+from FieldObjects.PlayerClassBot import PlayerBotConeStrategy, PlayerBotContLossStrategy
+from Utils.Const import *
+from Utils.HaloGrid import create_halo_grid, get_field, sync_halo
+from Utils.HelperFunctions import replace_hex_color
+from Utils.TargetFunctions import (target_function_cont, target_function_cont_d, target_function_cont_dd,
+                                   get_unit_vector_sums, target_function_cont_argmin)
+
+FIELD_SIZE = 860  # Field size of all benchmarks, same as in the game.
+DENSE_WALL_SHARE = 0.3  # Share of wall pixels on a dense field.
+PLAYER_COLORS = ["Red", "Blue", "Green", "Purple", "Cyan", "Orange"]
+
+
+def create_simulation(players, dense, seed=0):
+    """
+    Creates a simulation with the given players placed on a sparse or dense field. Dense fields contain randomly
+    scattered walls without owner, sparse fields only the border.
+
+    :param players: list of Player instances.
+    :param dense: boolean
+    :param seed: int, seed of the simulation and of the scattered walls.
+    :return: Simulation instance with an initialised round and no items.
+    """
+    simulation = Simulation(HeadlessController(players=players, field_size=FIELD_SIZE, item_names=[]), seed=seed)
+    simulation.initialise_round()
+    if dense:
+        scattered = default_rng(seed).random((FIELD_SIZE, FIELD_SIZE)) < DENSE_WALL_SHARE
+        simulation.walls[scattered] = WALL
+        sync_halo(simulation.wall_grid)
+    return simulation
+
+
+def create_wall_field(dense, seed=0):
+    """
+    :param dense: boolean
+    :param seed: int
+    :return: 2-d numpy array of int8, halo grid of the walls of a sparse or dense field including the border.
+    """
+    grid = create_halo_grid(FIELD_SIZE, dtype=int8)
+    walls = get_field(grid)
+    if dense:
+        walls[default_rng(seed).random((FIELD_SIZE, FIELD_SIZE)) < DENSE_WALL_SHARE] = WALL
+    walls[[0, -1], :] = WALL
+    walls[:, [0, -1]] = WALL
+    sync_halo(grid)
+    return grid
+
+
+def benchmark_dot_trace(size, at_border):
+    simulation = create_simulation([], dense=False)
+    pos = (1, 1) if at_border else (FIELD_SIZE // 2, FIELD_SIZE // 2)
+    return lambda: simulation.compute_dot_trace(pos=pos, r=size)
+
+
+def benchmark_sweep_trace():
+    simulation = create_simulation([], dense=False)
+    return lambda: simulation.sweep_trace(pos=(400, 400), r=SIZE_NORMAL, dist=12, angle=37, sparse=SIZE_NORMAL // 2)
+
+
+def benchmark_tick(player_count, dense):
+    """
+    Measures a tick of the freshly initialised round. Every tick starts from the same state, so walls do not pile up
+    and crashed players do not stay dead across the measured calls.
+
+    :return: tuple (setup function restoring the state, tick function), see measure.
+    """
+    players = [Player(name="P{}".format(i + 1), color=color) for i, color in enumerate(PLAYER_COLORS[:player_count])]
+    simulation = create_simulation(players, dense=dense)
+    wall_grid = simulation.wall_grid.copy()
+    wall_owners = simulation.wall_owners.copy()
+    player_states = [deepcopy(vars(p)) for p in players]
+
+    def setup():
+        simulation.wall_grid[:, :] = wall_grid
+        simulation.wall_owners[:, :] = wall_owners
+        simulation.tick_count = simulation.gap_length  # The measured tick draws walls, see Simulation.draws_walls
+        for p, state in zip(players, player_states):
+            vars(p).update(deepcopy(state))
+
+    def tick():
+        simulation.tick_count += 1
+        simulation.move()
+        simulation.check_events()
+
+    return setup, tick
+
+
+def benchmark_bot(bot_class, dense):
+    bot = bot_class(name="Bot", color="Red", pos=(FIELD_SIZE // 2, FIELD_SIZE // 2), angle=30)
+    walls = create_wall_field(dense)
+
+    def decide():
+        bot.alive = True
+        bot.compute_move_command(walls=walls)
+
+    return decide
+
+
+def benchmark_target_functions(function):
+    rng = default_rng(0)
+    wall_points = [tuple(point) for point in rng.integers(0, 121, size=(500, 2)).tolist()]
+    return lambda: function(42.0, wall_points, (60, 60))
+
+
+def benchmark_target_function_argmin():
+    xs, ys = default_rng(0).integers(-60, 61, size=(2, 500))
+    return lambda: target_function_cont_argmin(*get_unit_vector_sums(xs, ys))
+
+
+def benchmark_replace_hex_color():
+    string = " ".join("{" + " ".join("#ff00ff" for _ in range(2 * SIZE_NORMAL + 1)) + "}"
+                      for _ in range(2 * SIZE_NORMAL + 1))
+    return lambda: replace_hex_color(string, "Red")
+
+
+def create_benchmarks():
+    """
+    Creates all benchmarks of the hot paths of the game. Setting up a benchmark is not measured.
+
+    :return: dict mapping benchmark names to functions without arguments performing one operation. Benchmarks
+    changing their own state map to a tuple (setup function, function) instead, see measure.
+    """
+    benchmarks = {}
+    for size in SIZES:
+        benchmarks["dot_trace/size={}".format(size)] = benchmark_dot_trace(size, at_border=False)
+        benchmarks["dot_trace_border/size={}".format(size)] = benchmark_dot_trace(size, at_border=True)
+    benchmarks["sweep_trace"] = benchmark_sweep_trace()
+    for dense in [False, True]:
+        for player_count in range(1, len(PLAYER_COLORS) + 1):
+            name = "tick/{}/players={}".format("dense" if dense else "sparse", player_count)
+            benchmarks[name] = benchmark_tick(player_count, dense)
+    for name, bot_class in [("cone", PlayerBotConeStrategy), ("contloss", PlayerBotContLossStrategy)]:
+        benchmarks["bot_{}/sparse".format(name)] = benchmark_bot(bot_class, dense=False)
+        benchmarks["bot_{}/dense".format(name)] = benchmark_bot(bot_class, dense=True)
+    for function in [target_function_cont, target_function_cont_d, target_function_cont_dd]:
+        benchmarks[function.__name__] = benchmark_target_functions(function)
+    benchmarks["target_function_cont_argmin"] = benchmark_target_function_argmin()
+    benchmarks["replace_hex_color"] = benchmark_replace_hex_color()
+    return benchmarks
+
+
+def measure(function, setup=None, min_time=0.1, repeat=5):
+    """
+    Measures the number of calls of function per second. The number of calls per run is increased until a run takes
+    at least min_time seconds. The fastest of repeat runs is taken to reduce the noise of other processes.
+
+    :param function: function without arguments.
+    :param setup: function without arguments or None. If given, it is called before every call of function and is not
+    measured.
+    :param min_time: float, minimum duration of a run in seconds.
+    :param repeat: int, number of runs.
+    :return: float, calls per second.
+    """
+    loops = 1
+    while True:
+        duration = time_loops(function, setup, loops)
+        if duration >= min_time:
+            break
+        loops *= 2 if duration <= 0 else max(2, min(10, int(min_time / duration) + 1))
+    best = duration
+    for _ in range(repeat - 1):
+        best = min(best, time_loops(function, setup, loops))
+    return loops / best
+
+
+def time_loops(function, setup, loops):
+    """
+    :param function: function without arguments.
+    :param setup: function without arguments or None, see measure.
+    :param loops: int, number of calls.
+    :return: float, duration of all calls of function in seconds.
+    """
+    if setup is None:
+        start = default_timer()
+        for _ in range(loops):
+            function()
+        return default_timer() - start
+    duration = 0.0
+    for _ in range(loops):
+        setup()
+        start = default_timer()
+        function()
+        duration += default_timer() - start
+    return duration
+
+
+def run_benchmarks(name_filter=None, min_time=0.1, repeat=5):
+    """
+    Runs all benchmarks whose name contains name_filter.
+
+    :param name_filter: string or None, if None, all benchmarks are run.
+    :param min_time: float, minimum duration of a run in seconds, see measure.
+    :param repeat: int, number of runs per benchmark, see measure.
+    :return: dict mapping benchmark names to their calls per second.
+    """
+    results = {}
+    for name, benchmark in create_benchmarks().items():
+        if name_filter is None or name_filter in name:
+            setup, function = benchmark if isinstance(benchmark, tuple) else (None, benchmark)
+            results[name] = measure(function, setup=setup, min_time=min_time, repeat=repeat)
+    return results
+
+
+def save_baseline(results, path):
+    """
+    Writes benchmark results as JSON baseline. Entries of an existing baseline at path that are not contained in
+    results are kept, so a subset of the benchmarks can be recorded again, see run_benchmarks.
+
+    :param results: dict as returned by run_benchmarks.
+    :param path: string
+    :return: None
+    """
+    if exists(path):
+        results = {**load_baseline(path), **results}
+    with open(path, "w") as file:
+        json.dump({"ops_per_second": results}, file, indent=2, sort_keys=True)
+
+
+def load_baseline(path):
+    """
+    :param path: string, path of a baseline written by save_baseline.
+    :return: dict mapping benchmark names to their calls per second.
+    """
+    with open(path) as file:
+        return json.load(file)["ops_per_second"]
+
+
+def find_regressions(results, baseline, tolerance=0.2):
+    """
+    :param results: dict as returned by run_benchmarks.
+    :param baseline: dict as returned by load_baseline.
+    :param tolerance: float, relative slow down that is still accepted.
+    :return: list of names of the benchmarks that are slower than their baseline by more than tolerance.
+    """
+    return [name for name, ops in results.items()
+            if name in baseline and ops < baseline[name] * (1 - tolerance)]
+
+
+def format_benchmark_report(results, baseline=None):
+    """
+    Formats benchmark results as human readable table, optionally compared to a baseline.
+
+    :param results: dict as returned by run_benchmarks.
+    :param baseline: dict as returned by load_baseline or None.
+    :return: string
+    """
+    lines = ["{:<32}{:>14}{:>14}{:>10}".format("Benchmark", "ops/s", "us/op", "change" if baseline else "")]
+    for name, ops in results.items():
+        change = ""
+        if baseline and name in baseline:
+            change = "{:+.1%}".format(ops / baseline[name] - 1)
+        lines.append("{:<32}{:>14.1f}{:>14.2f}{:>10}".format(name, ops, 1e6 / ops, change))
+    return "\n".join(lines)
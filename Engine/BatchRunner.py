@@ -0,0 +1,119 @@
+from timeit import default_timer
+
+from Engine.HeadlessControllerClass import HeadlessController
+from Engine.ReplayClass import ReplayRecorder
+from Engine.SimulationClass import Simulation
+from Engine.TickProfilerClass import TICK_PHASE
+from FieldObjects.PlayerClassBot import PlayerBotConeStrategy, PlayerBotContLossStrategy
+
+# Bot classes selectable by name.
+BOT_STRATEGIES = {"cone": PlayerBotConeStrategy,
+                  "contloss": PlayerBotContLossStrategy,
+                  }
+
+# Colors of the bots in order of creation, same as the default player colors in the options.
+BOT_COLORS = ["Red", "Blue", "Green", "Purple", "Cyan", "Orange"]
+
+
+def create_bots(strategy_names):
+    """
+    Creates one bot per given strategy name.
+
+    :param strategy_names: list of string, keys of BOT_STRATEGIES. At most len(BOT_COLORS) names.
+    :return: list of Player instances, named by their index and strategy, e.g. "Bot1 (cone)".
+    """
+    if len(strategy_names) > len(BOT_COLORS):
+        raise ValueError("At most {} bots are supported but got {}.".format(len(BOT_COLORS), len(strategy_names)))
+    bots = []
+    for i, name in enumerate(strategy_names):
+        if name not in BOT_STRATEGIES:
+            raise ValueError("Unknown bot strategy '" + name + "'. Use one of " + ", ".join(BOT_STRATEGIES) + ".")
+        bots.append(BOT_STRATEGIES[name](name="Bot{0} ({1})".format(i + 1, name), color=BOT_COLORS[i]))
+    return bots
+
+
+def run_round(simulation, max_ticks):
+    """
+    Plays one round of the given simulation as fast as possible: Every tick, all bots decide on their move-command
+    before the simulation advances. Nothing is rendered and there is no waiting in between ticks.
+
+    :param simulation: Simulation instance.
+    :param max_ticks: int, number of ticks after which the round is aborted and counted as draw.
+    :return: triple (winning Player instance or None in case of a draw, number of ticks played,
+                     dict mapping each player to the number of ticks it survived)
+    """
+    simulation.initialise_round()
+    players = simulation.controller.players
+    survival_ticks = {}
+    tick = 0
+    round_over = False
+    while not round_over and tick < max_ticks:
+        tick += 1
+        with simulation.profiler.measure(TICK_PHASE):
+            with simulation.profiler.measure("bots"):
+                simulation.notify_players()
+            round_over = simulation.tick()
+        for p in players:
+            if not p.alive and p not in survival_ticks:
+                survival_ticks[p] = tick
+    for p in players:
+        survival_ticks.setdefault(p, tick)
+    winner = simulation.award_winner() if round_over else None
+    return winner, tick, survival_ticks
+
+
+def simulate(strategy_names, rounds, item_names=None, max_ticks=5000, seed=None, profiler=None, record_directory=None):
+    """
+    Plays the given number of rounds between bots using the given strategies and collects their results.
+
+    :param strategy_names: list of string, keys of BOT_STRATEGIES, one bot is created per entry.
+    :param rounds: int, number of rounds to play.
+    :param item_names: list of string, class names of the items that may spawn. If None, all items may spawn.
+    :param max_ticks: int, number of ticks after which a round is aborted and counted as draw.
+    :param seed: Seed of the simulation's random number generator (default None).
+    :param profiler: TickProfiler instance measuring the phases of every tick. If None, nothing is measured.
+    :param record_directory: string, directory to write the replay of every round to, named by the round number.
+    If None, nothing is recorded.
+    :return: dict with keys
+        "wins": dict mapping each bot name to its number of won rounds,
+        "draws": int, number of rounds without winner,
+        "rounds": int, number of rounds played,
+        "ticks": int, number of ticks played in total,
+        "seconds": float, wall-clock time of the simulation.
+    """
+    bots = create_bots(strategy_names)
+    simulation = Simulation(HeadlessController(players=bots, max_rounds=rounds, item_names=item_names), seed=seed)
+    if profiler is not None:
+        simulation.profiler = profiler
+    recorder = ReplayRecorder(simulation) if record_directory is not None else None
+    results = {"wins": {p.name: 0 for p in bots}, "draws": 0, "rounds": rounds, "ticks": 0, "seconds": 0.0}
+    start = default_timer()
+    for i in range(rounds):
+        winner, ticks, _ = run_round(simulation, max_ticks)
+        if recorder is not None:
+            recorder.replay.save("{}/round_{:05d}.wrr".format(record_directory, i + 1))
+        results["ticks"] += ticks
+        if winner is None:
+            results["draws"] += 1
+        else:
+            results["wins"][winner.name] += 1
+    results["seconds"] = default_timer() - start
+    return results
+
+
+def format_report(results):
+    """
+    Formats the results of simulate as human readable table of win rates followed by the simulation speed.
+
+    :param results: dict as returned by simulate.
+    :return: string
+    """
+    rounds = max(results["rounds"], 1)
+    lines = ["{:<20}{:>8}{:>10}".format("Player", "Wins", "Win rate")]
+    for name, wins in sorted(results["wins"].items(), key=lambda item: item[1], reverse=True):
+        lines.append("{:<20}{:>8}{:>9.1%}".format(name, wins, wins / rounds))
+    lines.append("{:<20}{:>8}{:>9.1%}".format("Draws", results["draws"], results["draws"] / rounds))
+    lines.append("")
+    lines.append("{} rounds, {} ticks in {:.2f} s ({:.1f} ticks per second)".format(
+        results["rounds"], results["ticks"], results["seconds"], results["ticks"] / max(results["seconds"], 1e-9)))
+    return "\n".join(lines)
@@ -0,0 +1,146 @@
+from threading import Thread, Condition
+from timeit import default_timer
+
+from FieldObjects.PlayerClass import Player
+
+
+def is_bot(p):
+    """
+    :param p: Player instance.
+    :return: boolean, True if p computes its own move-commands, i.e. overrides Player.decide_move_command.
+    """
+    return type(p).decide_move_command is not Player.decide_move_command
+
+
+class BotWorkerPool:
+    """
+    Computes the move-commands of bots within long-lived worker threads, one per bot.
+
+    Every bot owns a mailbox holding at most one request, consisting of a tick number and a snapshot of the walls and
+    of the bot's position and facing angle. Posting a new request replaces a request that was not picked up yet, such
+    that a slow bot always works on the most recent field instead of catching up on stale ticks.
+
+    Workers never change the move-command of their bot. They store the computed move-command as result of the tick
+    of the request, and the thread performing the ticks applies the results by collect before the next tick. Bots
+    missing the deadline keep their previous move-command, their late results are discarded.
+    """
+
+    def __init__(self):
+        self.condition = Condition()  # guards all attributes below and wakes up workers and collectors
+        self.running = False
+        self.mailboxes = {}  # Dict of tuple: (tick, walls snapshot, pos, angle) or None, keyed by bot
+        self.results = {}  # Dict of tuple: (tick, move-command) of the latest computed request or None, keyed by bot
+        self.workers = []
+
+        # Statistics
+        self.dropped = 0  # number of requests replaced before a worker picked them up
+        self.missed = 0  # number of collected results that were not ready at the deadline
+
+    def start(self, players):
+        """
+        Starts one worker thread for every bot among the given players. Workers of a previous start are stopped.
+
+        :param players: list of Player instances, human players are ignored.
+        :return: None
+        """
+        self.stop()
+        bots = [p for p in players if is_bot(p)]
+        with self.condition:
+            self.running = True
+            self.mailboxes = {p: None for p in bots}
+            self.results = {p: None for p in bots}
+        self.workers = [Thread(group=None,
+                               target=self.work,
+                               args=(p,),
+                               name=p.color + "_bot_worker",
+                               daemon=True
+                               ) for p in bots]
+        for worker in self.workers:
+            worker.start()
+
+    def stop(self):
+        """
+        Stops all worker threads after they finished their current computation. Pending requests are discarded.
+
+        :return: None
+        """
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        for worker in self.workers:
+            worker.join()
+        self.workers = []
+
+    def request(self, tick, walls):
+        """
+        Posts a request for a new move-command to the mailbox of every living bot. All bots share one snapshot of the
+        walls, so the simulation may continue to change the walls while the bots are computing.
+
+        :param tick: int, tick the request belongs to.
+        :param walls: 2-d numpy array of int8, current halo grid of the walls of the simulation.
+        :return: None
+        """
+        if not self.mailboxes:
+            return
+        snapshot = walls.copy()
+        with self.condition:
+            for p in self.mailboxes:
+                if not p.alive:
+                    continue
+                if self.mailboxes[p] is not None:
+                    self.dropped += 1
+                self.mailboxes[p] = (tick, snapshot, p.pos, p.angle)
+            self.condition.notify_all()
+
+    def collect(self, tick, timeout):
+        """
+        Waits until every living bot computed its move-command for the given tick or the timeout expired and applies
+        the move-commands computed for that tick. Needs to be called by the thread performing the ticks.
+
+        :param tick: int, tick of the request to wait for.
+        :param timeout: float, maximum waiting time in seconds.
+        :return: list of Player instances, bots that did not finish in time.
+        """
+        deadline = default_timer() + timeout
+        with self.condition:
+            while True:
+                pending = [p for p in self.mailboxes if p.alive and not self.is_done(p, tick)]
+                remaining = deadline - default_timer()
+                if not pending or remaining <= 0:
+                    break
+                self.condition.wait(remaining)
+            self.missed += len(pending)
+            results = self.results
+            self.results = {p: None for p in self.mailboxes}  # Results arriving from now on are too late
+        for p, result in results.items():
+            if p.alive and result is not None and result[0] == tick:
+                p.move_command = result[1]
+        return pending
+
+    def is_done(self, p, tick):
+        """
+        :param p: Player instance, bot of this pool.
+        :param tick: int
+        :return: boolean, True if the result of bot p for the given tick is available.
+        """
+        return self.results[p] is not None and self.results[p][0] == tick
+
+    def work(self, p):
+        """
+        Worker loop of bot p: Takes the latest request out of its mailbox and computes the move-command.
+
+        :param p: Player instance.
+        :return: None
+        """
+        while True:
+            with self.condition:
+                while self.running and self.mailboxes[p] is None:
+                    self.condition.wait()
+                if not self.running:
+                    return
+                tick, walls, pos, angle = self.mailboxes[p]
+                self.mailboxes[p] = None
+            move_command = p.decide_move_command(walls=walls, pos=pos, angle=angle)
+            with self.condition:
+                self.results[p] = (tick, move_command)
+                self.condition.notify_all()
@@ -0,0 +1,22 @@
+from Utils.Const import ALL_ITEMS
+
+
+class HeadlessController:
+    """
+    Provides the game settings of a Simulation when there is no GUI, e.g. for simulating rounds between bots.
+    """
+
+    def __init__(self, players, field_size=860, max_rounds=5, item_names=None):
+        """
+        Initialises all settings a Simulation and its items read from their controller.
+
+        :param players: list of Player instances taking part in the game.
+        :param field_size: int, side length of the squared game field in pixels (default 860 as in the GUI).
+        :param max_rounds: int, number of round wins needed to win the game.
+        :param item_names: list of string, class names of the items that may spawn. If None, all items may spawn.
+        """
+        self.players = players
+        self.field_size = field_size
+        self.max_rounds = max_rounds
+        self.all_items = list(ALL_ITEMS)
+        self.item_names = list(self.all_items) if item_names is None else list(item_names)
@@ -0,0 +1,86 @@
+from numpy import zeros
+
+from Utils.Const import *
+
+
+class ItemEntry:
+    """
+    An item lying on the game field together with its round specific id and its axis aligned bounding box.
+    """
+
+    __slots__ = ("item_id", "item", "pos", "x0", "y0", "x1", "y1")
+
+    def __init__(self, item_id, item, pos, size=ITEMSIZE):
+        """
+        :param item_id: int, round specific id of the item.
+        :param item: Item instance.
+        :param pos: tuple of size 2 of int, top-left pixel of the item.
+        :param size: int, side length of the item in pixels.
+        """
+        self.item_id = item_id
+        self.item = item
+        self.pos = pos
+        self.x0, self.y0 = int(pos[0]), int(pos[1])
+        self.x1, self.y1 = self.x0 + size, self.y0 + size  # exclusive
+
+
+class ItemIndex:
+    """
+    Spatial index of the items lying on the game field.
+
+    Since there are only a handful of items on the field at once, the index is a list of bounding boxes kept in a dict
+    keyed by item id. Ids are increasing within a round, so the insertion order of the dict is the order of age and the
+    oldest item is always the first entry. Inserting, removing and finding the oldest item take constant time.
+    """
+
+    def __init__(self):
+        self.entries = {}  # Dict of ItemEntry keyed by item id, oldest first
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, item_id):
+        return item_id in self.entries
+
+    def insert(self, item_id, item, pos):
+        """
+        :param item_id: int, round specific id of the item. Needs to be greater than all ids in the index.
+        :param item: Item instance.
+        :param pos: tuple of size 2 of int, top-left pixel of the item.
+        :return: None
+        """
+        self.entries[item_id] = ItemEntry(item_id, item, pos)
+
+    def remove(self, item_id):
+        """
+        :param item_id: int, id of an item in the index.
+        :return: ItemEntry instance of the removed item.
+        """
+        return self.entries.pop(item_id)
+
+    def get_oldest_id(self):
+        """
+        :return: int, id of the item that was inserted first among all items in the index.
+        """
+        return next(iter(self.entries))
+
+    def clear(self):
+        """
+        Removes all items.
+
+        :return: None
+        """
+        self.entries.clear()
+
+    def query(self, xs, ys):
+        """
+        Looks up the item covering every given pixel. Where items overlap, the younger item covers the older one.
+
+        :param xs: 1-d numpy array of int, x-coordinates of the pixels.
+        :param ys: 1-d numpy array of int, y-coordinates of the pixels.
+        :return: 1-d numpy array of int, id of the item covering each pixel or 0 if there is none.
+        """
+        item_ids = zeros(len(xs), dtype=int)
+        for e in self.entries.values():
+            item_ids[(xs >= e.x0) & (xs < e.x1) & (ys >= e.y0) & (ys < e.y1)] = e.item_id
+        return item_ids
@@ -0,0 +1,77 @@
+from heapq import heappush, heappop
+
+
+class ItemScheduler:
+    """
+    Keeps track of the active items and deactivates them when they expire.
+
+    Active items are stored in a min-heap keyed by their expiration tick, so every tick only the expiring items are
+    touched. Items expiring in the same tick are deactivated in the order they were activated.
+
+    Additionally, the number of active items is counted per item class and per pair of player and item class. Items
+    whose effects do not stack ask these counters during deactivation whether a younger instance is still running.
+    An item is counted until its deactivate method returned.
+    """
+
+    def __init__(self):
+        self.heap = []  # Heap of tuple (expiration tick, activation number, item instance)
+        self.activations = 0  # Number of scheduled items, breaks ties between items expiring in the same tick
+        self.counts = {}  # Dict of int: number of active items, keyed by item class or tuple (player, item class)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def schedule(self, item, end):
+        """
+        Adds an activated item.
+
+        :param item: Item instance whose activate method was or is about to be called.
+        :param end: int, tick at which the item expires.
+        :return: None
+        """
+        heappush(self.heap, (end, self.activations, item))
+        self.activations += 1
+        for key in (type(item), (item.player, type(item))):
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def count(self, item_class, player=None):
+        """
+        :param item_class: class of the items to count.
+        :param player: Player instance or None. If given, only items collected by this player are counted.
+        :return: int, number of active items of the given class, including items being deactivated right now.
+        """
+        return self.counts.get(item_class if player is None else (player, item_class), 0)
+
+    def expire(self, tick):
+        """
+        Deactivates all items expiring at or before the given tick.
+
+        :param tick: int, current tick.
+        :return: None
+        """
+        while self.heap and self.heap[0][0] <= tick:
+            _, _, item = heappop(self.heap)
+            self.deactivate(item)
+
+    def clear(self):
+        """
+        Deactivates all active items in the order they were activated.
+
+        :return: None
+        """
+        entries = sorted(self.heap, key=lambda entry: entry[1])
+        self.heap = []
+        for _, _, item in entries:
+            self.deactivate(item)
+        self.counts = {}
+
+    def deactivate(self, item):
+        """
+        Deactivates an item that was removed from the heap and stops counting it afterwards.
+
+        :param item: Item instance.
+        :return: None
+        """
+        item.deactivate()
+        for key in (type(item), (item.player, type(item))):
+            self.counts[key] -= 1
@@ -0,0 +1,224 @@
+import json
+from struct import pack, unpack_from
+
+from numpy import frombuffer, int8
+
+from Engine.HeadlessControllerClass import HeadlessController
+from Engine.SimulationClass import Simulation
+from Engine.SimulationObserver import SimulationObserver
+from FieldObjects.PlayerClass import Player
+
+REPLAY_MAGIC = b"WRRP"  # First bytes of every replay file
+REPLAY_VERSION = 1
+# Attributes of the Simulation stored in every replay since they influence the course of a round.
+REPLAY_SETTINGS = ["practice_game", "gap_rate", "gap_length", "item_max_count", "item_drop_chance"]
+
+
+class Replay:
+    """
+    Record of a single round containing everything needed to reproduce it exactly: The seed of the round, the tick the
+    round started at, the game settings and the move-command of every player in every tick.
+
+    The binary format consists of REPLAY_MAGIC, the version as one byte, the length of the header as four bytes, the
+    header as JSON and finally one signed byte per player and tick holding the move-commands.
+    """
+
+    def __init__(self, seed, start_tick, field_size, item_names, players, settings=None, commands=b""):
+        """
+        :param seed: int, seed of the round as passed to Simulation.initialise_round.
+        :param start_tick: int, tick count of the simulation when the round was initialised.
+        :param field_size: int, size of the game field.
+        :param item_names: list of string, class names of the items that may spawn.
+        :param players: list of tuple (name, color) of every player in the order of the controller.
+        :param settings: dict, values of the simulation attributes listed in REPLAY_SETTINGS.
+        :param commands: bytes, move-commands of all players tick by tick.
+        """
+        self.seed = seed
+        self.start_tick = start_tick
+        self.field_size = field_size
+        self.item_names = list(item_names)
+        self.players = [tuple(p) for p in players]
+        self.settings = dict(settings or {})
+        self.commands = bytearray(commands)
+
+    @property
+    def ticks(self):
+        """
+        :return: int, number of recorded ticks.
+        """
+        return len(self.commands) // len(self.players)
+
+    def append_commands(self, commands):
+        """
+        :param commands: list of int, move-command of every player in the current tick.
+        :return: None
+        """
+        self.commands.extend(command % 256 for command in commands)
+
+    def get_commands(self, tick_index):
+        """
+        :param tick_index: int, index of the tick counted from the start of the round, starting at 0.
+        :return: list of int, move-command of every player in that tick.
+        """
+        n = len(self.players)
+        return frombuffer(self.commands, dtype=int8, count=n, offset=tick_index * n).tolist()
+
+    def to_bytes(self):
+        """
+        :return: bytes, binary representation of this replay.
+        """
+        header = json.dumps({"seed": self.seed,
+                             "start_tick": self.start_tick,
+                             "field_size": self.field_size,
+                             "item_names": self.item_names,
+                             "players": self.players,
+                             "settings": self.settings,
+                             }).encode()
+        return REPLAY_MAGIC + pack("<BI", REPLAY_VERSION, len(header)) + header + bytes(self.commands)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        :param data: bytes, binary representation as created by to_bytes.
+        :return: Replay instance.
+        """
+        if data[:len(REPLAY_MAGIC)] != REPLAY_MAGIC:
+            raise ValueError("The given data is no wall run replay.")
+        version, header_length = unpack_from("<BI", data, len(REPLAY_MAGIC))
+        if version != REPLAY_VERSION:
+            raise ValueError("Unsupported replay version {} (expected {}).".format(version, REPLAY_VERSION))
+        start = len(REPLAY_MAGIC) + 5
+        header = json.loads(data[start:start + header_length].decode())
+        return cls(commands=data[start + header_length:], **header)
+
+    def save(self, path):
+        """
+        Writes this replay to a file.
+
+        :param path: string
+        :return: None
+        """
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads a replay from a file.
+
+        :param path: string
+        :return: Replay instance.
+        """
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+class ReplayRecorder(SimulationObserver):
+    """
+    Records every round of the simulation it subscribes to. The replay of the current or latest round is available as
+    attribute replay.
+
+    The move-commands are recorded when a tick starts. They are only changed in between ticks and by the thread
+    performing the ticks: Key events are dispatched before the recorder is notified and bot results are applied by
+    Engine.BotWorkerPoolClass.BotWorkerPool.collect before the tick. The recorded commands are therefore exactly the
+    commands the tick moves the players by.
+    """
+
+    def __init__(self, simulation):
+        """
+        :param simulation: Simulation instance to record. The recorder subscribes itself.
+        """
+        self.simulation = simulation
+        self.replay = None  # Replay of the current or latest round, created when a round is initialised
+        self.simulation.subscribe(self)
+
+    def on_round_initialised(self):
+        controller = self.simulation.controller
+        self.replay = Replay(seed=self.simulation.round_seed,
+                             start_tick=self.simulation.tick_count,
+                             field_size=controller.field_size,
+                             item_names=controller.item_names,
+                             players=[(p.name, p.color) for p in controller.players],
+                             settings={name: getattr(self.simulation, name) for name in REPLAY_SETTINGS},
+                             )
+
+    def on_tick_started(self):
+        self.replay.append_commands([p.move_command for p in self.simulation.controller.players])
+
+
+class ReplayPlayer(SimulationObserver):
+    """
+    Steers the players of a simulation by the move-commands of a replay. The simulation needs to be prepared by
+    prepare_round before the first tick. Once all recorded ticks are played, the players' commands are not changed
+    anymore.
+    """
+
+    def __init__(self, replay):
+        """
+        :param replay: Replay instance to play.
+        """
+        self.replay = replay
+        self.simulation = None  # defined in call of self.prepare_round
+        self.tick_index = 0  # index of the next tick to play
+
+    @property
+    def finished(self):
+        """
+        :return: boolean, True if all recorded ticks were played.
+        """
+        return self.tick_index >= self.replay.ticks
+
+    def prepare_round(self, simulation):
+        """
+        Initialises a round of the given simulation exactly as the recorded round was initialised.
+
+        :param simulation: Simulation instance with the same players and field size as the replay.
+        :return: None
+        """
+        if simulation.controller.field_size != self.replay.field_size:
+            raise ValueError("The replay was recorded on a field of size {} but the field has size {}.".format(
+                self.replay.field_size, simulation.controller.field_size))
+        if len(simulation.controller.players) != len(self.replay.players):
+            raise ValueError("The replay was recorded with {} players but there are {}.".format(
+                len(self.replay.players), len(simulation.controller.players)))
+        self.simulation = simulation
+        self.tick_index = 0
+        simulation.controller.item_names = list(self.replay.item_names)
+        for name, value in self.replay.settings.items():
+            setattr(simulation, name, value)
+        simulation.tick_count = self.replay.start_tick
+        simulation.initialise_round(seed=self.replay.seed)
+
+    def on_tick_started(self):
+        if self.finished:
+            return
+        for p, command in zip(self.simulation.controller.players, self.replay.get_commands(self.tick_index)):
+            p.move_command = command
+        self.tick_index += 1
+
+
+def create_players(replay):
+    """
+    :param replay: Replay instance.
+    :return: list of Player instances named and colored like the recorded players. They have no own strategy.
+    """
+    return [Player(name=name, color=color) for name, color in replay.players]
+
+
+def play_replay(replay):
+    """
+    Plays a replay headless in fast-forward.
+
+    :param replay: Replay instance.
+    :return: tuple (Simulation instance after the last tick, bool True if the round ended)
+    """
+    controller = HeadlessController(players=create_players(replay), field_size=replay.field_size,
+                                    item_names=replay.item_names)
+    simulation = Simulation(controller)
+    replay_player = ReplayPlayer(replay)
+    simulation.subscribe(replay_player)
+    replay_player.prepare_round(simulation)
+    while not replay_player.finished:
+        if simulation.tick():
+            return simulation, True
+    return simulation, False
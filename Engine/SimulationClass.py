@@ -0,0 +1,634 @@
+from math import isqrt
+
+from numpy import zeros, int8, uint8, bincount, array, arange, concatenate, repeat, isin, nonzero, unique
+from numpy.random import default_rng
+
+from Engine.ItemIndexClass import ItemIndex
+from Engine.ItemSchedulerClass import ItemScheduler
+from Engine.TickProfilerClass import TickProfiler
+from FieldObjects.Items.ItemRegistry import get_item_class, register_items
+from Utils.Const import *
+from Utils.DirectionTable import get_step
+from Utils.HaloGrid import create_halo_grid, get_field, sync_halo, sync_halo_pixels
+from Utils.HelperFunctions import get_swept_offsets
+from Utils.SpriteCache import get_dot_offset_arrays
+
+
+class Simulation:
+    """
+    Contains the game logic of a game of wall run without any user interface. This includes the walls, items and
+    players as well as moving the players, checking for collisions and deciding rounds.
+
+    The game field is represented by a 2-dimensional numpy array storing the locations of walls. The wall grid is
+    accompanied by an owner grid of the same shape storing the owner id of the player that drew the respective wall
+    pixel. Entry [x, y] of each array corresponds to the pixel (x, y) on the game field, x describing the horizontal
+    location and y the vertical location starting in the top left corner. Items lying on the field are kept in a small
+    spatial index, see Engine.ItemIndexClass.
+
+    The wall grid is a view into a halo grid, which pads the field by copies of its opposite edges, see Utils.HaloGrid.
+    Bots scan windows around their position as plain slices of the halo grid, even when the window wraps around the
+    field borders. Every change of the walls is therefore followed by a sync of the halo.
+
+    User interfaces like the GameScreen subscribe to a simulation as SimulationObserver and get notified about every
+    change that needs to be displayed.
+    """
+
+    def __init__(self, controller, seed=None):
+        """
+        Creates a new simulation.
+
+        :param controller: Object providing the game settings players, field_size, max_rounds, item_names and
+        all_items, e.g. the GUI or a HeadlessController.
+        :param seed: Seed of the random number generator as accepted by numpy.random.default_rng (default None).
+        """
+        self.controller = controller
+
+        # reset player scores
+        for p in self.controller.players:
+            p.wins = 0
+
+        # -- ATTRIBUTES
+        self.current_round = 0
+        self.max_wins = self.controller.max_rounds
+        self.wall_grid = create_halo_grid(self.controller.field_size, dtype=int8)  # Walls padded by a halo
+        self.walls = get_field(self.wall_grid)  # WALL or NO_WALL, view of the field within self.wall_grid
+        self.wall_owners = zeros((self.controller.field_size, self.controller.field_size), dtype=uint8)  # Owner ids
+        self.gap_rate = 100  # Higher means fewer gaps
+        self.gap_length = 4
+
+        self.tick_count = 0
+
+        self.practice_game = False  # If True, every round ends in field draw.
+
+        # -- Item related
+        self.item_max_count = 6  # Total number of items that is allowed to exist on the field.
+        self.item_index = ItemIndex()  # Items lying on the field and their locations
+        self.item_id = 1  # Key of the next item in item_index. Rolling int per round starting at 1.
+        self.items_active = ItemScheduler()  # Currently active items, deactivated when they expire
+        self.item_drop_chance = 0.005  # Chance to spawn an item per tick.
+        register_items(self.controller.all_items)  # Spawning an item is a lookup from now on
+
+        # -- Other
+        self.rng = default_rng(seed)  # RNG object, reseeded at the start of every round
+        self.round_seed = None  # Seed of the current round, see initialise_round
+        self.observers = []  # SimulationObserver instances, see self.subscribe
+        self.profiler = TickProfiler(enabled=False)  # Measures the phases of every tick once enabled
+
+        self.toggle_border(on=True)
+
+    def subscribe(self, observer):
+        """
+        Registers the given observer to be notified about every change of the simulation.
+
+        :param observer: SimulationObserver instance.
+        :return: None
+        """
+        self.observers.append(observer)
+
+    def unsubscribe(self, observer):
+        """
+        Removes the given observer from the notified observers.
+
+        :param observer: SimulationObserver instance.
+        :return: None
+        """
+        self.observers.remove(observer)
+
+    # ########################################
+    # Round related functions
+    # ########################################
+
+    def initialise_round(self, seed=None):
+        """
+        Prepares a new round: Clears all items and walls and places all players at random positions.
+
+        The random number generator is reseeded with the seed of the round, so a round is fully determined by its seed,
+        the tick count it starts at and the move-commands of the players, see Engine.ReplayClass.
+
+        :param seed: int, seed of the round. If None, it is drawn from the current random number generator.
+        :return: None
+        """
+        if seed is None:
+            seed = int(self.rng.integers(2 ** 63))
+        self.round_seed = seed
+        self.rng = default_rng(seed)
+        self.current_round += 1
+        # Clear items
+        self.reset_all_items()
+        # Clear walls including the halo
+        self.wall_grid[:, :] = NO_WALL
+        self.wall_owners[:, :] = OWNER_NONE
+        for o in self.observers:
+            o.on_round_initialised()
+        self.toggle_border(on=True)
+        # Placing players
+        for p in self.controller.players:
+            self.place_player(p)
+
+    def tick(self):
+        """
+        Performs every job that has to be done once per tick: Moving all players, checking events and checking whether
+        the round has ended.
+
+        :return: bool, True if the round is over, False otherwise.
+        """
+        self.tick_count += 1
+        for o in self.observers:
+            o.on_tick_started()
+        with self.profiler.measure("move"):
+            old_dot_traces = self.move()
+        with self.profiler.measure("update_visuals"):
+            for o in self.observers:
+                o.on_players_moved(old_dot_traces)
+        with self.profiler.measure("check_events"):
+            self.check_events()
+        return self.check_round_end()
+
+    # ########################################
+    # Player related functions
+    # ########################################
+
+    def notify_players(self):
+        """
+        Calls the compute_move_command method of every living player within the calling thread. Human players ignore
+        this while bots adjust their current move-command to the current walls.
+
+        :return: None
+        """
+        for p in self.controller.players:
+            if p.alive:
+                p.compute_move_command(walls=self.wall_grid)
+
+    def place_player(self, p, pos=None, angle=None):
+        """
+        This function places player p on the game field at position pos.
+        In fact this function updates the coordinates of the player-object to pos
+        and additionally adds field tail-wall to the class-attribute walls.
+        It also resets all player attributes to its defaults.
+
+        :param p: Player Object to be placed.
+        :param pos: Position to place the player as tuple of size 2 of int.
+        If None, each coordinate is randomly chosen from [tol, field_size - tol],
+        where tol is 10% of the field size.
+        :param angle: angle the player faces, default None (which is random angle).
+        :return: None
+        """
+        # set move command of each player to STRAIGHT and make alive
+        p.move_command = DIR_STRAIGHT
+        p.speed = SPEED_NORMAL
+        p.turn_rate = RATE_NORMAL
+        p.size = SIZE_NORMAL
+        p.key_is_held_down = False
+
+        p.alive = True
+        p.owner_id = self.controller.players.index(p) + 1
+        # Set facing angle.
+        if angle is None:
+            p.angle = self.rng.integers(0, 360)
+        else:
+            p.angle = angle
+
+        # Set position
+        if pos is None:
+            tol = int(self.controller.field_size * 0.1)
+            p.pos = (self.rng.integers(tol, self.controller.field_size - tol, endpoint=True),
+                     self.rng.integers(tol, self.controller.field_size - tol, endpoint=True)
+                     )
+        else:
+            p.pos = pos
+
+        p.dot_trace = self.compute_dot_trace(pos=p.pos, r=p.size)
+        # get wall trace
+        tail_len = 12
+        xs, ys = self.sweep_trace(pos=p.pos, r=p.size, dist=tail_len, angle=(p.angle + 180) % 360,
+                                  sparse=max(1, int(p.size / 2)))
+        # update walls
+        n = self.controller.field_size
+        outside_dot = isin(xs * n + ys, p.dot_trace[0] * n + p.dot_trace[1], invert=True)  # prevent crash with own tail
+        tail_trace = (xs[outside_dot], ys[outside_dot])
+        self.walls[tail_trace] = WALL
+        self.wall_owners[tail_trace] = p.owner_id
+        sync_halo_pixels(self.wall_grid, *tail_trace)
+        for o in self.observers:
+            o.on_player_placed(p, tail_trace)
+
+    # ########################################
+    # Item related functions
+    # ########################################
+
+    def remove_item(self, item_id):
+        """
+        Removes an item from the field by its round specific id, both visually and effectively.
+
+        :param item_id: int, id of the item to remove. Needs to be present in self.item_index.
+        :return: tuple (removed item instance, pos)
+        """
+        entry = self.item_index.remove(item_id)
+        for o in self.observers:
+            o.on_item_removed(item_id)
+        return entry.item, entry.pos
+
+    def create_item_by_name(self, name):
+        """
+        Creates field random item instance among all registered items and returns it.
+
+        :param name: string, name of the item-class
+        :return: Item instance of given class name.
+        """
+        return get_item_class(name)(self.controller, self)
+
+    def place_item(self, name, pos):
+        """
+        Places the item identified by name on the game field at pos.
+
+        :param name: String, Class name of the item to place.
+        :param pos: Tuple of size 2 of int, position on the game field to place the item.
+        :return: None
+        """
+        # -- Create and store item
+        item_to_place = self.create_item_by_name(name)
+        # -- Place item on the field
+        self.item_index.insert(self.item_id, item_to_place, pos)
+        for o in self.observers:
+            o.on_item_placed(self.item_id, item_to_place, pos)
+        # -- Increase item item_id
+        self.item_id = self.item_id + 1
+
+    # ########################################
+    # Movement and functional functions
+    # ########################################
+
+    def compute_dot_trace(self, pos, r):
+        """
+        Computes the pixels of a dot of size r around pos by translating the cached offsets of the dot. Only dots
+        crossing the game field border are wrapped around it.
+
+        :param pos: tuple of size 2 of int, center of the dot.
+        :param r: int, size of the dot.
+        :return: tuple of size 2 of 1-d numpy arrays of int, dot trace as pair of index arrays (xs, ys).
+        """
+        X, Y = pos
+        n = self.controller.field_size
+        offsets_x, offsets_y = get_dot_offset_arrays(r)
+        extent = isqrt(r)  # Offsets satisfy i ** 2 + j ** 2 <= r
+        if extent <= X < n - extent and extent <= Y < n - extent:
+            return X + offsets_x, Y + offsets_y
+        return (X + offsets_x) % n, (Y + offsets_y) % n
+
+    def get_target_pixel(self, pos, dist, angle):
+        """
+        Computes the pixel that is reached after going from pos in direction of angle for field distance of dist.
+
+        :param pos: starting position, tuple of size 2 of int
+        :param dist: walking distance, int
+        :param angle: int in [0, 359), directional angle: 0 is facing east, 90 is facing south etc.
+        :return: tuple of size 2 of int.
+        """
+        x, y = pos
+        step_x, step_y = get_step(dist, angle)
+        return (x + step_x) % self.controller.field_size, (y + step_y) % self.controller.field_size
+
+    def sweep_trace(self, pos, r, dist, angle, sparse=1):
+        """
+        Computes all pixels covered by a dot of size r moving from pos in direction of angle for a distance of dist,
+        see Utils.HelperFunctions.get_swept_offsets. The trace wraps around the field borders.
+
+        :param pos: tuple of size 2 of int, starting position of the dot.
+        :param r: int, size of the dot.
+        :param dist: int, distance to go.
+        :param angle: int, facing angle.
+        :param sparse: int > 0, level of denseness between dots, lower is denser. Default 1.
+        :return: tuple of size 2 of 1-d numpy arrays of int (xs, ys), every covered pixel once.
+        """
+        n = self.controller.field_size
+        X, Y = pos
+        offsets_x, offsets_y = get_swept_offsets(*get_dot_offset_arrays(r), dist=dist, angle=angle, sparse=sparse)
+        pixels = unique(((X + offsets_x) % n) * n + (Y + offsets_y) % n)
+        return pixels // n, pixels % n
+
+    def toggle_border(self, on=True):
+        """
+        Toggles surrounding walls in numpy array on and off and notifies all observers.
+
+        :param on: boolean, If True, walls are turned on. Off otherwise.
+        :return: None
+        """
+        value = WALL if on else NO_WALL
+        self.walls[0, :] = value
+        self.walls[-1, :] = value
+        self.walls[:, 0] = value
+        self.walls[:, -1] = value
+        # Border pixels never belong to a player
+        self.wall_owners[0, :] = OWNER_NONE
+        self.wall_owners[-1, :] = OWNER_NONE
+        self.wall_owners[:, 0] = OWNER_NONE
+        self.wall_owners[:, -1] = OWNER_NONE
+        sync_halo(self.wall_grid)
+        for o in self.observers:
+            o.on_border_toggled(on)
+
+    def move(self):
+        """
+        This function moves every player by one step according to their current position, speed, angle and
+        move command. It also updates the walls with the way traces and returns the old dot-traces of all moved players.
+
+        :return: dict of tuple of size 2 of 1-d numpy arrays of int, dot-trace of the previous position keyed by player.
+        """
+        old_dot_traces = {}
+        wall_traces = []  # Old dot-traces that become walls this tick
+        for p in self.controller.players:
+            if not p.alive:
+                continue
+            if p.move_command == DIR_LEFT:
+                p.angle = (p.angle - p.turn_rate) % 360
+            elif p.move_command == DIR_RIGHT:
+                p.angle = (p.angle + p.turn_rate) % 360
+            # ## Reset turn rate for 90 degree players
+            if p.turn_rate == RATE_RIGHT_ANGLE:
+                p.move_command = DIR_STRAIGHT
+            # ## compute new position
+            p.pos = self.get_target_pixel(pos=p.pos, dist=p.speed, angle=p.angle)
+            # ## update new dot trace
+            p.update_tolerance_heads()  # store current (old) dot-trace for tolerance computation
+            old_dot_trace = p.dot_trace
+            old_dot_traces[p] = old_dot_trace
+            p.dot_trace = self.compute_dot_trace(pos=p.pos, r=p.size)
+            p.compute_collision_head()  # compute the current collision head
+            # ## collect walls
+            if self.draws_walls(p):
+                wall_traces.append((old_dot_trace, p.owner_id))
+        # ## update walls
+        self.stamp_walls(wall_traces)
+        return old_dot_traces
+
+    def draws_walls(self, p):
+        """
+        Decides whether player p leaves a wall behind in the current tick. This is not the case for flying players and
+        during gaps.
+
+        :param p: Player instance.
+        :return: bool
+        """
+        return self.tick_count % self.gap_rate > self.gap_length and not p.flying
+
+    def place_block(self, x, y, size):
+        """
+        Places a squared block of walls on the field that does not belong to any player.
+
+        :param x: int, x-coordinate of the top left pixel.
+        :param y: int, y-coordinate of the top left pixel.
+        :param size: int, side length of the block in pixels.
+        :return: None
+        """
+        self.walls[x:x + size, y:y + size] = WALL
+        self.wall_owners[x:x + size, y:y + size] = OWNER_NONE
+        sync_halo(self.wall_grid)
+        for o in self.observers:
+            o.on_block_placed((x, y, x + size, y + size))
+
+    def stamp_walls(self, traces):
+        """
+        Writes the given traces into the wall grid and the wall owner grid using one fancy-indexing operation.
+
+        :param traces: list of tuple (dot-trace as pair of index arrays (xs, ys), owner id of the trace)
+        :return: None
+        """
+        if not traces:
+            return
+        xs = concatenate([trace[0] for trace, _ in traces])
+        ys = concatenate([trace[1] for trace, _ in traces])
+        self.walls[xs, ys] = WALL
+        self.wall_owners[xs, ys] = repeat([owner_id for _, owner_id in traces], [len(t[0]) for t, _ in traces])
+        sync_halo_pixels(self.wall_grid, xs, ys)
+
+    def detect_collisions(self, players):
+        """
+        Checks the collision heads of all given players against the wall grid and the item index at once.
+        Wall pixels contained in a player's tolerance heads do not count for that player and flying players do not
+        collide with walls at all.
+
+        :param players: list of Player objects with computed collision heads.
+        :return: tuple (bool array, True for each player hitting a wall;
+                        int array, id of the first item within each players collision head or 0 if there is none)
+        """
+        k = len(players)
+        n = self.controller.field_size
+        if k == 0:
+            return zeros(0, dtype=bool), zeros(0, dtype=int)
+        # Linear pixel indices of all collision heads labeled by the index of the respective player
+        labels = repeat(arange(k), [len(p.collision_head[0]) for p in players])
+        head_xs = concatenate([p.collision_head[0] for p in players])
+        head_ys = concatenate([p.collision_head[1] for p in players])
+        heads = head_xs * n + head_ys
+        # Walls
+        hits = self.walls[head_xs, head_ys] == WALL
+        hits &= ~array([p.flying for p in players])[labels]
+        tolerance = [i * n * n + xs * n + ys for i, p in enumerate(players) for xs, ys in p.tolerance_heads]
+        if tolerance:
+            # Subtract the tolerance heads by comparing (player, pixel) keys.
+            hits &= isin(labels * n * n + heads, concatenate(tolerance), invert=True)
+        crashed = bincount(labels[hits], minlength=k) > 0
+        # Items
+        item_ids = self.item_index.query(head_xs, head_ys)
+        item_pixels = nonzero(item_ids > 0)[0]
+        item_players, first = unique(labels[item_pixels], return_index=True)
+        first_item_ids = zeros(k, dtype=int)
+        first_item_ids[item_players] = item_ids[item_pixels[first]]
+        return crashed, first_item_ids
+
+    def check_events(self):
+        """
+        This function performs various checks and acts accordingly:
+            1. Check collisions with walls -> kill player
+            2. Check collision with items -> activate items
+            3. Check item expiration -> deactivate items
+            4. Spawn new items by chance
+        :return: None
+        """
+        # Check crashes with walls and items
+        players = [p for p in self.controller.players if p.alive]
+        crashed, item_ids = self.detect_collisions(players)
+        for p, has_crashed, item_id in zip(players, crashed.tolist(), item_ids.tolist()):
+            # Walls
+            if has_crashed:
+                p.alive = False
+            # Items
+            elif item_id > 0 and item_id in self.item_index:  # The item might be collected by another player
+                item, pos = self.remove_item(item_id)  # Remove item from field and item index
+                # activate item
+                item.activate(player=p)  # Activate the effect
+                self.items_active.schedule(item, self.tick_count + item.duration)
+        # Check to deactivate items
+        self.items_active.expire(self.tick_count)
+        # Place items
+        if self.item_max_count > 0 and self.controller.item_names and self.rng.random() < self.item_drop_chance:
+            with self.profiler.measure("spawn_items"):
+                # Remove oldest item if the max count is reached.
+                if self.item_max_count <= len(self.item_index):
+                    self.remove_item(self.item_index.get_oldest_id())
+                x_rand = self.rng.integers(ITEMSIZE, self.controller.field_size - ITEMSIZE)
+                y_rand = self.rng.integers(ITEMSIZE, self.controller.field_size - ITEMSIZE)
+                self.place_item(name=self.rng.choice(self.controller.item_names), pos=(x_rand, y_rand))
+
+    # ########################################
+    # Helper functions
+    # ########################################
+
+    def clear_walls(self):
+        """
+        Removes all walls but the border and notifies all observers.
+
+        :return: None
+        """
+        self.walls[1:-1, 1:-1] = NO_WALL
+        self.wall_owners[1:-1, 1:-1] = OWNER_NONE
+        sync_halo(self.wall_grid)
+        for o in self.observers:
+            o.on_walls_cleared()
+
+    def count_wall_pixels(self):
+        """
+        Counts the wall pixels currently present on the field for every player using the wall owner grid.
+
+        :return: dict, mapping each player to its number of wall pixels.
+        """
+        counts = bincount(self.wall_owners.ravel(), minlength=len(self.controller.players) + 1)
+        return {p: int(counts[i + 1]) for i, p in enumerate(self.controller.players)}
+
+    def check_round_end(self):
+        """
+        This function returns true, if the current round is over, meaning one ore no players are left alive unless
+        it is field practice game. In that case the round only ends when no player is alive.
+
+        :return: bool, True if round is over, False otherwise.
+        """
+        players_alive = [p for p in self.controller.players if p.alive]
+        if len(players_alive) <= 1 and not self.practice_game:
+            return True
+        elif len(players_alive) == 0 and self.practice_game:
+            return True
+        else:
+            return False
+
+    def award_winner(self):
+        """
+        This function checks if the round is over and awards the winner of the round, if there is one.
+        This function does nothing, if the round is not yet decided or ended in a draw.
+
+        :return: Player instance that won the round or None.
+        """
+
+        players_alive = [p for p in self.controller.players if p.alive]
+        if len(players_alive) != 1:
+            # Not decided or draw
+            return None
+        winner = players_alive[-1]
+        winner.wins += 1
+        return winner
+
+    def check_game_end(self):
+        """
+        This function returns True if the current game is decided, meaning that one player has the maximum amount of
+        required wins.
+
+        :return: bool, True if teh game is over, False otherwise.
+        """
+
+        players_sorted = sorted(self.controller.players, key=lambda p: p.wins)  # ascending
+        if len(players_sorted) > 0 and players_sorted[-1].wins >= self.max_wins:
+            return True
+        else:
+            return False
+
+    def reset_all_items(self):
+        """
+        Clears all items from the game field, deactivates all running effects and resets the item variables.
+        :return: None
+        """
+        # -- Clean up item variables
+        self.item_id = 1
+        self.items_active.clear()
+        self.item_index.clear()
+
+    # ########################################
+    # Deprecated / legacy functions
+    # ########################################
+
+    def dot_trace(self, pos, r):
+        """
+        Creates field list of coordinates that represent field circle of radius r on field 2d grid.
+        This function respects the borders of the game field.
+
+        :param pos: center of dot as tuple of size 2 of int
+        :param r: radius is pixels as int
+        :return: list
+        """
+        # check all pixels in square
+        X, Y = pos
+        trace = []
+        for x, y in [(x, y) for x in range(X - r, X + r + 1) for y in range(Y - r, Y + r + 1)]:
+            if (x - X) ** 2 + (y - Y) ** 2 < r:
+                # append if pixel is in circle around pos
+                trace.append((x % self.controller.field_size,
+                              y % self.controller.field_size)
+                             )
+        return trace
+
+    def way_trace(self, dot_trace, dist, angle, sparse=1):
+        """
+        Computes field list of positions if one starts from each position in dot_trace
+        and goes field distance of dist facing the given angle. Superseded by self.sweep_trace.
+
+        :param dot_trace: list of tuple of size 2 of int or tuple of size 2
+        :param dist: distance to go, int
+        :param angle: facing angle, int
+        :param sparse: level of denseness between points, lower is denser. int > 0. default 1.
+        :return: list of coordinates
+        """
+        way_trace = []
+        for pix in dot_trace:
+            for d in range(dist):
+                if d % sparse == 0:
+                    way_trace.append(self.get_target_pixel(pos=pix,
+                                                           dist=d,
+                                                           angle=angle
+                                                           )
+                                     )
+        return way_trace
+
+    def _move_deprecated(self):
+        """
+        This function moves every player by one step according to their current position, speed, angle and
+        move command. It also updates the walls with the way traces and returns field list of all the old player positions.
+
+        :return: dict of list of tuple of int of size 2.
+        """
+        old_way_traces = {}
+        for p in self.controller.players:
+            if not p.alive:
+                continue
+            if p.move_command == DIR_LEFT:
+                p.angle = (p.angle - p.turn_rate) % 360
+            elif p.move_command == DIR_RIGHT:
+                p.angle = (p.angle + p.turn_rate) % 360
+            # compute new position
+            p.pos = self.get_target_pixel(pos=p.pos, dist=p.speed, angle=p.angle)
+            player_moved_straight = True
+
+            # reset move_command if players turn rate is set to RATE_RIGHT_ANGLE.
+            if p.turn_rate == RATE_RIGHT_ANGLE:
+                p.move_command = DIR_STRAIGHT
+
+            # update new dot trace
+            old_dot_trace = p.dot_trace
+            old_way_traces[p] = old_dot_trace
+            p.dot_trace = self.dot_trace(pos=p.pos, r=p.size)  # new dot trace at new position
+
+            # update walls if...
+            if (self.tick_count % self.gap_rate > self.gap_length  # it is not field tick where gaps are drawn &&
+                    and (
+                            p.turn_rate != RATE_RIGHT_ANGLE or player_moved_straight)  # there was NOT field 90 degree turn &&
+                    and not p.flying):  # player is not flying.
+                for pix in [c for c in old_dot_trace if c not in p.dot_trace]:
+                    self.walls[pix] = WALL
+        return old_way_traces
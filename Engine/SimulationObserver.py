@@ -0,0 +1,87 @@
+class SimulationObserver:
+    """
+    This class represents the base class of everything that subscribes to a Simulation, e.g. a renderer displaying the
+    game field. Every method is called by the simulation when the respective event happens and does nothing here.
+    """
+
+    def on_round_initialised(self):
+        """
+        Called when a new round starts, after the walls were cleared and before the players are placed.
+
+        :return: None
+        """
+        pass
+
+    def on_player_placed(self, p, tail_trace):
+        """
+        Called when a player was placed on the field at the start of a round.
+
+        :param p: Player instance that was placed.
+        :param tail_trace: tuple of size 2 of 1-d numpy arrays of int (xs, ys), pixels of the tail-wall behind the
+        player.
+        :return: None
+        """
+        pass
+
+    def on_tick_started(self):
+        """
+        Called every tick before the players move according to their current move-commands.
+
+        :return: None
+        """
+        pass
+
+    def on_players_moved(self, old_dot_traces):
+        """
+        Called every tick after all players moved.
+
+        :param old_dot_traces: dict mapping each moved player to the dot-trace (xs, ys) of its previous position.
+        :return: None
+        """
+        pass
+
+    def on_walls_cleared(self):
+        """
+        Called when all walls but the border were removed from the field.
+
+        :return: None
+        """
+        pass
+
+    def on_border_toggled(self, on):
+        """
+        Called when the surrounding walls were turned on or off.
+
+        :param on: boolean, True if the border is present now.
+        :return: None
+        """
+        pass
+
+    def on_block_placed(self, rect):
+        """
+        Called when a rectangular block of walls was placed on the field.
+
+        :param rect: tuple of size 4 of int, top-left pixel and bottom-right pixel (exclusive) of the block.
+        :return: None
+        """
+        pass
+
+    def on_item_placed(self, item_id, item, pos):
+        """
+        Called when an item was placed on the field.
+
+        :param item_id: int, round specific id of the item.
+        :param item: Item instance that was placed.
+        :param pos: tuple of size 2 of int, top-left pixel of the item.
+        :return: None
+        """
+        pass
+
+    def on_item_removed(self, item_id):
+        """
+        Called when an item was removed from the field, either because it was collected or because it was replaced.
+
+        :param item_id: int, round specific id of the item.
+        :return: None
+        """
+        pass
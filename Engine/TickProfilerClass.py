@@ -0,0 +1,154 @@
+import json
+from collections import deque
+from contextlib import nullcontext
+from csv import writer
+from timeit import default_timer
+
+from numpy import percentile, array
+
+TICK_PHASE = "tick"  # Name of the phase measuring whole ticks, whose durations are compared to the budget.
+
+
+class PhaseTimer:
+    """
+    Context manager measuring the duration of one phase and handing it to its TickProfiler.
+    """
+
+    __slots__ = ("profiler", "phase", "start")
+
+    def __init__(self, profiler, phase):
+        self.profiler = profiler
+        self.phase = phase
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = default_timer()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.record(self.phase, default_timer() - self.start)
+        return False
+
+
+class TickProfiler:
+    """
+    Collects the durations of the phases of every tick, e.g. moving the players or checking events.
+
+    The latest durations of every phase are kept in a rolling window from which percentiles are computed on demand.
+    Durations of the special phase TICK_PHASE are additionally compared to the tick budget to count overruns.
+    A disabled profiler does not measure anything and its measure method costs a single function call.
+    """
+
+    def __init__(self, budget=1 / 28, window=1000, enabled=True):
+        """
+        :param budget: float, time in seconds a tick may take.
+        :param window: int, number of latest durations kept per phase.
+        :param enabled: boolean, if False, nothing is measured.
+        """
+        self.budget = budget
+        self.window = window
+        self.enabled = enabled
+
+        self.samples = {}  # Dict of deque of durations in seconds, keyed by phase name
+        self.timers = {}  # Dict of PhaseTimer, keyed by phase name
+        self.ticks = 0  # number of measured ticks
+        self.overruns = 0  # number of measured ticks exceeding the budget
+
+    def measure(self, phase):
+        """
+        Returns a context manager measuring the duration of its block as the given phase.
+
+        :param phase: string, name of the phase.
+        :return: context manager
+        """
+        if not self.enabled:
+            return nullcontext()
+        timer = self.timers.get(phase)
+        if timer is None:
+            timer = PhaseTimer(self, phase)
+            self.timers[phase] = timer
+        return timer
+
+    def record(self, phase, seconds):
+        """
+        Adds a duration to the given phase.
+
+        :param phase: string, name of the phase.
+        :param seconds: float, duration of the phase.
+        :return: None
+        """
+        samples = self.samples.get(phase)
+        if samples is None:
+            samples = deque(maxlen=self.window)
+            self.samples[phase] = samples
+        samples.append(seconds)
+        if phase == TICK_PHASE:
+            self.ticks += 1
+            if seconds > self.budget:
+                self.overruns += 1
+
+    def reset(self):
+        """
+        Discards all measurements.
+
+        :return: None
+        """
+        self.samples = {}
+        self.ticks = 0
+        self.overruns = 0
+
+    def summary(self):
+        """
+        :return: dict with keys
+            "budget_ms": float, tick budget in milliseconds,
+            "ticks": int, number of measured ticks,
+            "overruns": int, number of measured ticks exceeding the budget,
+            "phases": dict mapping each phase name to a dict with the keys "count", "mean_ms", "p50_ms", "p95_ms",
+                      "p99_ms" and "max_ms" computed over the rolling window.
+        """
+        phases = {}
+        for phase, samples in self.samples.items():
+            if not samples:
+                continue
+            durations = array(samples) * 1000
+            p50, p95, p99 = percentile(durations, [50, 95, 99])
+            phases[phase] = {"count": len(durations),
+                             "mean_ms": float(durations.mean()),
+                             "p50_ms": float(p50),
+                             "p95_ms": float(p95),
+                             "p99_ms": float(p99),
+                             "max_ms": float(durations.max()),
+                             }
+        return {"budget_ms": self.budget * 1000, "ticks": self.ticks, "overruns": self.overruns, "phases": phases}
+
+    def export(self, path):
+        """
+        Writes the summary to a file, as CSV if path ends with ".csv" and as JSON otherwise.
+
+        :param path: string, path of the file to write.
+        :return: None
+        """
+        summary = self.summary()
+        with open(path, "w", newline="") as file:
+            if path.endswith(".csv"):
+                csv_writer = writer(file)
+                csv_writer.writerow(["phase", "count", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"])
+                for phase, stats in summary["phases"].items():
+                    csv_writer.writerow([phase, stats["count"], stats["mean_ms"], stats["p50_ms"], stats["p95_ms"],
+                                         stats["p99_ms"], stats["max_ms"]])
+            else:
+                json.dump(summary, file, indent=2)
+
+    def format_overlay(self):
+        """
+        Formats the summary as short text, one line per phase, e.g. for an overlay on the game screen.
+
+        :return: string
+        """
+        summary = self.summary()
+        lines = ["ticks {}  overruns {}  budget {:.1f} ms".format(summary["ticks"], summary["overruns"],
+                                                                  summary["budget_ms"])]
+        for phase, stats in sorted(summary["phases"].items(), key=lambda item: item[1]["p99_ms"], reverse=True):
+            lines.append("{:<14} p50 {:6.2f}  p95 {:6.2f}  p99 {:6.2f} ms".format(phase, stats["p50_ms"],
+                                                                               stats["p95_ms"], stats["p99_ms"]))
+        return "\n".join(lines)
@@ -0,0 +1,130 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations_with_replacement
+from os import cpu_count
+from timeit import default_timer
+
+from numpy.random import SeedSequence
+
+from Engine.BatchRunner import create_bots, run_round
+from Engine.HeadlessControllerClass import HeadlessController
+from Engine.SimulationClass import Simulation
+
+
+def empty_statistics():
+    """
+    :return: dict with the per-strategy counters collected during a tournament, all set to 0.
+    """
+    return {"rounds": 0, "wins": 0, "losses": 0, "draws": 0, "survival_ticks": 0}
+
+
+def play_shard(strategy_names, rounds, seed, item_names, max_ticks):
+    """
+    Plays rounds between one bot per given strategy within a fresh simulation. This function is executed by the
+    worker processes of run_tournament.
+
+    :param strategy_names: list of string, keys of BOT_STRATEGIES.
+    :param rounds: int, number of rounds to play.
+    :param seed: numpy.random.SeedSequence or int, seed of the simulation's random number generator.
+    :param item_names: list of string or None, class names of the items that may spawn.
+    :param max_ticks: int, number of ticks after which a round is aborted and counted as draw.
+    :return: tuple (dict mapping each strategy name to its statistics as in empty_statistics, number of ticks played)
+    """
+    bots = create_bots(strategy_names)
+    strategies = dict(zip(bots, strategy_names))
+    simulation = Simulation(HeadlessController(players=bots, max_rounds=rounds, item_names=item_names), seed=seed)
+    statistics = {name: empty_statistics() for name in strategy_names}
+    total_ticks = 0
+    for _ in range(rounds):
+        winner, ticks, survival_ticks = run_round(simulation, max_ticks)
+        total_ticks += ticks
+        for p in bots:
+            entry = statistics[strategies[p]]
+            entry["rounds"] += 1
+            entry["survival_ticks"] += survival_ticks[p]
+            if winner is None:
+                entry["draws"] += 1
+            elif winner is p:
+                entry["wins"] += 1
+            else:
+                entry["losses"] += 1
+    return statistics, total_ticks
+
+
+def merge_statistics(total, statistics):
+    """
+    Adds the per-strategy counters of statistics to the ones in total.
+
+    :param total: dict mapping strategy names to statistics as in empty_statistics, updated in place.
+    :param statistics: dict mapping strategy names to statistics as in empty_statistics.
+    :return: None
+    """
+    for name, entry in statistics.items():
+        total_entry = total.setdefault(name, empty_statistics())
+        for key, value in entry.items():
+            total_entry[key] += value
+
+
+def run_tournament(strategy_names, rounds, bots_per_round=2, item_names=None, max_ticks=5000, seed=0, workers=None,
+                   shard_size=50):
+    """
+    Plays a round-robin tournament between the given bot strategies: Every combination of bots_per_round strategies,
+    including a strategy playing against itself, plays the given number of rounds. The rounds are split into shards
+    of at most shard_size rounds which are played in parallel by a pool of worker processes.
+
+    The seed of every shard is spawned from the given seed in a fixed order, so the results do not depend on the
+    number of workers.
+
+    :param strategy_names: list of string, keys of BOT_STRATEGIES.
+    :param rounds: int, number of rounds to play per combination of strategies.
+    :param bots_per_round: int, number of bots taking part in each round.
+    :param item_names: list of string, class names of the items that may spawn. If None, all items may spawn.
+    :param max_ticks: int, number of ticks after which a round is aborted and counted as draw.
+    :param seed: int, master seed of the tournament.
+    :param workers: int, number of worker processes. If None, one per cpu core is used.
+    :param shard_size: int, maximum number of rounds played by one worker at a time.
+    :return: dict with keys
+        "strategies": dict mapping each strategy name to its statistics as in empty_statistics,
+        "rounds": int, number of rounds played,
+        "ticks": int, number of ticks played in total,
+        "seconds": float, wall-clock time of the tournament.
+    """
+    shards = []
+    for pairing in combinations_with_replacement(sorted(set(strategy_names)), bots_per_round):
+        for first_round in range(0, rounds, shard_size):
+            shards.append((list(pairing), min(shard_size, rounds - first_round)))
+    seeds = SeedSequence(seed).spawn(len(shards))
+
+    results = {"strategies": {}, "rounds": 0, "ticks": 0, "seconds": 0.0}
+    start = default_timer()
+    with ProcessPoolExecutor(max_workers=workers or cpu_count()) as executor:
+        futures = [executor.submit(play_shard, pairing, shard_rounds, shard_seed, item_names, max_ticks)
+                   for (pairing, shard_rounds), shard_seed in zip(shards, seeds)]
+        for (_, shard_rounds), future in zip(shards, futures):
+            statistics, ticks = future.result()
+            merge_statistics(results["strategies"], statistics)
+            results["rounds"] += shard_rounds
+            results["ticks"] += ticks
+    results["seconds"] = default_timer() - start
+    return results
+
+
+def format_tournament_report(results):
+    """
+    Formats the results of run_tournament as human readable table followed by the simulation speed.
+
+    :param results: dict as returned by run_tournament.
+    :return: string
+    """
+    lines = ["{:<12}{:>9}{:>9}{:>9}{:>9}{:>10}{:>14}".format("Strategy", "Rounds", "Wins", "Losses", "Draws",
+                                                             "Win rate", "Avg survival")]
+    strategies = sorted(results["strategies"].items(), key=lambda item: item[1]["wins"] / max(item[1]["rounds"], 1),
+                        reverse=True)
+    for name, entry in strategies:
+        played = max(entry["rounds"], 1)
+        lines.append("{:<12}{:>9}{:>9}{:>9}{:>9}{:>9.1%}{:>14.1f}".format(
+            name, entry["rounds"], entry["wins"], entry["losses"], entry["draws"], entry["wins"] / played,
+            entry["survival_ticks"] / played))
+    lines.append("")
+    lines.append("{} rounds, {} ticks in {:.2f} s ({:.1f} ticks per second)".format(
+        results["rounds"], results["ticks"], results["seconds"], results["ticks"] / max(results["seconds"], 1e-9)))
+    return "\n".join(lines)
@@ -6,16 +6,16 @@ class ItemBase:
     This class represents the base class of all items that may appear on the screen. It does not have any effect.
     """
 
-    def __init__(self, controller, gamescreen):
+    def __init__(self, controller, simulation):
         """
         Creates a base Item.
 
-        :param controller: Controller instance of the game screen.
-        :param gamescreen: The gamescreen instance where this item is placed in.
+        :param controller: Controller instance of the simulation.
+        :param simulation: The Simulation instance where this item is placed in.
         """
 
         self.controller = controller
-        self.gamescreen = gamescreen
+        self.simulation = simulation
 
         # This value should be manually adjusted depending on the respective Item that inherits this class.
         self.duration = DURATION_NORMAL
@@ -1,5 +1,3 @@
-from numpy.random import default_rng
-
 from FieldObjects.Items.ItemBase import ItemBase
 from Utils.Const import *
 
@@ -10,11 +8,11 @@ class ItemBlock(ItemBase):
     """
 
     # __init__ from base class.
-    def __init__(self, controller, gamescreen):
-        ItemBase.__init__(self, controller, gamescreen)
+    def __init__(self, controller, simulation):
+        ItemBase.__init__(self, controller, simulation)
         self.duration = DURATION_INFINITE  # No effective usage
         self.image_path = "Data/IconBlock.png"
-        self.rng = default_rng()
+        self.rng = self.simulation.rng  # Random items are determined by the seed of the round
         self.blocksize = 100
 
     def activate(self, player):
@@ -27,12 +25,7 @@ class ItemBlock(ItemBase):
         self.player = player
         x_rand = self.rng.integers(self.blocksize, self.controller.field_size - self.blocksize)
         y_rand = self.rng.integers(self.blocksize, self.controller.field_size - self.blocksize)
-        # Visually
-        self.gamescreen.field_image.put(data="White",
-                                        to=(x_rand, y_rand, x_rand + self.blocksize, y_rand + self.blocksize)
-                                        )
-        # Effectively
-        self.gamescreen.walls[x_rand:x_rand + self.blocksize, y_rand:y_rand + self.blocksize] = -1
+        self.simulation.place_block(x_rand, y_rand, self.blocksize)
 
     def deactivate(self):
         """
@@ -8,8 +8,8 @@ class ItemClear(ItemBase):
     """
 
     # __init__ from base class.
-    def __init__(self, controller, gamescreen):
-        ItemBase.__init__(self, controller, gamescreen)
+    def __init__(self, controller, simulation):
+        ItemBase.__init__(self, controller, simulation)
         self.duration = DURATION_INSTANT
         self.image_path = "Data/IconClear.png"
 
@@ -21,7 +21,7 @@ class ItemClear(ItemBase):
         :return: None
         """
         self.player = player
-        self.gamescreen.clear_walls()
+        self.simulation.clear_walls()
 
     def deactivate(self):
         """
@@ -8,8 +8,8 @@ class ItemFastAll(ItemBase):
     """
 
     # __init__ from base class.
-    def __init__(self, controller, gamescreen):
-        ItemBase.__init__(self, controller, gamescreen)
+    def __init__(self, controller, simulation):
+        ItemBase.__init__(self, controller, simulation)
         self.duration = DURATION_NORMAL
         self.image_path = "Data/IconFastAll.png"
         self.players_to_ignore = []  # Stores all players having max speed at the time of collecting this item.
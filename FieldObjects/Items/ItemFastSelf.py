@@ -8,8 +8,8 @@ class ItemFastSelf(ItemBase):
     """
 
     # __init__ from base class.
-    def __init__(self, controller, gamescreen):
-        ItemBase.__init__(self, controller, gamescreen)
+    def __init__(self, controller, simulation):
+        ItemBase.__init__(self, controller, simulation)
         self.duration = DURATION_SHORT
         self.image_path = "Data/IconFastSelf.png"
         self.was_at_max_speed = False
@@ -36,11 +36,8 @@ class ItemFastSelf(ItemBase):
         :return: None
         """
         # check for already running instances of this item for this player
-        items = [item
-                 for item, _ in self.gamescreen.items_active
-                 if item.player == self.player and item.__class__.__name__ == self.__class__.__name__
-                 ]
-        if self.was_at_max_speed and len(items) > 1:
+        running = self.simulation.items_active.count(type(self), player=self.player)
+        if self.was_at_max_speed and running > 1:
             # There is a younger Item instance running and the player was already at max speed, so do nothing.
             return
         else:
@@ -9,8 +9,8 @@ class ItemFly(ItemBase):
     """
 
     # __init__ from base class.
-    def __init__(self, controller, gamescreen):
-        ItemBase.__init__(self, controller, gamescreen)
+    def __init__(self, controller, simulation):
+        ItemBase.__init__(self, controller, simulation)
         self.duration = DURATION_SHORT
         self.image_path = "Data/IconFly.png"
 
@@ -32,11 +32,8 @@ class ItemFly(ItemBase):
         :return: None
         """
         # check for already running instances of this item for this player
-        items = [item
-                 for item, _ in self.gamescreen.items_active
-                 if item.player == self.player and item.__class__.__name__ == self.__class__.__name__
-                 ]
-        if len(items) > 1:
+        running = self.simulation.items_active.count(type(self), player=self.player)
+        if running > 1:
             # There is a younger Item instance running, so do nothing.
             return
         # Reset flying status
@@ -8,8 +8,8 @@ class ItemGlueAll(ItemBase):
     """
 
     # __init__ from base class.
-    def __init__(self, controller, gamescreen):
-        ItemBase.__init__(self, controller, gamescreen)
+    def __init__(self, controller, simulation):
+        ItemBase.__init__(self, controller, simulation)
         self.duration = DURATION_SHORT
         self.image_path = "Data/IconGlueAll.png"
         self.player = None  # Will be defined during method call activate.
@@ -1,5 +1,3 @@
-from numpy.random import default_rng
-
 from FieldObjects.Items.ItemBase import ItemBase
 from Utils.Const import *
 
@@ -10,11 +8,11 @@ class ItemPackage(ItemBase):
     """
 
     # __init__ from base class.
-    def __init__(self, controller, gamescreen):
-        ItemBase.__init__(self, controller, gamescreen)
+    def __init__(self, controller, simulation):
+        ItemBase.__init__(self, controller, simulation)
         self.duration = DURATION_INSTANT
         self.image_path = "Data/IconPackage.png"
-        self.rng = default_rng()
+        self.rng = self.simulation.rng  # Random items are determined by the seed of the round
 
     def activate(self, player):
         """
@@ -29,7 +27,7 @@ class ItemPackage(ItemBase):
         for name in random_item_names:
             x_rand = self.rng.integers(ITEMSIZE, self.controller.field_size - ITEMSIZE)
             y_rand = self.rng.integers(ITEMSIZE, self.controller.field_size - ITEMSIZE)
-            self.gamescreen.place_item(name=name, pos=(x_rand, y_rand))
+            self.simulation.place_item(name=name, pos=(x_rand, y_rand))
 
     def deactivate(self):
         """
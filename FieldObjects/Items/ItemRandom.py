@@ -1,8 +1,5 @@
-from importlib import import_module
-
-from numpy.random import default_rng
-
 from FieldObjects.Items.ItemBase import ItemBase
+from FieldObjects.Items.ItemRegistry import get_item_class
 from Utils.Const import *
 
 
@@ -12,15 +9,12 @@ class ItemRandom(ItemBase):
     """
 
     # __init__ from base class.
-    def __init__(self, controller, gamescreen):
-        ItemBase.__init__(self, controller, gamescreen)
+    def __init__(self, controller, simulation):
+        ItemBase.__init__(self, controller, simulation)
         self.duration = DURATION_INSTANT
         self.image_path = "Data/IconRandom.png"
-        self.rng = default_rng()
-        self.available_item_names = self.controller.all_items
-
-        if self.available_item_names.__contains__("ItemRandom"):
-            self.available_item_names.remove("ItemRandom")
+        self.rng = self.simulation.rng  # Random items are determined by the seed of the round
+        self.available_item_names = [name for name in self.controller.all_items if name != "ItemRandom"]
 
     def activate(self, player):
         """
@@ -32,13 +26,11 @@ class ItemRandom(ItemBase):
         self.player = player
         # emulate a random item
         item_to_create = self.rng.choice(self.available_item_names)
-        item_module = import_module("FieldObjects.Items." + item_to_create)
-        item_class = getattr(item_module, item_to_create)
-        emulated_item = item_class(self.controller, self.gamescreen)
+        emulated_item = get_item_class(item_to_create)(self.controller, self.simulation)
 
-        # Activate the random item and place it in the gamescreen's active items.
+        # Activate the random item and place it in the simulation's active items.
         emulated_item.activate(self.player)
-        self.gamescreen.items_active.append((emulated_item, self.gamescreen.tick_count + emulated_item.duration))
+        self.simulation.items_active.schedule(emulated_item, self.simulation.tick_count + emulated_item.duration)
 
     def deactivate(self):
         """
@@ -0,0 +1,30 @@
+from importlib import import_module
+
+# Cache of item classes keyed by their class name.
+_item_classes = {}
+
+
+def get_item_class(name):
+    """
+    Returns the item class of the given name. Every class is imported once and then served from a cache.
+
+    :param name: string, name of the item-class, which is also the name of its module in FieldObjects.Items.
+    :return: class inheriting ItemBase.
+    """
+    item_class = _item_classes.get(name)
+    if item_class is None:
+        item_module = import_module("FieldObjects.Items." + name)
+        item_class = getattr(item_module, name)
+        _item_classes[name] = item_class
+    return item_class
+
+
+def register_items(names):
+    """
+    Resolves the item classes of all given names up front, such that spawning an item never imports a module.
+
+    :param names: list of string, names of the item-classes.
+    :return: None
+    """
+    for name in names:
+        get_item_class(name)
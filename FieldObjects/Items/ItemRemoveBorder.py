@@ -8,8 +8,8 @@ class ItemRemoveBorder(ItemBase):
     """
 
     # __init__ from base class.
-    def __init__(self, controller, gamescreen):
-        ItemBase.__init__(self, controller, gamescreen)
+    def __init__(self, controller, simulation):
+        ItemBase.__init__(self, controller, simulation)
         self.duration = DURATION_NORMAL
         self.image_path = "Data/IconRemoveBorder.png"
 
@@ -21,10 +21,8 @@ class ItemRemoveBorder(ItemBase):
         :return: None
         """
         self.player = player
-        # Toggle Effectively
-        self.gamescreen.toggle_border(on=False)
-        # Toggle visually
-        self.gamescreen.display_border(on=False)
+        # Toggle effectively and visually
+        self.simulation.toggle_border(on=False)
 
     def deactivate(self):
         """
@@ -33,14 +31,9 @@ class ItemRemoveBorder(ItemBase):
         :return: None
         """
         # check for already running instances of this item for ANY player
-        items = [item
-                 for item, _ in self.gamescreen.items_active
-                 if item.__class__.__name__ == self.__class__.__name__
-                 ]
-        if len(items) > 1:
+        running = self.simulation.items_active.count(type(self))
+        if running > 1:
             # There is a younger Item instance running, so do nothing.
             return
-        # Toggle Effectively
-        self.gamescreen.toggle_border(on=True)
-        # Toggle visually
-        self.gamescreen.display_border(on=True)
+        # Toggle effectively and visually
+        self.simulation.toggle_border(on=True)
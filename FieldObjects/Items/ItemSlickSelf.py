@@ -8,8 +8,8 @@ class ItemSlickSelf:
     """
 
     # __init__ from base class.
-    def __init__(self, controller, gamescreen):
-        ItemBase.__init__(self, controller, gamescreen)
+    def __init__(self, controller, simulation):
+        ItemBase.__init__(self, controller, simulation)
         self.duration = DURATION_LONG
         self.image_path = "Data/IconSlickSelf.png"
         self.player = None  # Will be defined during method call activate.
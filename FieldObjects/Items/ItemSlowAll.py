@@ -8,8 +8,8 @@ class ItemSlowAll(ItemBase):
     """
 
     # __init__ from base class.
-    def __init__(self, controller, gamescreen):
-        ItemBase.__init__(self, controller, gamescreen)
+    def __init__(self, controller, simulation):
+        ItemBase.__init__(self, controller, simulation)
         self.duration = DURATION_NORMAL
         self.image_path = "Data/IconSlowAll.png"
         self.players_to_ignore = []  # Stores all players to ignore by this item
@@ -8,8 +8,8 @@ class ItemSlowSelf(ItemBase):
     """
 
     # __init__ from base class.
-    def __init__(self, controller, gamescreen):
-        ItemBase.__init__(self, controller, gamescreen)
+    def __init__(self, controller, simulation):
+        ItemBase.__init__(self, controller, simulation)
         self.duration = DURATION_SHORT
         self.image_path = "Data/IconSlowSelf.png"
         self.ignore = False  # Indicates if this Items effect should be ignored
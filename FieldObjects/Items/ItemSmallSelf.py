@@ -8,8 +8,8 @@ class ItemSmallSelf(ItemBase):
     """
 
     # __init__ from base class.
-    def __init__(self, controller, gamescreen):
-        ItemBase.__init__(self, controller, gamescreen)
+    def __init__(self, controller, simulation):
+        ItemBase.__init__(self, controller, simulation)
         self.duration = DURATION_NORMAL
         self.image_path = "Data/IconSmallSelf.png"
         self.was_at_min_size = False
@@ -34,11 +34,8 @@ class ItemSmallSelf(ItemBase):
 
         :return: None
         """
-        items = [item
-                 for item, _ in self.gamescreen.items_active
-                 if item.player == self.player and item.__class__.__name__ == self.__class__.__name__
-                 ]
-        if self.was_at_min_size and len(items) > 1:
+        running = self.simulation.items_active.count(type(self), player=self.player)
+        if self.was_at_min_size and running > 1:
             # There is a younger Item instance running and the player was already at min size, so do nothing.
             return
         else:
@@ -1,7 +1,5 @@
-from numpy import sin, cos, radians
-from pynput import keyboard
-
 from Utils.Const import *
+from Utils.SpriteCache import get_head_indices
 
 
 class Player:
@@ -9,14 +7,14 @@ class Player:
     Represents one player and stores all player specific Information.
     """
 
-    def __init__(self, name, color, keys={"left": keyboard.Key.left, "right": keyboard.Key.right}, alive=True,
+    def __init__(self, name, color, keys=None, alive=True,
                  speed=SPEED_NORMAL, size=SIZE_NORMAL, flying=False, pos=(100, 100), angle=0):
         """
         Initialises all attributes.
         Additional information on certain fields:
             name: string,
             color: string, matching a python color string.
-            keys: dict with keys "left" and "right" mapping to pynput.keyboard.Key.
+            keys: dict with keys "left" and "right" mapping to Tk key symbols, defaults to the arrow keys.
             alive: bool,
             speed: int,
             size: int (radius of the dot in pixels),
@@ -28,9 +26,12 @@ class Player:
         # Basic
         self.name = name
         self.color = color
+        if keys is None:
+            keys = {"left": "Left", "right": "Right"}
         self.keys = keys
 
         self.wins = 0
+        self.owner_id = OWNER_NONE  # Id marking this player's walls in the wall owner grid. Set in place_player.
 
         # Status
         self.alive = alive
@@ -43,16 +44,13 @@ class Player:
         self.pos = pos
         self.angle = angle
 
-        self.dot_trace = None  # Will be defined during put_players and move in the GameScreen Class.
-        self.data_strings = None  # Used for efficiently drawing the player's dot-trace.
-        self.rect_corners = None  # Used for efficiently drawing the player's dot-trace.
-        self.collision_head = []  # Defined during the call of self.compute_collision_head.
+        self.dot_trace = None  # Pair of index arrays (xs, ys). Defined during place_player and move in the GameScreen.
+        self.collision_head = None  # Pair of index arrays (xs, ys). Defined in self.compute_collision_head.
         self.head_tolerance_count = 2  # Number of latest player positions that do not count for collision.
         self.tolerance_heads = []  # Stores the last self.tolerance_count dot_traces
 
         # FUNCTIONAL ATTRIBUTES
         self.move_command = DIR_STRAIGHT  # -1: left (DIR_LEFT) , 0: straight (DIR_STRAIGHT), 1: right (DIR_RIGHT)
-        self.listener = None  # is defined in function call self.make_listener
         self.key_is_held_down = False
 
     def update_tolerance_heads(self):
@@ -69,67 +67,71 @@ class Player:
         """
         Computes the "upper" half of the player's dot which will be used for collision checking. In particular, this is
         a subset of the player's dot-trace which consists of the half-circle facing in the current direction of
-        movement including the diameter.
+        movement including the diameter. The half-circle is looked up in precomputed tables, see
+        Utils.SpriteCache.get_head_indices.
 
-        The result of this computation is saved in self.collision_head as a list of tuple of size of int 2.
+        The result of this computation is saved in self.collision_head as a pair of index arrays (xs, ys).
 
         :return: None.
         """
         current_facing_angle = self.angle
         if self.move_command == DIR_LEFT:
             current_facing_angle += self.turn_rate
-        elif self.move_command == DIR_LEFT:
+        elif self.move_command == DIR_RIGHT:
             current_facing_angle -= self.turn_rate
-        v1, v2 = cos(radians(current_facing_angle)), sin(radians(current_facing_angle))
-        p, q = self.pos
-        self.collision_head = [(x, y) for (x, y) in self.dot_trace if (x - p) * v1 + (y - q) * v2 >= 0]
+        head = get_head_indices(self.size, current_facing_angle)
+        xs, ys = self.dot_trace
+        self.collision_head = (xs[head], ys[head])
 
-    def pixel_in_tolerance(self, pix):
+    def press_key(self, key):
         """
-        Checks if the given pixel is contained in the tolerance dot-traces.
+        Adjusts the move-command to a pressed key, see Screens.InputDispatcherClass.
 
-        :param pix: tuple of size 2 of int, representing the pixel i question.
-        :return: bool, True if the pix is contained in self.tolerance_heads , False otherwise.
+        :param key: string, key symbol of the pressed key.
+        :return: None
         """
-        for head_trace in self.tolerance_heads:
-            if pix in head_trace:
-                return True
-        return False
-
-    def make_listener(self):
+        if self.key_is_held_down and self.turn_rate == RATE_RIGHT_ANGLE:
+            self.move_command = DIR_STRAIGHT
+            return
+        if key == self.keys["left"] and self.move_command != DIR_LEFT:
+            self.key_is_held_down = True
+            self.move_command = DIR_LEFT
+        elif key == self.keys["right"] and self.move_command != DIR_RIGHT:
+            self.key_is_held_down = True
+            self.move_command = DIR_RIGHT
+
+    def release_key(self, key):
         """
-        Creates a new keyboard listener for this player and stores it in the attribute
-            self.listener
+        Adjusts the move-command to a released key, see Screens.InputDispatcherClass.
 
+        :param key: string, key symbol of the released key.
         :return: None
         """
+        if key == self.keys["left"] or key == self.keys["right"]:
+            self.key_is_held_down = False
+            self.move_command = DIR_STRAIGHT
 
-        def on_press(key):
-            if self.key_is_held_down and self.turn_rate == RATE_RIGHT_ANGLE:
-                self.move_command = DIR_STRAIGHT
-                return
-            if key == self.keys["left"] and self.move_command != DIR_LEFT:
-                self.key_is_held_down = True
-                self.move_command = DIR_LEFT
-            elif key == self.keys["right"] and self.move_command != DIR_RIGHT:
-                self.key_is_held_down = True
-                self.move_command = DIR_RIGHT
-
-        def on_release(key):
-            if key == self.keys["left"] or key == self.keys["right"]:
-                self.key_is_held_down = False
-                self.move_command = DIR_STRAIGHT
+    def compute_move_command(self, walls):
+        """
+        Adjusts the move-command to the current walls placed on the field and this players position, see
+        decide_move_command.
 
-        self.listener = keyboard.Listener(on_press=on_press, on_release=on_release)
+        :param walls: 2-d numpy array of int8, halo grid of the walls, see Utils.HaloGrid.
+        :return: None
+        """
+        self.move_command = self.decide_move_command(walls=walls, pos=self.pos, angle=self.angle)
 
-    def compute_move_command(self, walls):
+    def decide_move_command(self, walls, pos, angle):
         """
-        Computes an appropriate move-direction according to the current walls placed on the field and this players
-        position.
+        Computes an appropriate move-direction according to the given walls, position and facing angle. The
+        move-command of the player is not changed, so this may run on a snapshot within another thread, see
+        Engine.BotWorkerPoolClass.
 
-        Tis does nothing for the base player class.
+        The base player class keeps its current move-command.
 
-        :param walls: 2-d numpy array array of int,  -1 entries are supposed to be walls.
-        :return: None
+        :param walls: 2-d numpy array of int8, halo grid of the walls, see Utils.HaloGrid.
+        :param pos: tuple of size 2 of int, position of the player.
+        :param angle: int, facing angle of the player.
+        :return: int, move-command (DIR_LEFT, DIR_STRAIGHT or DIR_RIGHT).
         """
-        return
+        return self.move_command
@@ -1,10 +1,10 @@
-from numpy import shape, sqrt
-from pynput import keyboard
+from numpy import sqrt, array, stack
 
 from FieldObjects.PlayerClass import Player
 from Utils.Const import *
-from Utils.HelperFunctions import (stochastic_gradient_descent, is_contained_in_cone, is_point_on_left_side)
-from Utils.TargetFunctions import target_function_cont, target_function_cont_d
+from Utils.HelperFunctions import (is_contained_in_cone, is_point_on_left_side, get_cone_normals,
+                                   get_wall_points_in_window)
+from Utils.TargetFunctions import get_unit_vector_sums, target_function_cont_argmin
 
 
 class PlayerBotContLossStrategy(Player):
@@ -12,57 +12,47 @@ class PlayerBotContLossStrategy(Player):
     Represents one player and stores all player specific Information.
     """
 
-    def __init__(self, name, color, keys={"left": keyboard.Key.left, "right": keyboard.Key.right}, alive=True,
+    def __init__(self, name, color, keys=None, alive=True,
                  speed=SPEED_NORMAL, size=SIZE_NORMAL, flying=False, pos=(100, 100), angle=0):
         """
         Calls the inherited __init__-method
         """
         Player.__init__(self, name, color, keys, alive, speed, size, flying, pos, angle)
 
-        self.busy = False
         self.target_angle = None
         self.target_tolerance = self.turn_rate  # angle difference under which the target is considered as reached.
-        self.scope = 60  # Look-Out number of pixels in each direction of the current position
+        self.scope = 60  # Look-Out number of pixels in each direction of the current position, at most BOT_SCOPE_MAX
 
-    def compute_move_command(self, walls):
+    def decide_move_command(self, walls, pos, angle):
         """
-        Computes an appropriate move-direction according to the current walls placed on the field and this players
-        position.
+        Computes an appropriate move-direction according to the given walls, position and facing angle.
 
-        :param walls: 2-d numpy array array of int,  -1 entries are supposed to be walls.
-        :return: None
+        :param walls: 2-d numpy array of int8, halo grid of the walls, see Utils.HaloGrid.
+        :param pos: tuple of size 2 of int, position of the player.
+        :param angle: int, facing angle of the player.
+        :return: int, move-command (DIR_LEFT, DIR_STRAIGHT or DIR_RIGHT).
         """
-        if self.busy:
-            return
-        elif not self.alive:
+        if not self.alive:
             self.target_angle = None
-            return
+            return self.move_command
 
-        self.busy = True
         self.target_tolerance = self.turn_rate
 
         # compute new target-angle
-        x, y = self.pos
-        field_size, _ = shape(walls)
-        wall_points = [(i, j)
-                       for i in range(x - self.scope, x + self.scope + 1)
-                       for j in range(y - self.scope, y + self.scope + 1)
-                       if walls[i % field_size, j % field_size] == -1]
-        if wall_points:
-            t = stochastic_gradient_descent(f=target_function_cont, deriv=target_function_cont_d,
-                                            x0=self.angle, stepsize=270, samples=wall_points, batchsize=20,
-                                            maxit=15, choose_best=False, **{"pos": self.pos, "lam": 0.0})
-            self.target_angle = round(t) % 360
+        xs, ys = get_wall_points_in_window(walls, pos, self.scope)
+        if len(xs) > 0:
+            # The loss only depends on the sums of the normed wall-points, hence its minimum is known exactly.
+            sum_x, sum_y = get_unit_vector_sums(xs, ys)
+            self.target_angle = round(target_function_cont_argmin(sum_x, sum_y)) % 360
         else:
-            self.target_angle = self.angle
-        self.issue_move_command()
-        self.busy = False
-        return
+            self.target_angle = angle
+        return self.get_move_command_to_target(angle)
 
-    def is_target_angle_reached(self):
+    def is_target_angle_reached(self, angle):
         """
         Check if the target-angle was reached by the last execution of the currently present move-command.
 
+        :param angle: int, facing angle of the player.
         :return: boolean
         """
         # print("----------------------------")
@@ -76,19 +66,19 @@ class PlayerBotContLossStrategy(Player):
         else:
             upper_bound_alt = upper_bound
             lower_bound_alt = lower_bound
-        # print(lower_bound <= self.angle <= upper_bound_alt or lower_bound_alt <= self.angle <= upper_bound)
-        return lower_bound <= self.angle <= upper_bound_alt or lower_bound_alt <= self.angle <= upper_bound
+        # print(lower_bound <= angle <= upper_bound_alt or lower_bound_alt <= angle <= upper_bound)
+        return lower_bound <= angle <= upper_bound_alt or lower_bound_alt <= angle <= upper_bound
 
-    def issue_move_command(self):
+    def get_move_command_to_target(self, angle):
         """
-        Changes the current move command whether the target-angle is reached faster by field left or right turn.
-        If the current target-angle is reached this function makes the player move straight.
+        Decides whether the target-angle is reached faster by field left or right turn.
+        If the current target-angle is reached the player should move straight.
 
-        :return: None
+        :param angle: int, facing angle of the player.
+        :return: int, move-command (DIR_LEFT, DIR_STRAIGHT or DIR_RIGHT).
         """
-        if self.is_target_angle_reached():
-            self.move_command = DIR_STRAIGHT
-            return
+        if self.is_target_angle_reached(angle):
+            return DIR_STRAIGHT
         lower_bound = (self.target_angle - 180) % 360
         upper_bound = self.target_angle
         if upper_bound < lower_bound:
@@ -97,10 +87,9 @@ class PlayerBotContLossStrategy(Player):
         else:
             lower_bound_alt = lower_bound
             upper_bound_alt = upper_bound
-        if lower_bound <= self.angle <= upper_bound_alt or lower_bound_alt <= self.angle <= upper_bound:
-            self.move_command = DIR_RIGHT
-        else:
-            self.move_command = DIR_LEFT
+        if lower_bound <= angle <= upper_bound_alt or lower_bound_alt <= angle <= upper_bound:
+            return DIR_RIGHT
+        return DIR_LEFT
 
 
 class PlayerBotConeStrategy(Player):
@@ -108,7 +97,7 @@ class PlayerBotConeStrategy(Player):
    Represents one player and stores all player specific Information.
    """
 
-    def __init__(self, name, color, keys={"left": keyboard.Key.left, "right": keyboard.Key.right}, alive=True,
+    def __init__(self, name, color, keys=None, alive=True,
                  speed=SPEED_NORMAL, size=SIZE_NORMAL, flying=False, pos=(100, 100), angle=0):
         """
         Calls the inherited __init__-method
@@ -116,62 +105,53 @@ class PlayerBotConeStrategy(Player):
         Player.__init__(self, name, color, keys, alive, speed, size, flying, pos, angle)
 
         self.busy = False
-        self.scope_radius = 80  # radius around pos to consider wall-points
+        self.scope_radius = 80  # radius around pos to consider wall-points, at most BOT_SCOPE_MAX
         self.apex_angle = 40  # apex angle of cone from current position, should be even and be less than 180 degrees.
 
-    def compute_move_command(self, walls):
+    def decide_move_command(self, walls, pos, angle):
         """
-        Computes an appropriate move-direction according to the current walls placed on the field and this players
-        position.
+        Computes an appropriate move-direction according to the given walls, position and facing angle.
 
-        :param walls: 2-d numpy array array of int,  -1 entries are supposed to be walls.
-        :return: None
+        :param walls: 2-d numpy array of int8, halo grid of the walls, see Utils.HaloGrid.
+        :param pos: tuple of size 2 of int, position of the player.
+        :param angle: int, facing angle of the player.
+        :return: int, move-command (DIR_LEFT, DIR_STRAIGHT or DIR_RIGHT).
         """
-        # if self.busy:
-        #     return
-        #  self.busy = True
-        wall_points = self.get_normed_wall_points_in_scope(walls)
+        wall_points = stack(self.get_normed_wall_points_in_scope(walls, pos))  # shape (2, number of wall points)
         angle_step = 10
         tolerance_close_distance = 10
-        danger_score_left = 0.0
-        danger_score_right = 0.0
-        print("---------------------------")
-        # left cone
-        for i, j in wall_points:
-            norm = sqrt(i ** 2 + j ** 2)
-            if (is_contained_in_cone(i, j, facing_angle=self.angle - angle_step, apex_angle=self.apex_angle)
-                    and norm > tolerance_close_distance):
-                danger_score_left -= norm
-            if (is_contained_in_cone(i, j, facing_angle=self.angle + angle_step, apex_angle=self.apex_angle)
-                    and norm > tolerance_close_distance):
-                danger_score_right -= norm
-        x, y = self.pos
-        print("current pos (x, y)=", x, y)
-        print("current angle =", self.angle)
-        print("left: ", danger_score_left)
-        print("right: ", danger_score_right)
+        # print("---------------------------")
+        # Edge normals of the left and the right cone, shape (2 cones, 2 edges, 2 coordinates)
+        normals = array([get_cone_normals(facing_angle=angle - angle_step, apex_angle=self.apex_angle),
+                         get_cone_normals(facing_angle=angle + angle_step, apex_angle=self.apex_angle)])
+        norms = sqrt((wall_points ** 2).sum(axis=0))
+        # A point is contained in a cone if the scalar products with both edge normals are lesser than 0.
+        in_cones = ((normals @ wall_points) < 0).all(axis=1) & (norms > tolerance_close_distance)
+        danger_score_left, danger_score_right = -(in_cones * norms).sum(axis=1)
+        # print("current pos (x, y)=", self.pos)
+        # print("current angle =", self.angle)
+        # print("left: ", danger_score_left)
+        # print("right: ", danger_score_right)
 
         if danger_score_left > danger_score_right:
-            self.move_command = DIR_RIGHT
+            return DIR_RIGHT
         elif danger_score_left < danger_score_right:
-            self.move_command = DIR_LEFT
-        else:
-            self.move_command = DIR_STRAIGHT
-        #  self.busy = False
+            return DIR_LEFT
+        return DIR_STRAIGHT
 
     def compute_move_command_old(self, walls):
         """
         Computes an appropriate move-direction according to the current walls placed on the field and this players
         position.
 
-        :param walls: 2-d numpy array array of int,  -1 entries are supposed to be walls.
+        :param walls: 2-d numpy array of int8, halo grid of the walls, see Utils.HaloGrid.
         :return: None
         """
         if self.busy:
             return
         self.busy = True
 
-        wall_points = self.get_normed_wall_points_in_scope(walls)
+        wall_points = self.get_normed_wall_points_in_scope(walls, self.pos)
         print("---------------------------")
         x, y = self.pos
         print("current pos (x, y)=", x, y)
@@ -180,7 +160,7 @@ class PlayerBotConeStrategy(Player):
         left_score = 0
         right_score = 0
         cone_points = []
-        for i, j in wall_points:
+        for i, j in zip(*wall_points):
             if is_contained_in_cone(i, j, facing_angle=self.angle, apex_angle=self.apex_angle):
                 cone_points.append((i, j))
                 if is_point_on_left_side(self.angle, i, j):
@@ -199,19 +179,14 @@ class PlayerBotConeStrategy(Player):
         print("New move command: ", self.move_command)
         self.busy = False
 
-    def get_normed_wall_points_in_scope(self, walls):
+    def get_normed_wall_points_in_scope(self, walls, pos):
         """
-        Returns a list of 2-D points occurring in a self.scope_radius around the current position moving each point
-        as if self.pos is the origin.
+        Returns the 2-D points occurring in a self.scope_radius around pos moving each point as if pos is the origin.
+        The window around pos wraps around the field borders.
 
-        :param walls: Squared 2-D numpy array of size greater than self.scope_radius.
-        :return: List of tuple of size 2 of int, coordinates from walls where a -1 entry is present.
-        The returned are moved such that their respective origin is self.pos.
+        :param walls: 2-d numpy array of int8, halo grid of the walls, see Utils.HaloGrid.
+        :param pos: tuple of size 2 of int, position of the player.
+        :return: tuple of size 2 of 1-d numpy arrays of int, coordinates from walls where a WALL entry is present.
+        The returned are moved such that their respective origin is pos.
         """
-        # Convention is that walls contains -1 at [x, y] if the canvas pixel (x, y) shows a wall.
-        x, y = self.pos
-        n, _ = shape(walls)
-        return [(i - x, j - y)
-                for i in range(x - self.scope_radius, x + self.scope_radius + 1)
-                for j in range(y - self.scope_radius, y + self.scope_radius + 1)
-                if walls[i % n, j % n] == -1]
+        return get_wall_points_in_window(walls, pos, self.scope_radius)
@@ -0,0 +1,192 @@
+from numpy import zeros, uint8, array, nonzero, asarray, where, newaxis
+
+from Utils.Const import *
+
+TILE_SIZE = 8  # Edge length in pixels of the tiles used to track changed regions of the field.
+
+
+class FieldRenderer:
+    """
+    Draws the game field onto a PhotoImage in as few put calls as possible.
+
+    The renderer keeps an RGB framebuffer of the whole field. All pixels changed during a tick are first painted into
+    the framebuffer while the tiles containing them are marked as dirty. Flushing merges the dirty tiles of every
+    tile-row into horizontal spans and stacks equal spans of consecutive tile-rows into rectangles. Each rectangle is
+    then written as binary PPM data with a single put call, so neither strings of color names have to be built nor
+    parsed by Tk.
+
+    Wall pixels are mirrored from the wall grid and the wall owner grid of the Simulation: Walls of a player are drawn
+    in its color, walls without owner in white.
+
+    Like the walls of the Simulation, the framebuffer stores the pixel (x, y) at [x, y].
+    """
+
+    def __init__(self, image, field_size):
+        """
+        :param image: PhotoImage instance of size field_size x field_size to draw on.
+        :param field_size: int, edge length of the game field in pixels.
+        """
+        self.image = image
+        self.field_size = field_size
+
+        self.colors = {}  # Dict of RGB triples keyed by color name, see self.rgb
+        self.owner_colors = zeros((256, 3), dtype=uint8)  # RGB triple of the walls of every owner id
+        self.owner_colors[OWNER_NONE] = self.rgb("White")
+        self.frame = zeros((field_size, field_size, 3), dtype=uint8)  # RGB triple of every pixel
+        tiles = -(-field_size // TILE_SIZE)
+        self.dirty_tiles = zeros((tiles, tiles), dtype=bool)
+
+    def rgb(self, color):
+        """
+        :param color: string, color name.
+        :return: 1-d numpy array of uint8 of size 3, RGB triple of color. Colors missing in RGB_VALUES are resolved by
+        Tk.
+        """
+        rgb = self.colors.get(color)
+        if rgb is None:
+            if color in RGB_VALUES:
+                rgb = array(RGB_VALUES[color], dtype=uint8)
+            else:
+                # winfo rgb returns 16 bit channels
+                channels = self.image.tk.splitlist(self.image.tk.call("winfo", "rgb", ".", color))
+                rgb = array([int(c) >> 8 for c in channels], dtype=uint8)
+            self.colors[color] = rgb
+        return rgb
+
+    def set_owner_color(self, owner_id, color):
+        """
+        Sets the color the walls of the given owner are drawn with.
+
+        :param owner_id: int, owner id as used in the wall owner grid.
+        :param color: string, color name.
+        :return: None
+        """
+        self.owner_colors[owner_id] = self.rgb(color)
+
+    def paint(self, trace, color):
+        """
+        Paints the given pixels into the framebuffer. They are displayed with the next call of self.flush.
+
+        :param trace: tuple of size 2 of array-like of int (xs, ys) or list of tuple of size 2 of int, pixels to paint.
+        All pixels need to lie within the game field.
+        :param color: string, color name.
+        :return: None
+        """
+        xs, ys = self.split_trace(trace)
+        self.frame[xs, ys] = self.rgb(color)
+        self.dirty_tiles[xs // TILE_SIZE, ys // TILE_SIZE] = True
+
+    def paint_walls(self, trace, walls, wall_owners):
+        """
+        Paints the given pixels into the framebuffer as stored in the wall grids, i.e. in the color of their owner if
+        there is a wall and black otherwise. They are displayed with the next call of self.flush.
+
+        :param trace: tuple of size 2 of array-like of int (xs, ys) or list of tuple of size 2 of int, pixels to paint.
+        :param walls: 2-d numpy array of int8, WALL entries are supposed to be walls.
+        :param wall_owners: 2-d numpy array of uint8, owner ids of the walls.
+        :return: None
+        """
+        xs, ys = self.split_trace(trace)
+        self.frame[xs, ys] = self.owner_colors[wall_owners[xs, ys]] * (walls[xs, ys] == WALL)[:, newaxis]
+        self.dirty_tiles[xs // TILE_SIZE, ys // TILE_SIZE] = True
+
+    def fill(self, rect, color):
+        """
+        Fills a rectangle with a single color. The PhotoImage is updated immediately since a single color is cheap to
+        put regardless of the size of the rectangle.
+
+        :param rect: tuple of size 4 of int, top-left pixel and bottom-right pixel (exclusive) of the rectangle.
+        :param color: string, color name.
+        :return: None
+        """
+        x0, y0, x1, y1 = rect
+        self.frame[x0:x1, y0:y1] = self.rgb(color)
+        self.image.put(data=color, to=rect)
+
+    def reset(self):
+        """
+        Blanks the whole field, i.e. framebuffer and PhotoImage, with a single operation each. Pending changes are
+        discarded.
+
+        :return: None
+        """
+        self.frame[:] = 0
+        self.dirty_tiles[:] = False
+        self.image.blank()
+
+    def redraw(self, walls, wall_owners):
+        """
+        Replaces the whole framebuffer by the given wall grids and displays it with a single put call. Everything that
+        is not a wall, e.g. the player heads, is drawn black.
+
+        :param walls: 2-d numpy array of int8, WALL entries are supposed to be walls.
+        :param wall_owners: 2-d numpy array of uint8, owner ids of the walls.
+        :return: None
+        """
+        self.frame[:] = where((walls == WALL)[:, :, newaxis], self.owner_colors[wall_owners], 0)
+        self.dirty_tiles[:] = False
+        self.put_region(0, 0, self.field_size, self.field_size)
+
+    def put_region(self, x0, y0, x1, y1):
+        """
+        Writes a rectangle of the framebuffer to the PhotoImage as binary PPM data.
+
+        :return: None
+        """
+        header = "P6 {} {} 255\n".format(x1 - x0, y1 - y0).encode()
+        # PPM data is given row by row, hence the framebuffer region needs to be transposed.
+        self.image.put(data=header + self.frame[x0:x1, y0:y1].transpose(1, 0, 2).tobytes(), to=(x0, y0))
+
+    def get_dirty_rects(self):
+        """
+        Merges the dirty tiles into rectangles: Dirty tiles of a tile-row form horizontal spans and equal spans of
+        consecutive tile-rows are joined.
+
+        :return: list of tuple of size 4 of int, rectangles in tile coordinates (x0, y0, x1, y1) with exclusive ends.
+        """
+        rects = []
+        open_spans = {}  # Dict of index in rects of the rectangle ending at the previous tile-row, keyed by span
+        for ty in nonzero(self.dirty_tiles.any(axis=0))[0].tolist():
+            txs = nonzero(self.dirty_tiles[:, ty])[0].tolist()
+            spans = []
+            start = previous = txs[0]
+            for tx in txs[1:]:
+                if tx != previous + 1:
+                    spans.append((start, previous + 1))
+                    start = tx
+                previous = tx
+            spans.append((start, previous + 1))
+
+            next_spans = {}
+            for span in spans:
+                index = open_spans.get(span)
+                if index is not None and rects[index][3] == ty:
+                    x0, y0, x1, _ = rects[index]
+                    rects[index] = (x0, y0, x1, ty + 1)
+                else:
+                    index = len(rects)
+                    rects.append((span[0], ty, span[1], ty + 1))
+                next_spans[span] = index
+            open_spans = next_spans
+        return rects
+
+    def flush(self):
+        """
+        Writes all dirty regions of the framebuffer to the PhotoImage.
+
+        :return: None
+        """
+        for tx0, ty0, tx1, ty1 in self.get_dirty_rects():
+            self.put_region(tx0 * TILE_SIZE, ty0 * TILE_SIZE,
+                            min(tx1 * TILE_SIZE, self.field_size), min(ty1 * TILE_SIZE, self.field_size))
+        self.dirty_tiles[:] = False
+
+    @staticmethod
+    def split_trace(trace):
+        """
+        :param trace: tuple of size 2 of array-like of int (xs, ys) or list of tuple of size 2 of int.
+        :return: tuple of size 2 of 1-d numpy arrays of int, x- and y-coordinates of the trace.
+        """
+        if type(trace) is list:
+            return asarray(trace, dtype=int).reshape(-1, 2).T
+        return asarray(trace[0], dtype=int), asarray(trace[1], dtype=int)
@@ -4,6 +4,8 @@ import sys
 from tkinter import (Tk, Frame)
 
 from Screens import (RuleScreenClass, OptionScreenClass, GameScreenClass, TitleScreenClass)
+from Screens.InputDispatcherClass import InputDispatcher
+from Utils.Const import ALL_ITEMS
 
 
 class GUI(Tk):
@@ -45,6 +47,7 @@ class GUI(Tk):
         container.grid_columnconfigure(0, weight=1)
 
         self.title("Wall Run")
+        self.input_dispatcher = InputDispatcher(self)  # Routes all key events, see InputDispatcher
         # self.iconphoto(False, PhotoImage(file='.png'))
 
         # game related
@@ -58,9 +61,7 @@ class GUI(Tk):
         ]
         self.max_rounds = 5
         # All items registered
-        self.all_items = ["ItemClear", "ItemBlock", "ItemJump", "ItemGlueAll", "ItemSlickSelf", "ItemFly",
-                          "ItemRemoveBorder", "ItemZiggZaggSelf", "ItemZiggZaggAll", "ItemFastAll", "ItemFastSelf",
-                          "ItemSlowAll", "ItemSlowSelf", "ItemRandom", "ItemPackage", "ItemBigAll", "ItemSmallSelf"]
+        self.all_items = list(ALL_ITEMS)
         # All items chosen for the current game. Might be changed by options.
         self.item_names = list(self.all_items)
         # GUI objects
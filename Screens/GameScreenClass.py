@@ -1,28 +1,31 @@
 from datetime import datetime
-from importlib import import_module
 from threading import Thread
 from time import sleep
 from timeit import default_timer
 from tkinter import (Frame, Canvas, PhotoImage, Label, Button,
                      CENTER, DISABLED, NORMAL, NW, LEFT)
 
-from numpy import sin, cos, radians, zeros, ones
-from numpy.random import default_rng
-from pynput import keyboard
-
+from Engine.BotWorkerPoolClass import BotWorkerPool, is_bot
+from Engine.SimulationClass import Simulation
+from Engine.ReplayClass import ReplayRecorder, ReplayPlayer, create_players
+from Engine.SimulationObserver import SimulationObserver
+from Engine.TickProfilerClass import TICK_PHASE
 from Screens import GUI
+from Screens.FieldRendererClass import FieldRenderer
+from Screens.IconCache import load_icons, get_icon
+from Screens.InputLatencyTrackerClass import InputLatencyTracker
 from Utils.Const import *
-from Utils.HelperFunctions import get_rectangle_corners
 
 
-class GameScreen(Frame):
+class GameScreen(Frame, SimulationObserver):
     """
     Contains all elements and functionality for playing the game.
 
     Concerning the actual game field there are two layers to look at: the visual and the effective layer.
     The visual layer consists of field Canvas Object containing field PhotoImage Object where all the pixels are displayed on.
-    The effective layer consists of two 2-dimensional numpy arrays storing the locations of walls and items
-    respectively. For convenience reasons, both layers use the same syntax for location description. This results in
+    The effective layer is owned by a headless Simulation instance which this screen subscribes to and renders.
+    It consists of 2-dimensional numpy arrays storing the locations of walls and an index of the items on the field.
+    For convenience reasons, both layers use the same syntax for location description. This results in
     the second layer being mirrored compared to the first layer. An example:
         Considering the pixel on the first layer at position (x, y), x describing the horizontal location and y the
         vertical location starting in the top left corner. In order for the second layer to align perfectly to that,
@@ -40,22 +43,32 @@ class GameScreen(Frame):
         self.parent = parent
         self.controller = controller
 
-        # reset player scores
-        for p in self.controller.players:
-            p.wins = 0
-
         # -- ATTRIBUTES
-        self.current_round = 0
-        self.max_wins = self.controller.max_rounds
-        self.walls = zeros((self.controller.field_size, self.controller.field_size))
-        self.gap_rate = 100  # Higher means fewer gaps
-        self.gap_length = 4
+        self.simulation = Simulation(controller=self.controller)  # Game logic rendered by this screen
+        self.simulation.subscribe(self)
 
         self.running = False
-        self.tick_count = 0
         self._interval = 1 / 28  # tick interval in seconds
-
-        self.practice_game = False  # If True, every round ends in field draw.
+        self.bot_pool = BotWorkerPool()  # Computes the move-commands of bots in between ticks
+        self._bot_timeout = self._interval / 4  # time in seconds the ticker waits for late bots
+
+        self.recorder = ReplayRecorder(self.simulation)  # Records every round, see save_replay
+        self.replay_player = None  # ReplayPlayer steering the players while a replay is shown, see start_replay
+
+        # -- Tick scheduling
+        self.threaded_ticker = False  # If True, ticks run in a separate thread instead of on the Tk event loop
+        self._after_id = None  # id of the next scheduled call of self.run_frame
+        self._accumulator = 0.0  # elapsed time in seconds that has not been processed as ticks yet
+        self._last_frame = 0.0  # time of the previous call of self.run_frame
+        self._max_catch_up = 5  # maximum number of ticks per frame, further elapsed time is dropped
+
+        # -- Profiling
+        self.profiler = self.simulation.profiler  # Timings of the tick phases, see export_profile
+        self.profiler.budget = self._interval
+        self.profiler.enabled = True
+        self.profile_overlay = False  # If True, the profiler summary is displayed on top of the game field
+        self._overlay_id = None  # canvas text id of the profiler overlay
+        self.latency_tracker = InputLatencyTracker()  # Input-to-screen latencies, reported at the end of every round
 
         # -- Game field
         self.canvas = Canvas(master=self,
@@ -65,6 +78,9 @@ class GameScreen(Frame):
                              )
 
         self.field_image = None  # defined in call of self.initiate_canvas
+        self.renderer = None  # FieldRenderer drawing onto self.field_image, defined in call of self.initiate_canvas
+        self.item_images = {}  # Dict of canvas image ids of the item icons, keyed by item id
+        load_icons(GUI.get_execution_path())  # Decodes every item icon once, see get_icon
 
         self.initiate_canvas()
 
@@ -112,10 +128,25 @@ class GameScreen(Frame):
                             )
         self.bback.grid(row=2, column=11)
 
+        self.bstats = Button(master=self,
+                             text="Stats",
+                             command=self.export_profile,
+                             cnf=button_setting,
+                             )
+        self.bstats.grid(row=2, column=12)
+
+        self.breplay = Button(master=self,
+                              text="Replay",
+                              command=self.save_replay,
+                              cnf=button_setting,
+                              )
+        self.breplay.grid(row=2, column=10)
+
         # -- Game labels
         self.label_info = Label(master=self,
                                 font=self.controller.font_medium,
-                                text="Round {0}\n {1} Points to win".format(self.current_round, self.max_wins),
+                                text="Round {0}\n {1} Points to win".format(self.simulation.current_round,
+                                                                          self.simulation.max_wins),
                                 )
         self.label_info.grid(row=3, column=10, columnspan=3)
 
@@ -129,131 +160,98 @@ class GameScreen(Frame):
         self.player_labels = []
         self.display_ranking()
 
-        # -- Item related
-        self.item_max_count = 6  # Total number of items that is allowed to exist on the field.
-        self.items = zeros((self.controller.field_size, self.controller.field_size), dtype="int")  # Item locations
-        self.items_spawned = {}  # Dict of triple: (item object, PhotoImage of icon, position of top left pixel)
-        self.item_id = 1  # Key for items_spawned dict. Rolling int per round starting at 1.
-        self.items_active = []  # List of tuple of currently active items (item object, expiration tick)
-        self.item_drop_chance = 0.005  # Chance to spawn an item per tick.
-
         # -- Other
         self.thread_jobs = None  # will be defined in start_round
-        self.player_dot_traces = None  # will be defined in initialise_new_round
-        self.rng = default_rng()  # RNG object
-
-        # -- Listeners for space bar
-        self.listener_space = None
+        self.input_dispatcher = self.controller.input_dispatcher  # Routes the keys of players and the space bar
 
     # ########################################
-    # Player related functions
+    # Simulation observer functions
     # ########################################
 
-    def place_player(self, p, pos=None, angle=None):
+    def on_round_initialised(self):
         """
-        This function places player p on the game field at position pos.
-        In fact this function updates the coordinates of the player-object to pos
-        and additionally adds field tail-wall to the class-attribute walls.
-        It also resets all player attributes to its defaults.
+        Cleans the canvas for the new round.
+
+        :return: None
+        """
+        self.clear_canvas()
+        self.latency_tracker.reset()
+
+    def on_player_placed(self, p, tail_trace):
+        """
+        Draws the tail and the head of the freshly placed player p.
 
-        :param p: Player Object to be placed.
-        :param pos: Position to place the player as tuple of size 2 of int.
-        If None, each coordinate is randomly chosen from [tol, field_size - tol],
-        where tol is 10% of the field size.
-        :param angle: angle the player faces, default None (which is random angle).
         :return: None
         """
-        # set move command of each player to STRAIGHT and make alive
-        p.move_command = DIR_STRAIGHT
-        p.speed = SPEED_NORMAL
-        p.turn_rate = RATE_NORMAL
-        p.size = SIZE_NORMAL
-        p.key_is_held_down = False
-
-        p.alive = True
-        # Set facing angle.
-        if angle is None:
-            p.angle = self.rng.integers(0, 360)
-        else:
-            p.angle = angle
-
-        # Set position
-        if pos is None:
-            tol = int(self.controller.field_size * 0.1)
-            p.pos = (self.rng.integers(tol, self.controller.field_size - tol, endpoint=True),
-                     self.rng.integers(tol, self.controller.field_size - tol, endpoint=True)
-                     )
-        else:
-            p.pos = pos
-
-        # p.dot_trace = self.dot_trace(pos=p.pos, r=p.size)
-        p.dot_trace, p.data_strings, p.rect_corners = self.dot_trace_string_data_rect_corners(pos=p.pos,
-                                                                                              r=p.size,
-                                                                                              color=p.color)
-        # get wall trace
-        tail_len = 12
-        tail_trace = self.way_trace(dot_trace=p.dot_trace, dist=tail_len,
-                                    angle=(p.angle + 180) % 360, sparse=max(1, int(p.size / 2))
-                                    )
-        # update walls
-        for c in [x for x in tail_trace if x not in p.dot_trace]:  # prevent crash with own way trace
-            self.walls[c] = -1
         # draw trace
-        self.put_trace(trace=tail_trace, color=p.color)
+        self.renderer.set_owner_color(p.owner_id, p.color)
+        self.renderer.paint_walls(trace=tail_trace, walls=self.simulation.walls,
+                                  wall_owners=self.simulation.wall_owners)
         # draw head
-        # self.put_trace(trace=p.dot_trace, color="White")
-        self.field_image.put(data=p.data_strings[0].replace(p.color, "White"), to=p.rect_corners[0])
+        self.renderer.paint(trace=p.dot_trace, color="White")
+        self.renderer.flush()
 
-    # ########################################
-    # Item related functions
-    # ########################################
+    def on_tick_started(self):
+        """
+        Applies the key events since the previous tick to the players.
 
-    def remove_item(self, item_id):
+        :return: None
         """
-        Removes an item from the field by its round specific id, both visually and effectively.
+        for p, timestamp in self.input_dispatcher.dispatch():
+            self.latency_tracker.on_input_applied(p, timestamp)
 
-        :param item_id: int, id of the item to remove. Needs to be present in self..items_spawned.
-        :return: triple (removed item instance, item icon, pos)
+    def on_players_moved(self, old_dot_traces):
         """
-        item_to_remove, icon, pos = self.items_spawned.pop(item_id)
-        x, y = pos
-        self.items[x:x + ITEMSIZE, y:y + ITEMSIZE] = 0
-        return item_to_remove, icon, pos
+        Draws the new player positions.
+
+        :return: None
+        """
+        self.latency_tracker.on_players_moved(old_dot_traces.keys())
+        self.update_visuals(old_dot_traces)
+
+    def on_walls_cleared(self):
+        """
+        Removes all walls but the border visually.
 
-    def create_item_by_name(self, name):
+        :return: None
+        """
+        self.renderer.fill(rect=(1, 1, self.controller.field_size - 1, self.controller.field_size - 1), color="Black")
+
+    def on_border_toggled(self, on):
+        """
+        Updates the visuals for the surrounding walls.
+
+        :return: None
         """
-        Creates field random item instance among all registered items and returns it.
+        self.display_border(on=on)
 
-        :param name: string, name of the item-class
-        :return: Item instance of given class name.
+    def on_block_placed(self, rect):
         """
+        Draws a block of walls.
 
-        item_module = import_module("FieldObjects.Items." + name)
-        item_class = getattr(item_module, name)
-        return item_class(self.controller, self)
+        :return: None
+        """
+        self.renderer.fill(rect=rect, color="White")
 
-    def place_item(self, name, pos):
+    def on_item_placed(self, item_id, item, pos):
         """
-        Places the item identified by name on the game field at pos. This function also draws the item on the canvas
-        and removes the oldest item on the field, if the maximum number of items is reached.
+        Draws the icon of the placed item on the canvas.
 
-        :param name: String, Class name of the item to place.
-        :param pos: Tuple of size 2 of int, position on the game field to place the item.
         :return: None
         """
-        # -- Create and store item
-        item_to_place = self.create_item_by_name(name)
-        icon = PhotoImage(file=GUI.get_execution_path() + "/" + item_to_place.image_path)
-        self.items_spawned[self.item_id] = (item_to_place, icon, pos)
-        # -- Place item on the field
-        # visually
+        icon = get_icon(GUI.get_execution_path(), item.image_path)
         x, y = pos
         offset = (self.controller.canvas_size - self.controller.field_size) / 2  # Offset between canvas and game field.
-        self.canvas.create_image(offset + x, offset + y, image=icon, anchor=NW)  # Icon is put un CANVAS not field
-        # effectively
-        self.items[x:x + ITEMSIZE, y:y + ITEMSIZE] = self.item_id
-        # -- Increase item item_id
-        self.item_id = self.item_id + 1
+        image_id = self.canvas.create_image(offset + x, offset + y, image=icon, anchor=NW)  # Icon is put on CANVAS
+        self.item_images[item_id] = image_id
+
+    def on_item_removed(self, item_id):
+        """
+        Removes the icon of the removed item from the canvas.
+
+        :return: None
+        """
+        self.canvas.delete(self.item_images.pop(item_id))
 
     # ########################################
     # Canvas and window related functions
@@ -294,7 +292,8 @@ class GameScreen(Frame):
             row += 1
 
     def initiate_canvas(self):
-        self.walls = zeros((self.controller.field_size, self.controller.field_size))
+        self.item_images = {}
+        self._overlay_id = None
         self.canvas.destroy()
         self.canvas = Canvas(master=self,
                              width=self.controller.canvas_size,
@@ -306,14 +305,27 @@ class GameScreen(Frame):
         self.field_image = PhotoImage(width=self.controller.field_size,
                                       height=self.controller.field_size,
                                       )
+        self.renderer = FieldRenderer(image=self.field_image, field_size=self.controller.field_size)
+        for p in self.controller.players:
+            if p.owner_id != OWNER_NONE:
+                self.renderer.set_owner_color(p.owner_id, p.color)
+        self.renderer.redraw(walls=self.simulation.walls, wall_owners=self.simulation.wall_owners)
 
         self.canvas.create_image((self.controller.canvas_size / 2, self.controller.canvas_size / 2),
                                  image=self.field_image,
                                  anchor=CENTER,
                                  )
 
-        self.toggle_border(on=True)
-        self.display_border()
+    def clear_canvas(self):
+        """
+        Removes all item icons and blanks the game field. The canvas and its PhotoImage are reused.
+
+        :return: None
+        """
+        for image_id in self.item_images.values():
+            self.canvas.delete(image_id)
+        self.item_images = {}
+        self.renderer.reset()
 
     def display_border(self, on=True):
         """
@@ -327,232 +339,65 @@ class GameScreen(Frame):
         else:
             color = "Black"
         # left border
-        self.field_image.put(data=color, to=(0, 0, 1, self.controller.field_size))
+        self.renderer.fill(rect=(0, 0, 1, self.controller.field_size), color=color)
         # top border
-        self.field_image.put(data=color, to=(0, 0, self.controller.field_size, 1))
+        self.renderer.fill(rect=(0, 0, self.controller.field_size, 1), color=color)
         # right border
-        self.field_image.put(data=color, to=(0, self.controller.field_size - 1,
-                                             self.controller.field_size - 1, self.controller.field_size))
+        self.renderer.fill(rect=(0, self.controller.field_size - 1,
+                                 self.controller.field_size - 1, self.controller.field_size), color=color)
         # bottom border
-        self.field_image.put(data=color, to=(self.controller.field_size - 1, 0,
-                                             self.controller.field_size, self.controller.field_size))
+        self.renderer.fill(rect=(self.controller.field_size - 1, 0,
+                                 self.controller.field_size, self.controller.field_size), color=color)
 
     # ########################################
-    # Movement and functional functions
+    # Input functions
     # ########################################
 
-    def dot_trace(self, pos, r):
+    def bind_space(self, act):
         """
-        Creates field list of coordinates that represent field circle of radius r on field 2d grid.
-        This function respects the borders of the game field.
+        Binds the space key to init or start or pause field round, replacing the previous binding.
 
-        :param pos: center of dot as tuple of size 2 of int
-        :param r: radius is pixels as int
-        :return: list
-        """
-        # check all pixels in square
-        X, Y = pos
-        trace = []
-        for x, y in [(x, y) for x in range(X - r, X + r + 1) for y in range(Y - r, Y + r + 1)]:
-            if (x - X) ** 2 + (y - Y) ** 2 < r:
-                # append if pixel is in circle around pos
-                trace.append((x % self.controller.field_size,
-                              y % self.controller.field_size)
-                             )
-        return trace
-
-    def dot_trace_string_data_rect_corners(self, pos, r, color):
-        """
-        Computes field string containing the information for drawing field dot with the native PhotoImage put function.
-        The returned string-data does not cross the game field border.
-        """
-        crossing_bot = []
-        crossing_bot_left = []
-        crossing_bot_right = []
-        crossing_top = []
-        crossing_top_left = []
-        crossing_top_right = []
-        crossing_left = []
-        crossing_right = []
-        crossing_nothing = []
-        crossing_sets = [crossing_bot, crossing_bot_left, crossing_bot_right, crossing_top, crossing_top_left,
-                         crossing_top_right, crossing_left, crossing_right, crossing_nothing]
-
-        X, Y = pos
-        dot_trace = []
-        for x, y in [(x, y) for x in range(X - r, X + r + 1) for y in range(Y - r, Y + r + 1)]:
-            if (x - X) ** 2 + (y - Y) ** 2 <= r:
-                # Decide if and where pixels cross the field-border
-                if x < 0 and y < 0:
-                    crossing_top_left.append((x % self.controller.field_size, y % self.controller.field_size))
-                elif x < 0 and y >= self.controller.field_size:
-                    crossing_bot_left.append((x % self.controller.field_size, y % self.controller.field_size))
-                elif x >= self.controller.field_size and y < 0:
-                    crossing_top_right.append((x % self.controller.field_size, y % self.controller.field_size))
-                elif x >= self.controller.field_size and y >= self.controller.field_size:
-                    crossing_bot_right.append((x % self.controller.field_size, y % self.controller.field_size))
-                elif x < 0 and not y < 0 and not y >= self.controller.field_size:
-                    crossing_left.append((x % self.controller.field_size, y % self.controller.field_size))
-                elif x >= self.controller.field_size and not y < 0 and not y >= self.controller.field_size:
-                    crossing_right.append((x % self.controller.field_size, y % self.controller.field_size))
-                elif not x < 0 and not x >= self.controller.field_size and y < 0:
-                    crossing_top.append((x % self.controller.field_size, y % self.controller.field_size))
-                elif not x < 0 and not x >= self.controller.field_size and y >= self.controller.field_size:
-                    crossing_bot.append((x % self.controller.field_size, y % self.controller.field_size))
-                else:
-                    crossing_nothing.append((x % self.controller.field_size, y % self.controller.field_size))
-                dot_trace.append((x % self.controller.field_size, y % self.controller.field_size))
-
-        # ----- create string-data for PhotoImage's put method.
-        # Roll through every pixel of the square in the respective crossing set
-        data_strings = []
-        rect_corners = []
-        for crossing_set in crossing_sets:
-            if not crossing_set:
-                continue
-            data_string = ""
-            a, b, x, y = get_rectangle_corners(crossing_set)
-            for i in range(a, x + 1):  # x-axis roll-through
-                data_string += "{"
-                for j in range(b, y + 1):  # y-axis roll-through
-                    if (i, j) in crossing_set:
-                        data_string += color + " "
-                    else:
-                        # data_string += "#{:02x}{:02x}{:02x}".format(*self.field_image.get(i, j)) + " "
-                        data_string += "Black" + " "
-                data_string += "} "
-            data_strings.append(data_string)
-            rect_corners.append((a, b, x + 1, y + 1))
-
-        return dot_trace, data_strings, rect_corners
-
-    def get_target_pixel(self, pos, dist, angle):
-        """
-        Computes the pixel that is reached after going from pos in direction of angle for field distance of dist.
-
-        :param pos: starting position, tuple of size 2 of int
-        :param dist: walking distance, int
-        :param angle: int in [0, 359), directional angle: 0 is facing east, 90 is facing south etc.
-        :return: tuple of size 2 of int.
-        """
-        x, y = pos
-        rad = radians(angle % 360)
-        return ((x + round(cos(rad) * dist)) % self.controller.field_size,
-                (y + round(sin(rad) * dist)) % self.controller.field_size
-                )
-
-    def way_trace(self, dot_trace, dist, angle, sparse=1):
-        """
-        Computes field list of positions if one starts from each position in dot_trace
-        and goes field distance of dist facing the given angle.
-
-        :param dot_trace: list of tuple of size 2 of int or tuple of size 2
-        :param dist: distance to go, int
-        :param angle: facing angle, int
-        :param sparse: level of denseness between points, lower is denser. int > 0. default 1.
-        :return: list of coordinates
-        """
-        way_trace = []
-        for pix in dot_trace:
-            for d in range(dist):
-                if d % sparse == 0:
-                    way_trace.append(self.get_target_pixel(pos=pix,
-                                                           dist=d,
-                                                           angle=angle
-                                                           )
-                                     )
-        return way_trace
-
-    def toggle_border(self, on=True):
-        """
-        Toggles surrounding walls in numpy array on and off. No visual effect is applied.
-
-        :param on: boolean, If True, walls are turned on. Off otherwise.
+        :param act: string, type of action the space key should have (use "init". "go" or "pause").
         :return: None
         """
-        if on:
-            self.walls[0, :] = -ones(self.controller.field_size)
-            self.walls[-1, :] = -ones(self.controller.field_size)
-            self.walls[:, 0] = -ones(self.controller.field_size)
-            self.walls[:, -1] = -ones(self.controller.field_size)
-        else:
-            self.walls[0, :] = zeros(self.controller.field_size)
-            self.walls[-1, :] = zeros(self.controller.field_size)
-            self.walls[:, 0] = zeros(self.controller.field_size)
-            self.walls[:, -1] = zeros(self.controller.field_size)
-
-    # ########################################
-    # Listener functions
-    # ########################################
+        actions = {"go": self.start_round, "init": self.initialise_new_round, "pause": self.pause_round}
+        self.input_dispatcher.bind_action("space", actions[act])
 
-    def make_listener(self, act):
+    def unbind_space(self):
         """
-        Makes field listener for the space key to init or start or pause field round. It also stops the old listener.
+        Removes the action of the space key.
 
-        :param act: string, type of action the listener should have (use "init". "go" or "pause").
         :return: None
         """
-        self.turn_off_space_listener()
-        if act == "go":
-            def on_press(key):
-                if key == keyboard.Key.space:
-                    self.start_round()
-                    return False
+        self.input_dispatcher.unbind_action("space")
 
-            self.listener_space = keyboard.Listener(on_press=on_press)
-        elif act == "init":
-            def on_press(key):
-                if key == keyboard.Key.space:
-                    self.initialise_new_round()
-                    return False
-
-            self.listener_space = keyboard.Listener(on_press=on_press)
-        elif act == "pause":
-            def on_press(key):
-                if key == keyboard.Key.space:
-                    self.pause_round()
-                    return False
-
-            self.listener_space = keyboard.Listener(on_press=on_press)
-
-    def turn_off_space_listener(self):
+    def bind_players(self):
         """
-        Turns of the game-screen owned listener listener_space.
+        Routes the keys of all human players to them. While a replay is shown, the players follow the replay only.
+
         :return: None
         """
-        try:
-            self.listener_space.stop()
-            # self.listener_space.join()
-        except AttributeError:
-            pass
-        except RuntimeError:  # If thread not started yet
-            pass
+        if self.replay_player is None:
+            self.input_dispatcher.bind_players([p for p in self.controller.players if not is_bot(p)])
 
-    def turn_off_player_listeners(self):
+    def unbind_players(self):
         """
-        This function turns off all player listeners (movement controls) and resets their facing-directions.
+        Stops routing keys to the players (movement controls) and resets their facing-directions.
 
-        :return:
+        :return: None
         """
+        self.input_dispatcher.unbind_players()
         for p in self.controller.players:
             p.move_command = DIR_STRAIGHT
-            try:
-                p.listener.stop()
-                # p.listener.join()
-            except AttributeError:
-                pass
-            except RuntimeError:  # If thread not started yet
-                pass
 
-    def turn_off_all_listeners(self):
+    def unbind_all_keys(self):
         """
-        This function turns of all player control-listeners and pause-listeners.
+        Unbinds the movement controls of all players and the space key.
 
         :return: None
         """
-        # Player listeners
-        self.turn_off_player_listeners()
-        self.turn_off_space_listener()
+        self.unbind_players()
+        self.unbind_space()
 
     # ########################################
     # Meta / button functions
@@ -561,7 +406,7 @@ class GameScreen(Frame):
     def set_buttons(self, state):
         """
         Sets the buttons on the window according to the given state.
-        It also activates field listener with the according action on the space key if state is "go", "pause" or "init".
+        It also binds the according action to the space key if state is "go", "pause" or "init".
 
         :param state: String, "go" yields buttons which can unpause the round, "pause" yields buttons which can pause
         the game, "init" yields buttons which can initiate field new round and "off" turns all buttons off.
@@ -570,22 +415,19 @@ class GameScreen(Frame):
         if state == "go":
             self.bgopause.config(text="Go", command=self.start_round, state=NORMAL)
             self.binit.config(state=DISABLED)
-            self.make_listener(act="go")
-            self.listener_space.start()
+            self.bind_space(act="go")
         elif state == "pause":
             self.bgopause.config(text="Pause", command=self.pause_round, state=NORMAL)
             self.binit.config(state=DISABLED)
-            self.make_listener(act="pause")
-            self.listener_space.start()
+            self.bind_space(act="pause")
         elif state == "init":
             self.bgopause.config(text="Pause", command=self.pause_round, state=DISABLED)
             self.binit.config(state=NORMAL)
-            self.make_listener(act="init")
-            self.listener_space.start()
+            self.bind_space(act="init")
         elif state == "off":
             self.bgopause.config(text="Go", command=self.start_round, state=DISABLED)
             self.binit.config(state=DISABLED)
-            self.turn_off_space_listener()
+            self.unbind_space()
         else:
             raise ValueError("The parameter state must be 'go', 'pause', 'init' or 'off' but was '" + state + "'.")
 
@@ -596,61 +438,60 @@ class GameScreen(Frame):
 
         :return: None.
         """
-        self.current_round += 1
+        if self.replay_player is not None:
+            self.simulation.unsubscribe(self.replay_player)
+            self.replay_player = None
+        # Clear items and walls, clean canvas and place players
+        self.simulation.initialise_round()
         self.label_info.config(
-            text="Round {0}\n {1} Points to win".format(self.current_round, self.max_wins),
+            text="Round {0}\n {1} Points to win".format(self.simulation.current_round, self.simulation.max_wins),
             fg="Black"
         )
-        # Clear items
-        self.reset_all_items()
-        # clean canvas
-        self.initiate_canvas()
         # Buttons
         self.set_buttons(state="go")
-        # Placing players
-        for p in self.controller.players:
-            # Put player on field
-            self.place_player(p)
 
     def start_round(self):
         """
-        Starts the session by enabling all players movement listeners and starts the movement actions.
+        Starts the session by binding the movement keys of all players and starts the movement actions.
 
         :return: None
         """
         # Buttons
         self.set_buttons(state="pause")
-        # Activate players listeners
-        for p in self.controller.players:
-            p.make_listener()
-            p.listener.start()
+        # Route the players' keys
+        self.bind_players()
 
         # Initiate periodic events
         self.running = True
-        # Separate thread init for periodic jobs
-        self.thread_jobs = Thread(group=None,
-                                  target=self.ticker,
-                                  name="periodic_tasks",
-                                  daemon=True
-                                  )
-        self.thread_jobs.start()
+        if self.threaded_ticker:
+            # Separate thread init for periodic jobs
+            self.thread_jobs = Thread(group=None,
+                                      target=self.ticker,
+                                      name="periodic_tasks",
+                                      daemon=True
+                                      )
+            self.thread_jobs.start()
+        else:
+            self.start_frames()
 
     def pause_round(self):
         """
-        Stops the move jobs and all player movement listeners and activates buttons in order to restart the round again.
+        Stops the move jobs, unbinds all player movement keys and activates buttons in order to restart the round again.
 
         :return: None
         """
         self.running = False
+        self.stop_frames()
         # Buttons
         self.set_buttons(state="go")
-        # Player listeners
-        self.turn_off_player_listeners()
+        # Player keys
+        self.unbind_players()
 
     def back(self):
         self.running = False
-        self.turn_off_all_listeners()
-        self.reset_all_items()
+        self.stop_frames()
+        self.unbind_all_keys()
+        self.simulation.reset_all_items()
         self.controller.show_frame("Title")
 
     def screenshot(self, ):
@@ -662,10 +503,159 @@ class GameScreen(Frame):
         # img.save(path)
         print("Wrote screenshot to " + path)
 
+    def save_replay(self):
+        """
+        Writes the replay of the current or latest round next to the screenshots.
+
+        :return: None
+        """
+        if self.recorder.replay is None:
+            return
+        path = GUI.get_execution_path() + "/" + "wallrun_" + "{:%Y-%m-%d-%H-%M-%S}".format(datetime.now()) + ".wrr"
+        self.recorder.replay.save(path)
+        print("Wrote replay to " + path)
+
+    def start_replay(self, replay):
+        """
+        Prepares showing a recorded round on this screen, which is started like any other round. The players of the
+        controller are replaced by players named and colored as in the replay that only follow the recorded
+        move-commands.
+
+        :param replay: Replay instance.
+        :return: None
+        """
+        self.controller.players = create_players(replay)
+        if self.replay_player is not None:
+            self.simulation.unsubscribe(self.replay_player)
+        # The replay player needs to set the move-commands before the recorder reads them.
+        self.simulation.unsubscribe(self.recorder)
+        self.replay_player = ReplayPlayer(replay)
+        self.simulation.subscribe(self.replay_player)
+        self.simulation.subscribe(self.recorder)
+        self.replay_player.prepare_round(self.simulation)
+        self.label_info.config(text="Replay\n {0} ticks".format(replay.ticks), fg="Black")
+        self.display_ranking()
+        self.set_buttons(state="go")
+
+    def export_profile(self):
+        """
+        Writes the tick timings as JSON and CSV file and the input latencies as CSV file next to the screenshots and
+        toggles the on-screen overlay showing the tick timings.
+
+        :return: None
+        """
+        path = GUI.get_execution_path() + "/" + "wallrun_profile_" + "{:%Y-%m-%d-%H-%M-%S}".format(datetime.now())
+        self.profiler.export(path + ".json")
+        self.profiler.export(path + ".csv")
+        self.latency_tracker.samples.export(path + "_latency.csv")
+        print("Wrote tick timings to " + path + ".json and .csv and input latencies to " + path + "_latency.csv")
+        self.profile_overlay = not self.profile_overlay
+        self.update_profile_overlay()
+
+    def update_profile_overlay(self):
+        """
+        Displays the current profiler summary on top of the game field or removes it if self.profile_overlay is False.
+
+        :return: None
+        """
+        if self._overlay_id is not None:
+            self.canvas.delete(self._overlay_id)
+            self._overlay_id = None
+        if self.profile_overlay:
+            self._overlay_id = self.canvas.create_text(10, 10, text=self.profiler.format_overlay(), anchor=NW,
+                                                       fill="Grey", font=("Courier", int(9 * self.controller.scale)))
+
     # ########################################
     # Ticker functions
     # ########################################
 
+    def start_frames(self):
+        """
+        Starts driving the ticks by the Tk event loop, see self.run_frame.
+
+        :return: None
+        """
+        self.bot_pool.start(self.controller.players)
+        self.notify_players()
+        self._accumulator = 0.0
+        self._last_frame = default_timer()
+        self._after_id = self.after(int(self._interval * 1000), self.run_frame)
+
+    def stop_frames(self):
+        """
+        Cancels the next scheduled frame and stops the bot workers. Does nothing if no frames are scheduled.
+
+        :return: None
+        """
+        if self._after_id is None:
+            return
+        self.after_cancel(self._after_id)
+        self._after_id = None
+        self.bot_pool.stop()
+
+    def run_frame(self):
+        """
+        Processes one frame on the Tk event loop using a fixed timestep: The elapsed time since the previous frame is
+        added to an accumulator and one tick is performed per tick interval it contains. This way the simulation
+        catches up if a frame was late, while the screen is only updated once per frame. If more than
+        self._max_catch_up ticks are due, the remaining time is dropped instead of stalling the event loop.
+
+        :return: None
+        """
+        self._after_id = None
+        if not self.running:
+            self.bot_pool.stop()
+            return
+        now = default_timer()
+        self._accumulator += now - self._last_frame
+        self._last_frame = now
+        if self._accumulator >= (self._max_catch_up + 1) * self._interval:
+            print("Tick processing took too long!"
+                  "\nTick: {}, dropped: {} s".format(self.simulation.tick_count,
+                                                     round(self._accumulator - self._max_catch_up * self._interval, 4)))
+            self._accumulator = self._max_catch_up * self._interval
+
+        while self._accumulator >= self._interval:
+            self._accumulator -= self._interval
+            if self.process_tick():
+                self.flush()
+                self.running = False
+                self.bot_pool.stop()
+                self.unbind_all_keys()
+                self.solve_round_end()
+                return
+        with self.profiler.measure("flush"):
+            self.flush()  # Skipped frames of catch-up ticks are displayed at once
+        if self.profile_overlay and self.simulation.tick_count % 14 == 0:
+            self.update_profile_overlay()
+        delay = int((self._interval - self._accumulator) * 1000)
+        self._after_id = self.after(max(1, delay), self.run_frame)
+
+    def process_tick(self):
+        """
+        Performs one tick including the bot decisions and measures it.
+
+        :return: bool, True if the round is over, False otherwise.
+        """
+        with self.profiler.measure(TICK_PHASE):
+            # Bots worked on the previous request in between ticks. Late bots keep their last move-command.
+            with self.profiler.measure("bots"):
+                self.bot_pool.collect(self.simulation.tick_count, self._bot_timeout)
+            if self.simulation.tick():  # Moves players, paints visuals and checks events
+                return True
+            with self.profiler.measure("bot_requests"):
+                self.notify_players()
+        return False
+
+    def flush(self):
+        """
+        Displays all changes of the game field since the previous flush.
+
+        :return: None
+        """
+        self.renderer.flush()
+        self.latency_tracker.on_flushed()
+
     def ticker(self):
         """
         Collects all jobs that have to be done every tick.
@@ -673,163 +663,66 @@ class GameScreen(Frame):
 
         :return: None
         """
+        self.bot_pool.start(self.controller.players)
+        self.notify_players()
         while self.running:
             start = default_timer()
-            # print("Current Tick:", self.tick_count)
-            self.tick_count += 1
-            old_traces = self.move()
-            # move = default_timer()
-            # print("Time for move:", move - start)
-            self.update_visuals(old_traces)
-            self.check_events()
-            if self.check_round_end():
+            # print("Current Tick:", self.simulation.tick_count)
+            if self.process_tick():  # Moves players, updates visuals and checks events
+                self.flush()
                 self.running = False
-                self.turn_off_all_listeners()
+                self.unbind_all_keys()
                 self.solve_round_end()
                 break
+            with self.profiler.measure("flush"):
+                self.flush()
             update = default_timer()
             # print("Time for update:", update - move)
             if self._interval - (update - start) < 0:
                 print("Tick processing took too long!"
-                      "\nTick: {}, wanted: {}, actual: {}".format(self.tick_count,
+                      "\nTick: {}, wanted: {}, actual: {}".format(self.simulation.tick_count,
                                                                   round(self._interval, 4),
                                                                   round(update - start, 4)))
             sleep(max([0, self._interval - (update - start)]))
+        self.bot_pool.stop()
 
-    def move(self):
+    def update_visuals(self, old_dot_traces):
         """
-        This function moves every player by one step according to their current position, speed, angle and
-        move command. It also updates the walls with the way traces and returns field list of all the old player positions.
+        Draws the current position of each player on the canvas. All changes are collected by the renderer and
+        displayed with the next flush of the renderer, which happens once per frame.
 
-        :return: dict of list of tuple of int of size 2.
-        """
-        old_data_strings_rect_corners = {}
-        for p in self.controller.players:
-            if not p.alive:
-                continue
-            if p.move_command == DIR_LEFT:
-                p.angle = (p.angle - p.turn_rate) % 360
-            elif p.move_command == DIR_RIGHT:
-                p.angle = (p.angle + p.turn_rate) % 360
-            # ## Reset turn rate for 90 degree players
-            if p.turn_rate == RATE_RIGHT_ANGLE:
-                p.move_command = DIR_STRAIGHT
-            # ## compute new position
-            p.pos = self.get_target_pixel(pos=p.pos, dist=p.speed, angle=p.angle)
-            # ## update new dot trace
-            p.update_tolerance_heads()  # store current (old) dot-trace for tolerance computation
-            old_dot_trace = p.dot_trace
-            old_data_strings_rect_corners[p] = (p.data_strings, p.rect_corners)
-            p.dot_trace, p.data_strings, p.rect_corners = self.dot_trace_string_data_rect_corners(pos=p.pos,
-                                                                                                  r=p.size,
-                                                                                                  color=p.color)
-            p.compute_collision_head()  # compute the current collision head
-            # ## update walls
-            if self.tick_count % self.gap_rate > self.gap_length and not p.flying:
-                for pix in old_dot_trace:  # [c for c in p.dot_trace if c not in p.dot_trace]:
-                    self.walls[pix] = -1
-        return old_data_strings_rect_corners
-
-    def check_events(self):
-        """
-        This function performs various checks and acts accordingly:
-            1. Check collisions with walls -> kill player
-            2. Check collision with items -> activate items
-            3. Check item expiration -> deactivate items
-            4. Spawn new items by chance
+        :param old_dot_traces: dict of dot-traces of the previous positions keyed by player.
         :return: None
         """
-        # Check crashes with walls and items
-        for p in self.controller.players:
-            if p.alive:
-                for pix in p.collision_head:
-                    # Walls
-                    if self.walls[pix] == -1 and not p.flying and not p.pixel_in_tolerance(pix):
-                        p.alive = False
-                        break
-                    # Items
-                    if p.alive and self.items[pix] > 0:
-                        item_id = self.items[pix]
-                        item, _, pos = self.remove_item(item_id)  # Remove item from field and item-matrix
-                        # activate item
-                        self.items_active.append((item, self.tick_count + item.duration))
-                        item.activate(player=p)  # Activate the effect
-                        break
-        # Check to deactivate items
-        for tup in self.items_active:
-            item, end = tup
-            if end <= self.tick_count:
-                item.deactivate()
-                self.items_active.remove(tup)
-        # Place items
-        if self.item_max_count > 0 and self.rng.random() < self.item_drop_chance:
-            # Remove oldest item if the max count is reached.
-            if self.item_max_count <= len(self.items_spawned):
-                oldest_id = min(self.items_spawned.keys())
-                self.remove_item(oldest_id)
-            x_rand = self.rng.integers(ITEMSIZE, self.controller.field_size - ITEMSIZE)
-            y_rand = self.rng.integers(ITEMSIZE, self.controller.field_size - ITEMSIZE)
-            self.place_item(name=self.rng.choice(self.controller.item_names), pos=(x_rand, y_rand))
-
-    def update_visuals(self, old_data_strings_rect_corners):
-        """
-        Draws the current position of each player on the canvas.
-        """
         # Draw player traces and dots.
         for p in self.controller.players:
-            if not p.alive:
+            if p not in old_dot_traces:
                 continue
-            # draw old position if player is not flying
-            old_data_strings, old_rect_corners = old_data_strings_rect_corners[p]
-            if self.tick_count % self.gap_rate > self.gap_length and not p.flying:
-                for data_string, rect_corners in zip(old_data_strings, old_rect_corners):
-                    self.field_image.put(data=data_string, to=rect_corners)
-            else:
-                for data_string, rect_corners in zip(old_data_strings, old_rect_corners):
-                    self.field_image.put(data=data_string.replace(p.color, "Black"), to=rect_corners)
+            # draw old position as wall or, if the player did not draw a wall, restore what is underneath
+            self.renderer.paint_walls(trace=old_dot_traces[p], walls=self.simulation.walls,
+                                      wall_owners=self.simulation.wall_owners)
 
             # draw new player head
-            if p.flying and self.tick_count % 4 in [2, 3]:
+            if p.flying and self.simulation.tick_count % 4 in [2, 3]:
                 # Player is flying. Do not print every 3rd and 4th head position.
                 pass
             else:
                 # Player is not flying. Print head as usual.
-                for data_string, rect_corners in zip(p.data_strings, p.rect_corners):
-                    self.field_image.put(data=data_string.replace(p.color, "White"),
-                                         to=rect_corners)
+                self.renderer.paint(trace=p.dot_trace, color="White")
 
     def notify_players(self):
         """
-        Calls every players compute_move_command method if the player is marked as human player.
-        This will make non-human players adjust their current move-command. The computations will take place in field
-        separate thread which this function invokes.
+        Asks every bot to adjust its current move-command to the current walls. The computations take place in the
+        worker threads of self.bot_pool, which replace requests of previous ticks that were not picked up yet.
 
         :return: None
         """
-        for p in self.controller.players:
-            if not p.busy:
-                Thread(group=None,
-                       target=p.compute_move_command,
-                       kwargs={"walls": self.walls},
-                       name=p.color + "_compute_move_command",
-                       daemon=True
-                       ).start()
+        self.bot_pool.request(self.simulation.tick_count, self.simulation.wall_grid)
 
     # ########################################
     # Helper functions
     # ########################################
 
-    def clear_walls(self):
-        """
-        Removes all walls but the border. Visually and effectively.
-
-        :return: None
-        """
-        # visually
-        self.field_image.put(data="Black", to=(1, 1, self.controller.field_size - 1, self.controller.field_size - 1))
-        # effectively
-        self.walls[1:-1, 1:-1] = 0
-
     def put_trace(self, trace, color):
         """
         Displays field trace of pixels on the canvas. One may have to update the tk mainloop.
@@ -852,10 +745,23 @@ class GameScreen(Frame):
                 -> Prepare everything for the next round/game.
         :return: None
         """
+        # -- Report input latencies
+        report = self.latency_tracker.format_report()
+        if report:
+            print("Input latency of round {}:\n{}".format(self.simulation.current_round, report))
         # -- Award Winner
-        self.award_winner()
+        winner = self.simulation.award_winner()
+        if winner is None:
+            # Draw
+            self.label_info.config(text="Nobody wins\nround number " + str(self.simulation.current_round) + ".",
+                                   fg="Black")
+        else:
+            # Update labels
+            self.display_ranking()
+            self.label_info.config(text=winner.name + "\nwins round number " + str(self.simulation.current_round)
+                                   + ".", fg=winner.color)
         # -- Check game end
-        if self.check_game_end():
+        if self.simulation.check_game_end():
             self.set_buttons(state="off")
             game_winner = sorted(self.controller.players, key=lambda p: p.wins)[-1]
             self.label_info.config(text=str(game_winner.name) + "\nwins the game.\n Congratulations!",
@@ -863,74 +769,6 @@ class GameScreen(Frame):
         else:
             self.set_buttons(state="init")
 
-    def check_round_end(self):
-        """
-        This function returns true, if the current round is over, meaning one ore no players are left alive unless
-        it is field practice game. In that case the round only ends when no player is alive.
-
-        :return: bool, True if round is over, False otherwise.
-        """
-        players_alive = [p for p in self.controller.players if p.alive]
-        if len(players_alive) <= 1 and not self.practice_game:
-            return True
-        elif len(players_alive) == 0 and self.practice_game:
-            return True
-        else:
-            return False
-
-    def award_winner(self):
-        """
-        This function checks if the round is over and awards the winner of the round, if there is one.
-        It also updates the leaderboard and displays field text naming the winning player.
-        This function does nothing, if the round is not yet decided.
-
-        :return: None
-        """
-
-        players_alive = [p for p in self.controller.players if p.alive]
-        if len(players_alive) > 1:
-            # Not decided
-            return
-        elif len(players_alive) == 0:
-            # Draw
-            self.label_info.config(text="Nobody wins\nround number " + str(self.current_round) + ".", fg="Black")
-            return
-        else:
-            winner = players_alive[-1]
-            winner.wins += 1
-            # Update labels
-            self.display_ranking()
-            self.label_info.config(text=winner.name + "\nwins round number " + str(self.current_round) + ".",
-                                   fg=winner.color)
-
-    def check_game_end(self):
-        """
-        This function returns True if the current game is decided, meaning that one player has the maximum amount of
-        required wins.
-
-        :return: bool, True if teh game is over, False otherwise.
-        """
-
-        players_sorted = sorted(self.controller.players, key=lambda p: p.wins)  # ascending
-        if len(players_sorted) > 0 and players_sorted[-1].wins >= self.max_wins:
-            return True
-        else:
-            return False
-
-    def reset_all_items(self):
-        """
-        Clears all items from the game field, deactivates all running effects and resets the item variables.
-        :return: None
-        """
-        # -- Clean up item variables
-        self.item_id = 1
-        for tup in self.items_active:
-            item, _ = tup
-            item.deactivate()
-        self.items_spawned = {}
-        self.items_active = []
-        self.items = zeros((self.controller.field_size, self.controller.field_size), dtype="int")
-
     # ########################################
     # Deprecated / legacy functions
     # ########################################
@@ -948,55 +786,18 @@ class GameScreen(Frame):
                 continue
             old_trace = old_traces[p]
             # draw old position if player is alive and not flying
-            if self.tick_count % self.gap_rate > self.gap_length and not p.flying:
+            if self.simulation.draws_walls(p):
                 self.put_trace(trace=old_trace, color=p.color)
             else:
                 self.put_trace(trace=old_trace, color="Black")  # Override the previously drawn white head
             # draw new player head
-            if p.flying and self.tick_count % 4 in [2, 3]:
+            if p.flying and self.simulation.tick_count % 4 in [2, 3]:
                 # Player is flying. Do not print every 3rd and 4th head position.
                 pass
             else:
                 # Player is not flying. Print head as usual.
                 self.put_trace(trace=p.dot_trace, color="White")
 
-    def _move_deprecated(self):
-        """
-        This function moves every player by one step according to their current position, speed, angle and
-        move command. It also updates the walls with the way traces and returns field list of all the old player positions.
-
-        :return: dict of list of tuple of int of size 2.
-        """
-        old_way_traces = {}
-        for p in self.controller.players:
-            if not p.alive:
-                continue
-            if p.move_command == DIR_LEFT:
-                p.angle = (p.angle - p.turn_rate) % 360
-            elif p.move_command == DIR_RIGHT:
-                p.angle = (p.angle + p.turn_rate) % 360
-            # compute new position
-            p.pos = self.get_target_pixel(pos=p.pos, dist=p.speed, angle=p.angle)
-            player_moved_straight = True
-
-            # reset move_command if players turn rate is set to RATE_RIGHT_ANGLE.
-            if p.turn_rate == RATE_RIGHT_ANGLE:
-                p.move_command = DIR_STRAIGHT
-
-            # update new dot trace
-            old_dot_trace = p.dot_trace
-            old_way_traces[p] = old_dot_trace
-            p.dot_trace = self.dot_trace(pos=p.pos, r=p.size)  # new dot trace at new position
-
-            # update walls if...
-            if (self.tick_count % self.gap_rate > self.gap_length  # it is not field tick where gaps are drawn &&
-                    and (
-                            p.turn_rate != RATE_RIGHT_ANGLE or player_moved_straight)  # there was NOT field 90 degree turn &&
-                    and not p.flying):  # player is not flying.
-                for pix in [c for c in old_dot_trace if c not in p.dot_trace]:
-                    self.walls[pix] = -1
-        return old_way_traces
-
     def put_trace_by_function(self, func, rect):
         """
         This function draws color values given by the function func to field rectangle onto field_image.
@@ -0,0 +1,35 @@
+from glob import glob
+from os import path
+from tkinter import PhotoImage
+
+# Cache of decoded icons keyed by their path relative to the execution path, e.g. "Data/IconFly.png".
+_icons = {}
+
+
+def load_icons(execution_path, pattern="Data/*Icon*.png"):
+    """
+    Decodes all icons matching pattern once. Requires a Tk root window to exist.
+
+    :param execution_path: string, directory the pattern is relative to, see GUI.get_execution_path.
+    :param pattern: string, glob pattern of the icon files relative to execution_path.
+    :return: None
+    """
+    for file in glob(path.join(execution_path, pattern)):
+        image_path = path.relpath(file, execution_path).replace(path.sep, "/")
+        if image_path not in _icons:
+            _icons[image_path] = PhotoImage(file=file)
+
+
+def get_icon(execution_path, image_path):
+    """
+    Returns the decoded icon of the given path. Icons missed by load_icons are decoded on first use.
+
+    :param execution_path: string, directory image_path is relative to, see GUI.get_execution_path.
+    :param image_path: string, path of the icon relative to execution_path as stored in Item.image_path.
+    :return: PhotoImage instance, shared by all items using the same icon.
+    """
+    icon = _icons.get(image_path)
+    if icon is None:
+        icon = PhotoImage(file=execution_path + "/" + image_path)
+        _icons[image_path] = icon
+    return icon
@@ -0,0 +1,131 @@
+from threading import Lock
+from timeit import default_timer
+
+
+class InputDispatcher:
+    """
+    Receives every key event of the application through a single pair of Tk bindings and routes it by the key symbol
+    of the event, e.g. "Left", "n" or "space". Every key event of a player is timestamped on arrival, which allows
+    measuring input latency, see Screens.InputLatencyTrackerClass.
+
+    Keys of players are looked up in a keymap and queued. The queue is applied by dispatch at the next tick boundary,
+    so move-commands only change in between ticks and within the thread performing the ticks. X11 reports a held key
+    as repeated pairs of release and press. A press cancels a queued release of the same key, so auto-repeat is seen
+    by the players as repeated presses of a held key.
+
+    Keys bound to actions, like the space bar starting and pausing a round, are handled immediately. A capture, see
+    capture_next, receives the next pressed key before anything else.
+    """
+
+    def __init__(self, root):
+        """
+        :param root: Tk instance of the application.
+        """
+        self.keymap = {}  # Dict of list of Player instances, keyed by key symbol
+        self.actions = {}  # Dict of functions without arguments, keyed by key symbol
+        self.capture = None  # Function called with the key symbol of the next key press, see capture_next
+        self.queue = []  # List of tuple (Player instance, key symbol, True if pressed, timestamp) not dispatched yet
+        self.lock = Lock()  # guards self.queue, which is filled by Tk and applied by the ticking thread
+
+        root.bind_all("<KeyPress>", self.on_key_press, add="+")
+        root.bind_all("<KeyRelease>", self.on_key_release, add="+")
+
+    def bind_players(self, players):
+        """
+        Routes the keys of the given players to them from now on. Previously bound players are unbound.
+
+        :param players: list of Player instances.
+        :return: None
+        """
+        keymap = {}
+        for p in players:
+            for key in p.keys.values():
+                keymap.setdefault(key, []).append(p)
+        with self.lock:
+            self.keymap = keymap
+            self.queue = []
+
+    def unbind_players(self):
+        """
+        Stops routing keys to players and discards all events that were not dispatched yet.
+
+        :return: None
+        """
+        with self.lock:
+            self.keymap = {}
+            self.queue = []
+
+    def bind_action(self, key, action):
+        """
+        :param key: string, key symbol.
+        :param action: function without arguments called on every press of key.
+        :return: None
+        """
+        self.actions[key] = action
+
+    def unbind_action(self, key):
+        """
+        :param key: string, key symbol.
+        :return: None
+        """
+        self.actions.pop(key, None)
+
+    def capture_next(self, function):
+        """
+        Hands the next key press to function instead of routing it. The capture is released before function is called,
+        so function may capture the following key press again.
+
+        :param function: function accepting the key symbol as string, or None to cancel a pending capture.
+        :return: None
+        """
+        self.capture = function
+
+    def on_key_press(self, event):
+        key = event.keysym
+        if self.capture is not None:
+            capture = self.capture
+            self.capture = None
+            capture(key)
+            return
+        action = self.actions.get(key)
+        if action is not None:
+            action()
+            return
+        players = self.keymap.get(key)
+        if not players:
+            return
+        timestamp = default_timer()
+        with self.lock:
+            if self.queue and self.queue[-1][1] == key and not self.queue[-1][2]:
+                # Auto-repeat: The key was not actually released.
+                self.queue = [queued for queued in self.queue if queued[1] != key or queued[2]]
+            self.queue.extend((p, key, True, timestamp) for p in players)
+
+    def on_key_release(self, event):
+        key = event.keysym
+        players = self.keymap.get(key)
+        if not players:
+            return
+        timestamp = default_timer()
+        with self.lock:
+            self.queue.extend((p, key, False, timestamp) for p in players)
+
+    def dispatch(self):
+        """
+        Applies all queued key events to their players in the order they happened.
+
+        :return: list of tuple (Player instance, timestamp of the key event), events that changed a move-command.
+        """
+        with self.lock:
+            events = self.queue
+            self.queue = []
+        changes = []
+        for p, key, pressed, timestamp in events:
+            move_command = p.move_command
+            if pressed:
+                p.press_key(key)
+            else:
+                p.release_key(key)
+            if p.move_command != move_command:
+                changes.append((p, timestamp))
+        return changes
@@ -0,0 +1,97 @@
+from timeit import default_timer
+
+from Engine.TickProfilerClass import TickProfiler
+
+STAGE_TICK = "input->tick"  # From the key event to the tick moving the player with the new move-command
+STAGE_SCREEN = "input->screen"  # From the key event to the flush drawing the moved head
+
+
+class InputLatencyTracker:
+    """
+    Measures the latency of key input per player in two stages: From the key event until the tick that consumes the
+    changed move-command, and until the renderer flushes the moved head to the screen.
+
+    Key events are timestamped by the InputDispatcher when Tk delivers them. Only events changing the move-command of
+    a player are tracked. The durations are kept in rolling windows of a TickProfiler with one phase per player and
+    stage, named like "P1 input->tick".
+    """
+
+    def __init__(self, window=1000, enabled=True):
+        """
+        :param window: int, number of latest latencies kept per player and stage.
+        :param enabled: boolean, if False, nothing is measured.
+        """
+        self.enabled = enabled
+        self.samples = TickProfiler(window=window)  # Latencies in seconds, one phase per player and stage
+        self.pending = {}  # Dict of list of timestamps of applied key events not consumed by a tick, keyed by player
+        self.moved = []  # List of tuple (Player instance, timestamp) consumed by a tick but not displayed yet
+
+    def reset(self):
+        """
+        Discards all measurements and pending events.
+
+        :return: None
+        """
+        self.samples.reset()
+        self.pending = {}
+        self.moved = []
+
+    def on_input_applied(self, p, timestamp):
+        """
+        Registers a key event that changed the move-command of player p.
+
+        :param p: Player instance.
+        :param timestamp: float, time of the key event as returned by timeit.default_timer.
+        :return: None
+        """
+        if self.enabled:
+            self.pending.setdefault(p, []).append(timestamp)
+
+    def on_players_moved(self, players):
+        """
+        Registers the tick consuming the move-commands of the given players.
+
+        :param players: iterable of Player instances that moved in the current tick.
+        :return: None
+        """
+        if not self.pending:
+            return
+        now = default_timer()
+        for p in players:
+            for timestamp in self.pending.pop(p, ()):
+                self.samples.record(p.name + " " + STAGE_TICK, now - timestamp)
+                self.moved.append((p, timestamp))
+        self.pending = {}  # Events of players that did not move are never consumed
+
+    def on_flushed(self):
+        """
+        Registers a flush of the renderer, which displays every consumed move-command.
+
+        :return: None
+        """
+        if not self.moved:
+            return
+        now = default_timer()
+        for p, timestamp in self.moved:
+            self.samples.record(p.name + " " + STAGE_SCREEN, now - timestamp)
+        self.moved = []
+
+    def summary(self):
+        """
+        :return: dict mapping "<player name> <stage>" to a dict with the keys "count", "mean_ms", "p50_ms", "p95_ms",
+        "p99_ms" and "max_ms", see TickProfiler.summary.
+        """
+        return self.samples.summary()["phases"]
+
+    def format_report(self):
+        """
+        Formats the latency distributions as text, one line per player and stage.
+
+        :return: string, empty if nothing was measured.
+        """
+        lines = []
+        # All STAGE_TICK lines first, then all STAGE_SCREEN lines, each ordered by player name
+        for name, stats in sorted(self.summary().items(), key=lambda item: (item[0].endswith(STAGE_SCREEN), item[0])):
+            lines.append("{:<28} n {:4d}  p50 {:6.1f}  p95 {:6.1f}  max {:6.1f} ms".format(
+                name, stats["count"], stats["p50_ms"], stats["p95_ms"], stats["max_ms"]))
+        return "\n".join(lines)
@@ -2,8 +2,6 @@ from tkinter import (Frame, Label, Button, Entry, IntVar, Radiobutton, PhotoImag
                      TOP,
                      )
 
-from pynput import keyboard
-
 from FieldObjects import PlayerClass
 from Screens import GUI
 
@@ -17,37 +15,37 @@ class OptionScreen(Frame):
         # -- Player attributes
         # #########################################################
         self.p1 = {"name": "P1", "color": "Red",
-                   "keys": {"left": keyboard.Key.left, "right": keyboard.Key.right},
+                   "keys": {"left": "Left", "right": "Right"},
                    "active": True,
                    "toggle": lambda: self.toggle_player(0),
                    "adjust": lambda: self.change_keys(0),
                    }
         self.p2 = {"name": "P2", "color": "Blue",
-                   "keys": {"left": keyboard.KeyCode(char='n'), "right": keyboard.KeyCode(char='m')},
+                   "keys": {"left": "n", "right": "m"},
                    "active": True,
                    "toggle": lambda: self.toggle_player(1),
                    "adjust": lambda: self.change_keys(1),
                    }
         self.p3 = {"name": "P3", "color": "Green",
-                   "keys": {"left": keyboard.KeyCode(char='y'), "right": keyboard.KeyCode(char='x')},
+                   "keys": {"left": "y", "right": "x"},
                    "active": True,
                    "toggle": lambda: self.toggle_player(2),
                    "adjust": lambda: self.change_keys(2),
                    }
         self.p4 = {"name": "P4", "color": "Purple",
-                   "keys": {"left": keyboard.KeyCode(char='1'), "right": keyboard.KeyCode(char='q')},
+                   "keys": {"left": "1", "right": "q"},
                    "active": True,
                    "toggle": lambda: self.toggle_player(3),
                    "adjust": lambda: self.change_keys(3),
                    }
         self.p5 = {"name": "P5", "color": "Cyan",
-                   "keys": {"left": keyboard.KeyCode(char='0'), "right": keyboard.KeyCode(char=',')},
+                   "keys": {"left": "0", "right": "comma"},
                    "active": True,
                    "toggle": lambda: self.toggle_player(4),
                    "adjust": lambda: self.change_keys(4),
                    }
         self.p6 = {"name": "P6", "color": "Orange",
-                   "keys": {"left": keyboard.KeyCode(char='6'), "right": keyboard.KeyCode(char='9')},
+                   "keys": {"left": "6", "right": "9"},
                    "active": True,
                    "toggle": lambda: self.toggle_player(5),
                    "adjust": lambda: self.change_keys(5),
@@ -95,12 +93,8 @@ class OptionScreen(Frame):
             entry_field.grid(row=3, column=2 * i, columnspan=2, padx=8)
             self.name_fields.append(entry_field)
             # direction labels
-            try:
-                label_left = Label(master=self, text=p["keys"]["left"].char, relief="ridge", cnf=cnf_label_keys)
-                label_right = Label(master=self, text=p["keys"]["right"].char, relief="ridge", cnf=cnf_label_keys)
-            except AttributeError:
-                label_left = Label(master=self, text=str(p["keys"]["left"])[4:], relief="ridge", cnf=cnf_label_keys)
-                label_right = Label(master=self, text=str(p["keys"]["right"])[4:], relief="ridge", cnf=cnf_label_keys)
+            label_left = Label(master=self, text=p["keys"]["left"], relief="ridge", cnf=cnf_label_keys)
+            label_right = Label(master=self, text=p["keys"]["right"], relief="ridge", cnf=cnf_label_keys)
             self.key_labels_left.append(label_left)
             self.key_labels_right.append(label_right)
             label_left.grid(row=4, column=i * 2)
@@ -148,9 +142,8 @@ class OptionScreen(Frame):
         self.bback.grid(row=20, column=6, columnspan=2, pady=50)
         self.bapply = Button(master=self, text="Apply", command=self.apply, cnf=cnf_button_thin1)
         self.bapply.grid(row=20, column=8, columnspan=2, pady=50)
-        # Listener
-        self.listener_adjust = None  # Will be defined in make_listener
-        self.new_keys = []
+        # Key capture
+        self.new_keys = []  # Key symbols captured so far, see capture_keys
 
     # #########################################################
     # ----- Button Functions
@@ -159,14 +152,8 @@ class OptionScreen(Frame):
     def back(self):
         # remove focus
         self.focus_set()
-        # turn of listeners if running
-        try:
-            self.listener_adjust.stop()
-            self.listener_adjust.join()
-        except RuntimeError:
-            pass
-        except AttributeError:
-            pass
+        # cancel key capture if running
+        self.controller.input_dispatcher.capture_next(None)
         # reset buttons
         for b in self.adjust_buttons:
             b.config(borderwidth=2, relief="raised")
@@ -175,14 +162,8 @@ class OptionScreen(Frame):
     def apply(self):
         # remove focus
         self.focus_set()
-        # turn of listeners if running
-        try:
-            self.listener_adjust.stop()
-            self.listener_adjust.join()
-        except RuntimeError:
-            pass
-        except AttributeError:
-            pass
+        # cancel key capture if running
+        self.controller.input_dispatcher.capture_next(None)
         # reset adjust buttons
         for b in self.adjust_buttons:
             b.config(borderwidth=2, relief="raised")
@@ -246,72 +227,50 @@ class OptionScreen(Frame):
     # ############################
     # Direction-Keys related
     # ############################
-    def make_listener(self, i):
+    def capture_keys(self, i):
         """
-        Makes field listener for player i (0 to 5) that records the next two key presses. First press becomes left command,
-        second one becomes right command.
+        Captures the next two key presses for player i (0 to 5). First press becomes left command, second one becomes
+        right command. Escape cancels the capture.
         :param i:
         :return: None
         """
         self.new_keys = []
-        # Delete old listeners if active
-        try:
-            self.listener_adjust.stop()
-            self.listener_adjust.join()
-        except RuntimeError:
-            pass
-        except AttributeError:
-            pass
         # Reset button optic
         for b in self.adjust_buttons:
             b.config(borderwidth=2, relief="raised")
         self.adjust_buttons[i].config(borderwidth=2, relief="ridge")
 
         def on_press(key):
-            if key == keyboard.Key.esc:
-                # Reset the buttons and turn of listener
+            if key == "Escape":
+                # Reset the buttons and stop capturing
                 for b in self.adjust_buttons:
                     b.config(borderwidth=2, relief="raised")
-                return False
+                return
             self.new_keys.append(key)
-            # print("Pressed:", key)
             if len(self.new_keys) >= 2:
                 self.transfer_key_queue(i)
-                return False
+            else:
+                self.controller.input_dispatcher.capture_next(on_press)
 
-        self.listener_adjust = keyboard.Listener(on_press=on_press)
+        self.controller.input_dispatcher.capture_next(on_press)
 
     def transfer_key_queue(self, i):
         left = self.new_keys[0]
         right = self.new_keys[1]
         self.p_options[i]["keys"] = {"left": left, "right": right}
         # Update the control labels
-        try:
-            self.key_labels_left[i].config(text=left.char)
-            self.key_labels_right[i].config(text=right.char)
-        except AttributeError:
-            self.key_labels_left[i].config(text=str(left)[4:])
-            self.key_labels_right[i].config(text=str(right)[4:])
+        self.key_labels_left[i].config(text=left)
+        self.key_labels_right[i].config(text=right)
         # Reset button
         self.adjust_buttons[i].config(borderwidth=2, relief="raised")
-        # Turn of teh current listeners
-        try:
-            self.listener_adjust.stop()
-            self.listener_adjust.join()
-        except RuntimeError:
-            pass
-        except AttributeError:
-            pass
 
     def change_keys(self, i):
         """
-        Creates field keyboard listener that records the next two keys pressed and changes the command keys of the ith
-        player to these keys.
+        Records the next two keys pressed and changes the command keys of the ith player to these keys.
         :param i: change keys of ith player (0 to 5) as int.
         :return: None
         """
         # remove focus from any name field
         self.focus_set()
-        # make listener
-        self.make_listener(i)
-        self.listener_adjust.start()
+        # capture keys
+        self.capture_keys(i)
@@ -92,6 +92,6 @@ class TitleScreen(Frame):
         self.controller.frames["Game"] = GameScreenClass.GameScreen(parent=self.parent, controller=self.controller)
         self.controller.frames["Game"].grid(row=0, column=0, sticky="nsew")
         self.controller.frames["Game"].set_buttons(state="init")  # Initialise buttons on the game screen.
-        self.controller.frames["Game"].practice_game = True  # Enable practice mode
+        self.controller.frames["Game"].simulation.practice_game = True  # Enable practice mode
         self.controller.frames["Game"].label_title.config(text="___Wall\n  Run___\n\nPractice Mode")  # Set title
         self.controller.show_frame("Game")
@@ -0,0 +1,5 @@
+import sys
+from os.path import dirname, abspath
+
+# The modules of the game are imported relative to the root of the repository.
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
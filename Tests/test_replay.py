@@ -0,0 +1,60 @@
+from time import sleep
+
+from Engine.BatchRunner import create_bots
+from Engine.BotWorkerPoolClass import BotWorkerPool
+from Engine.HeadlessControllerClass import HeadlessController
+from Engine.ReplayClass import Replay, ReplayRecorder, play_replay
+from Engine.SimulationClass import Simulation
+from FieldObjects.PlayerClassBot import PlayerBotContLossStrategy
+
+
+class SlowBot(PlayerBotContLossStrategy):
+    """
+    Bot that regularly takes longer than the deadline of the worker pool, so its results arrive in later ticks.
+    """
+
+    def decide_move_command(self, walls, pos, angle):
+        sleep(0.002)
+        return PlayerBotContLossStrategy.decide_move_command(self, walls, pos, angle)
+
+
+def record_pool_round(seed, timeout, max_ticks=2000):
+    """
+    Plays a round between bots whose move-commands are computed by a BotWorkerPool like in the rendered game.
+
+    :return: tuple (Simulation instance after the last tick, Replay instance of the round, BotWorkerPool instance)
+    """
+    bots = create_bots(["cone", "contloss", "cone"]) + [SlowBot(name="Bot4 (slow)", color="Purple")]
+    simulation = Simulation(HeadlessController(players=bots), seed=seed)
+    simulation.item_drop_chance = 0.05
+    recorder = ReplayRecorder(simulation)
+    pool = BotWorkerPool()
+    pool.start(bots)
+    try:
+        simulation.initialise_round()
+        pool.request(simulation.tick_count, simulation.wall_grid)
+        for _ in range(max_ticks):
+            pool.collect(simulation.tick_count, timeout)
+            if simulation.tick():
+                break
+            pool.request(simulation.tick_count, simulation.wall_grid)
+    finally:
+        pool.stop()
+    return simulation, recorder.replay, pool
+
+
+def assert_same_state(simulation, replayed):
+    assert replayed.tick_count == simulation.tick_count
+    assert (replayed.walls == simulation.walls).all()
+    assert (replayed.wall_owners == simulation.wall_owners).all()
+    for p, q in zip(simulation.controller.players, replayed.controller.players):
+        assert (q.pos, q.angle, q.alive, q.size, q.speed) == (p.pos, p.angle, p.alive, p.size, p.speed)
+
+
+def test_replay_of_worker_pool_round_is_exact():
+    # Short timeouts make bots miss deadlines, so late results are discarded during the recording.
+    for seed, timeout in [(1, 0.0005), (2, 0.001), (3, 0.05)]:
+        simulation, replay, pool = record_pool_round(seed, timeout)
+        assert pool.missed > 0 or timeout > 0.002
+        replayed, _ = play_replay(Replay.from_bytes(replay.to_bytes()))
+        assert_same_state(simulation, replayed)
@@ -0,0 +1,25 @@
+from numpy import deg2rad
+from numpy.random import default_rng
+
+from Utils.TargetFunctions import (get_unit_vector_sums, target_function_cont_sums, target_function_cont_sums_d,
+                                   target_function_cont_sums_dd)
+
+
+def central_difference(function, t, h=1e-3):
+    """
+    :param function: function of an angle in degrees.
+    :return: float, derivative of function at t with respect to the angle in radians, as the target functions use.
+    """
+    return (function(t + h) - function(t - h)) / (2 * deg2rad(h))
+
+
+def test_derivatives_match_finite_differences():
+    rng = default_rng(0)
+    xs, ys = rng.integers(-60, 61, size=(2, 200))
+    sum_x, sum_y = get_unit_vector_sums(xs, ys)
+    for lam in [0.0, 0.3]:
+        for t in [0.0, 17.0, 90.0, 133.5, 200.0, 301.0]:
+            d = central_difference(lambda s: target_function_cont_sums(s, sum_x, sum_y, len(xs), lam), t)
+            dd = central_difference(lambda s: target_function_cont_sums_d(s, sum_x, sum_y, len(xs), lam), t)
+            assert abs(target_function_cont_sums_d(t, sum_x, sum_y, len(xs), lam) - d) < 1e-6
+            assert abs(target_function_cont_sums_dd(t, sum_x, sum_y, len(xs), lam) - dd) < 1e-6
@@ -3,6 +3,11 @@ DIR_LEFT = -1
 DIR_RIGHT = 1
 DIR_STRAIGHT = 0
 
+# -- Wall grid entries
+WALL = -1
+NO_WALL = 0
+OWNER_NONE = 0  # Owner id of walls that were not drawn by any player, e.g. borders and blocks.
+
 # -- Player sizes
 SIZE_MIN = 2
 SIZE_SMALL = 3
@@ -12,6 +17,10 @@ SIZE_MAX = 14
 
 SIZES = [SIZE_MIN, SIZE_SMALL, SIZE_NORMAL, SIZE_BIG, SIZE_MAX]
 
+# -- Wall grid halo
+BOT_SCOPE_MAX = 80  # Largest radius of the window around its position a bot scans for walls.
+FIELD_HALO = SIZE_MAX + BOT_SCOPE_MAX  # Number of cells padding the wall grid on every side, see Utils.HaloGrid.
+
 # -- Player speeds
 SPEED_NORMAL = 4
 SPEED_SLOW = 3
@@ -50,7 +59,14 @@ RGB_VALUES = {"Red": (255, 0, 0), "red": (255, 0, 0),
               "Blue": (0, 0, 255), "blue": (0, 0, 255),
               "Orange": (255, 127, 0), "orange": (255, 127, 0),
               "Cyan": (0, 183, 235), "cyan": (0, 183, 235),
+              "Purple": (160, 32, 240), "purple": (160, 32, 240),
               "Grey": (128, 128, 128), "grey": (128, 128, 128),
               "Black": (0, 0, 0), "black": (0, 0, 0),
               "White": (255, 255, 255), "white": (255, 255, 255),
               }
+
+# -- Items
+# All items registered
+ALL_ITEMS = ["ItemClear", "ItemBlock", "ItemJump", "ItemGlueAll", "ItemSlickSelf", "ItemFly",
+             "ItemRemoveBorder", "ItemZiggZaggSelf", "ItemZiggZaggAll", "ItemFastAll", "ItemFastSelf",
+             "ItemSlowAll", "ItemSlowSelf", "ItemRandom", "ItemPackage", "ItemBigAll", "ItemSmallSelf"]
@@ -0,0 +1,55 @@
+from numpy import arange, cos, sin, radians, rint
+
+from Utils.Const import SPEEDS
+
+# Cosine and sine of every integer angle in degrees in [0, 360).
+COS_TABLE = cos(radians(arange(360))).tolist()
+SIN_TABLE = sin(radians(arange(360))).tolist()
+
+# Cache of rounded steps for every integer angle keyed by the step length. Filled with all SPEEDS up front.
+_steps = {}
+
+
+def get_direction(angle):
+    """
+    Returns the unit vector pointing in direction of angle. Integer angles are looked up in COS_TABLE and SIN_TABLE,
+    other angles are computed.
+
+    :param angle: int or float, directional angle in degrees: 0 is facing east, 90 is facing south etc.
+    :return: tuple of size 2 of float, cosine and sine of angle.
+    """
+    degree = int(angle)
+    if degree == angle:
+        degree %= 360
+        return COS_TABLE[degree], SIN_TABLE[degree]
+    rad = radians(angle % 360)
+    return float(cos(rad)), float(sin(rad))
+
+
+def get_step(dist, angle):
+    """
+    Returns the pixel offset reached when going a distance of dist in direction of angle, both coordinates rounded to
+    the nearest integer. The steps of every integer angle are computed once per distance and then served from a cache.
+
+    :param dist: int, length of the step.
+    :param angle: int, directional angle in degrees.
+    :return: tuple of size 2 of int
+    """
+    steps = _steps.get(dist)
+    if steps is None:
+        steps = _compute_steps(dist)
+        _steps[dist] = steps
+    return steps[int(angle) % 360]
+
+
+def _compute_steps(dist):
+    """
+    :param dist: int, length of the step.
+    :return: list of tuple of size 2 of int, rounded step of the given length for every integer angle in [0, 360).
+    """
+    angles = radians(arange(360))
+    return list(zip(rint(cos(angles) * dist).astype(int).tolist(), rint(sin(angles) * dist).astype(int).tolist()))
+
+
+for _speed in SPEEDS:
+    _steps[_speed] = _compute_steps(_speed)
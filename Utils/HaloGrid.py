@@ -0,0 +1,83 @@
+from numpy import zeros, concatenate, where
+
+from Utils.Const import FIELD_HALO
+
+# A halo grid stores a game field of size n padded by FIELD_HALO cells on every side: Entry [x + FIELD_HALO,
+# y + FIELD_HALO] holds the pixel (x, y) of the field. Without border, the field wraps around its edges, so the halo
+# repeats the opposite edges of the field. Every window of a radius up to FIELD_HALO around a pixel of the field is
+# then a contiguous slice of the grid. Writes go to the field, see get_field, followed by a sync of the halo.
+
+
+def create_halo_grid(field_size, dtype):
+    """
+    :param field_size: int, side length of the squared game field. Needs to be at least FIELD_HALO.
+    :param dtype: numpy dtype of the entries.
+    :return: 2-d numpy array of zeros with side length field_size + 2 * FIELD_HALO.
+    """
+    return zeros((field_size + 2 * FIELD_HALO, field_size + 2 * FIELD_HALO), dtype=dtype)
+
+
+def get_field(grid):
+    """
+    :param grid: 2-d numpy array, halo grid.
+    :return: 2-d numpy array, view of the game field within grid, i.e. the grid without halo.
+    """
+    return grid[FIELD_HALO:-FIELD_HALO, FIELD_HALO:-FIELD_HALO]
+
+
+def get_window(grid, pos, radius):
+    """
+    :param grid: 2-d numpy array, halo grid.
+    :param pos: tuple of size 2 of int, pixel of the game field in the center of the window.
+    :param radius: int, number of pixels in each direction of pos, at most FIELD_HALO.
+    :return: 2-d numpy array, view of the square window of side length 2 * radius + 1 around pos. The window wraps
+    around the field borders.
+    """
+    x, y = pos[0] + FIELD_HALO, pos[1] + FIELD_HALO
+    return grid[x - radius:x + radius + 1, y - radius:y + radius + 1]
+
+
+def sync_halo(grid):
+    """
+    Copies the edges of the whole game field into the halo.
+
+    :param grid: 2-d numpy array, halo grid.
+    :return: None
+    """
+    n = grid.shape[0] - 2 * FIELD_HALO
+    # Rows first, then the full columns including the corners of the halo
+    grid[:FIELD_HALO, FIELD_HALO:-FIELD_HALO] = grid[n:n + FIELD_HALO, FIELD_HALO:-FIELD_HALO]
+    grid[-FIELD_HALO:, FIELD_HALO:-FIELD_HALO] = grid[FIELD_HALO:2 * FIELD_HALO, FIELD_HALO:-FIELD_HALO]
+    grid[:, :FIELD_HALO] = grid[:, n:n + FIELD_HALO]
+    grid[:, -FIELD_HALO:] = grid[:, FIELD_HALO:2 * FIELD_HALO]
+
+
+def sync_halo_pixels(grid, xs, ys):
+    """
+    Copies the given pixels of the game field into the halo. Only pixels within FIELD_HALO of an edge of the field
+    have copies in the halo, up to three in the corners.
+
+    :param grid: 2-d numpy array, halo grid.
+    :param xs: 1-d numpy array of int, x-coordinates of the pixels within the game field.
+    :param ys: 1-d numpy array of int, y-coordinates of the pixels within the game field.
+    :return: None
+    """
+    n = grid.shape[0] - 2 * FIELD_HALO
+    values = grid[xs + FIELD_HALO, ys + FIELD_HALO]
+    copied = False
+    # Copies along the x-axis are copied along the y-axis again, which reaches the corners of the halo.
+    for axis in (0, 1):
+        coords = xs if axis == 0 else ys
+        near = (coords < FIELD_HALO) | (coords >= n - FIELD_HALO)
+        if not near.any():
+            continue
+        copied = True
+        near_coords = coords[near]
+        shifted = near_coords + where(near_coords < FIELD_HALO, n, -n)
+        if axis == 0:
+            xs, ys = concatenate([xs, shifted]), concatenate([ys, ys[near]])
+        else:
+            xs, ys = concatenate([xs, xs[near]]), concatenate([ys, shifted])
+        values = concatenate([values, values[near]])
+    if copied:
+        grid[xs + FIELD_HALO, ys + FIELD_HALO] = values
@@ -1,6 +1,10 @@
 from random import choices
 
-from numpy import inf, rad2deg, deg2rad, sqrt, arctan, arccos, arcsin, sin, cos, radians
+from numpy import inf, rad2deg, deg2rad, sqrt, arctan, arccos, arcsin, sin, arange, nonzero, rint
+
+from Utils.Const import WALL
+from Utils.DirectionTable import get_direction
+from Utils.HaloGrid import get_window
 
 
 def replace_hex_color(string, col):
@@ -231,8 +235,8 @@ def get_direction_from_angle(angle):
     :param angle: float, angel in degrees [0, 360), greater values will be scaled back into this interval.
     :return: tuple of size two of float, normed 2-d vector
     """
-    rad = radians(angle)
-    return cos(rad), -sin(rad)
+    x, y = get_direction(angle)
+    return x, -y
 
 
 def is_contained_in_cone(x, y, facing_angle, apex_angle):
@@ -245,13 +249,60 @@ def is_contained_in_cone(x, y, facing_angle, apex_angle):
     :param apex_angle: float, angle in degrees in [0, 180)
     :return: boolean, true if the point is strictly contained in the cone.
     """
+    (n_x_left, n_y_left), (n_x_right, n_y_right) = get_cone_normals(facing_angle, apex_angle)
+
+    # point inside cone if both normal vectors have angle of more than 90 degrees to the point
+    # or equivalently if each scalar products of the normal vectors with the point is lesser than 0.
+    return n_x_left * x + n_y_left * y < 0 and n_x_right * x + n_y_right * y < 0
+
+
+def get_cone_normals(facing_angle, apex_angle):
+    """
+    Computes the outward facing normal vectors of both edges of the cone facing facing_angle with apex angle of
+    apex_angle. A point lies strictly inside the cone if its scalar products with both normals are lesser than 0.
+
+    :param facing_angle: float, angle in degrees in [0, 360), increasing clock-wise, 0 degree facing east
+    :param apex_angle: float, angle in degrees in [0, 180)
+    :return: tuple of size 2 of tuple of size 2 of float, normal of the left and of the right cone edge.
+    """
     assert 180 >= apex_angle >= 0, "apex_angle must be in [0, 360)."
     x_left, y_left = get_direction_from_angle(facing_angle - apex_angle / 2)
     x_right, y_right = get_direction_from_angle(facing_angle + apex_angle / 2)
+    return (-y_left, x_left), (y_right, -x_right)
 
-    n_x_left, n_y_left = -y_left, x_left  # normal of left cone vector
-    n_x_right, n_y_right = y_right, -x_right  # normal of right cone vector
 
-    # point inside cone if both normal vectors have angle of more than 90 degrees to the point
-    # or equivalently if each scalar products of the normal vectors with the point is lesser than 0.
-    return n_x_left * x + n_y_left * y < 0 and n_x_right * x + n_y_right * y < 0
+def get_wall_points_in_window(walls, pos, radius):
+    """
+    Returns the coordinates of all walls within the square window of the given radius around pos, moving each point
+    as if pos is the origin. The window wraps around the field borders.
+
+    :param walls: 2-d numpy array of int8, halo grid of the walls, see Utils.HaloGrid. WALL entries are supposed to be
+    walls.
+    :param pos: tuple of size 2 of int, center of the window.
+    :param radius: int, number of pixels in each direction of pos, at most FIELD_HALO.
+    :return: tuple of size 2 of 1-d numpy arrays of int, coordinates relative to pos where a WALL entry is present.
+    """
+    # Convention is that walls contains WALL at [x, y] if the canvas pixel (x, y) shows a wall.
+    i, j = nonzero(get_window(walls, pos, radius) == WALL)
+    return i - radius, j - radius
+
+
+def get_swept_offsets(offsets_x, offsets_y, dist, angle, sparse=1):
+    """
+    Sweeps a shape given by its pixel offsets along a straight line. The shape is moved in direction of angle by every
+    distance in [0, dist) that is a multiple of sparse and all pixels it covers on its way are returned. Rounding
+    matches a single step of Simulation.get_target_pixel.
+
+    :param offsets_x: 1-d numpy array of int, x-offsets of the pixels of the shape.
+    :param offsets_y: 1-d numpy array of int, y-offsets of the pixels of the shape.
+    :param dist: int, length of the sweep.
+    :param angle: int, directional angle in degrees: 0 is facing east, 90 is facing south etc.
+    :param sparse: int > 0, distance between two consecutive positions of the shape.
+    :return: tuple of size 2 of 1-d numpy arrays of int, offsets of all covered pixels. Pixels covered multiple times
+    are contained multiple times.
+    """
+    direction_x, direction_y = get_direction(angle)
+    steps = arange(0, dist, sparse)
+    step_x = rint(direction_x * steps).astype(int)
+    step_y = rint(direction_y * steps).astype(int)
+    return (offsets_x[:, None] + step_x).ravel(), (offsets_y[:, None] + step_y).ravel()
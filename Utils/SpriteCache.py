@@ -0,0 +1,74 @@
+from numpy import array, nonzero, int16
+
+from Utils.Const import SIZES
+from Utils.DirectionTable import get_direction
+
+# Cache of dot offsets keyed by the dot size r.
+_dot_offsets = {}
+# Cache of dot offsets as pair of index arrays keyed by the dot size r.
+_dot_offset_arrays = {}
+# Cache of the collision heads of every integer angle keyed by the dot size r. Filled with all SIZES up front.
+_head_indices = {}
+
+
+def get_dot_offsets(r):
+    """
+    Returns the pixels of a dot of size r relative to its center. The offsets are computed once per size and then
+    served from a cache.
+
+    :param r: int, size of the dot as used in Simulation.compute_dot_trace.
+    :return: list of tuple of size 2 of int, ordered by x-offset first and y-offset second.
+    """
+    offsets = _dot_offsets.get(r)
+    if offsets is None:
+        offsets = [(i, j) for i in range(-r, r + 1) for j in range(-r, r + 1) if i ** 2 + j ** 2 <= r]
+        _dot_offsets[r] = offsets
+    return offsets
+
+
+def get_dot_offset_arrays(r):
+    """
+    Returns the same offsets as get_dot_offsets as a pair of numpy arrays which can be used for fancy indexing.
+
+    :param r: int, size of the dot.
+    :return: tuple of size 2 of 1-d numpy arrays of int, x-offsets and y-offsets.
+    """
+    offset_arrays = _dot_offset_arrays.get(r)
+    if offset_arrays is None:
+        offsets = get_dot_offsets(r)
+        offset_arrays = (array([i for i, _ in offsets]), array([j for _, j in offsets]))
+        _dot_offset_arrays[r] = offset_arrays
+    return offset_arrays
+
+
+def get_head_indices(r, angle):
+    """
+    Returns the collision head of a dot of size r facing angle, i.e. the half of the dot in front of its center
+    including the diameter. The head is given as indices into the offsets of the dot, see get_dot_offsets, so it
+    selects the head from any dot trace built from these offsets. The heads of every integer angle are computed once
+    per size and then served from a cache.
+
+    :param r: int, size of the dot.
+    :param angle: int, directional angle in degrees: 0 is facing east, 90 is facing south etc.
+    :return: 1-d numpy array of int16, ascending indices of the offsets within the head.
+    """
+    heads = _head_indices.get(r)
+    if heads is None:
+        heads = _compute_head_indices(r)
+        _head_indices[r] = heads
+    return heads[int(angle) % 360]
+
+
+def _compute_head_indices(r):
+    """
+    :param r: int, size of the dot.
+    :return: list of 1-d numpy arrays of int16, collision head of a dot of size r for every integer angle in [0, 360).
+    """
+    offsets_x, offsets_y = get_dot_offset_arrays(r)
+    directions = array([get_direction(angle) for angle in range(360)])
+    in_front = offsets_x * directions[:, :1] + offsets_y * directions[:, 1:] >= 0  # shape (360, number of offsets)
+    return [nonzero(row)[0].astype(int16) for row in in_front]
+
+
+for _size in SIZES:
+    _head_indices[_size] = _compute_head_indices(_size)
@@ -1,4 +1,82 @@
-from numpy.core._multiarray_umath import deg2rad, sqrt, cos, sin
+from numpy import deg2rad, rad2deg, sqrt, cos, sin, arctan2, array, divide, zeros_like
+
+
+def get_centered_coordinates(wall_points, pos):
+    """
+    Converts wall-points given as list of field coordinates into coordinate arrays with pos as origin.
+
+    :param wall_points: list of tuple of size 2 of int, all locations of wall entries.
+    :param pos: tuple of size 2 of int, position which is considered the center of all wall-points.
+    :return: tuple of size 2 of 1-d numpy arrays, x- and y-coordinates relative to pos.
+    """
+    points = array(wall_points, dtype=float).reshape(-1, 2)
+    return points[:, 0] - pos[0], points[:, 1] - pos[1]
+
+
+def get_unit_vector_sums(xs, ys):
+    """
+    Projects every given point onto the unit-circle and sums up the resulting coordinates. The origin itself is
+    projected onto (0, 0).
+
+    These sums are all the target functions below depend on, so they only need to be computed once per set of
+    wall-points. Every loss, derivative and the minimum can then be evaluated in constant time.
+
+    :param xs: 1-d numpy array, x-coordinates of the wall-points relative to the player's position.
+    :param ys: 1-d numpy array, y-coordinates of the wall-points relative to the player's position.
+    :return: tuple of size 2 of float, (SUM_x, SUM_y) of the normed coordinates.
+    """
+    norms = sqrt(xs ** 2 + ys ** 2)
+    x_norm = divide(xs, norms, out=zeros_like(norms), where=norms > 0)
+    y_norm = divide(ys, norms, out=zeros_like(norms), where=norms > 0)
+    return float(x_norm.sum()), float(y_norm.sum())
+
+
+def target_function_cont_sums(t, sum_x, sum_y, n, lam=0.0):
+    """
+    Evaluates the loss-function target_function_cont given the unit vector sums of the wall-points.
+
+    :param t: float, angle in degree, this is the objective-parameter to minimize over.
+    :param sum_x: float, SUM_x as returned by get_unit_vector_sums.
+    :param sum_y: float, SUM_y as returned by get_unit_vector_sums.
+    :param n: int > 0, number of wall-points.
+    :param lam: float, l-2 regularization factor, default 0.
+    :return: float, Loss function value of the given target angle.
+    """
+    t = deg2rad(t)  # angles in radians
+    return 2 / n * cos(t) * sum_x + 2 / n * sin(t) * sum_y - 1 + 0.5 * lam * t ** 2
+
+
+def target_function_cont_sums_d(t, sum_x, sum_y, n, lam=0.0):
+    """
+    First derivative of target_function_cont_sums.
+
+    :return: float
+    """
+    t = deg2rad(t)  # angles in radians
+    return -2 / n * sin(t) * sum_x + 2 / n * cos(t) * sum_y + lam * t
+
+
+def target_function_cont_sums_dd(t, sum_x, sum_y, n, lam=0.0):
+    """
+    Second derivative of target_function_cont_sums.
+
+    :return: float
+    """
+    t = deg2rad(t)  # angles in radians
+    return -2 / n * cos(t) * sum_x - 2 / n * sin(t) * sum_y + lam
+
+
+def target_function_cont_argmin(sum_x, sum_y):
+    """
+    Computes the minimizer of target_function_cont_sums without regularization (lam = 0) analytically.
+    Since the loss is proportional to the scalar product of (cos(t), sin(t)) and (SUM_x, SUM_y), it is minimal for
+    the angle pointing in the opposite direction of (SUM_x, SUM_y).
+
+    :param sum_x: float, SUM_x as returned by get_unit_vector_sums.
+    :param sum_y: float, SUM_y as returned by get_unit_vector_sums.
+    :return: float, angle in degrees in [0, 360).
+    """
+    return float(rad2deg(arctan2(-sum_y, -sum_x))) % 360
 
 
 def target_function_cont(t, wall_points, pos, lam=0.0):
@@ -29,23 +107,8 @@ def target_function_cont(t, wall_points, pos, lam=0.0):
     :param lam: float, l-2 regularization factor, default 0.
     :return: float, Loss function value of the give target angle.
     """
-    sum_x = 0
-    sum_y = 0
-    pos_x, pos_y = pos
-    t = deg2rad(t)  # angles in radians
-    for i, j in wall_points:
-        # compute coordinates for each pixel, such that self.pos is the origin.
-        x = i - pos_x
-        y = j - pos_y
-        # project onto unit-sphere
-        if not x == y == 0:
-            x_norm = x / sqrt(x ** 2 + y ** 2)
-            y_norm = y / sqrt(x ** 2 + y ** 2)
-        else:
-            x_norm = y_norm = 0
-        sum_x += x_norm
-        sum_y += y_norm
-    return 2 / len(wall_points) * cos(t) * sum_x + 2 / len(wall_points) * sin(t) * sum_y - 1 + 0.5 * lam * t ** 2
+    sum_x, sum_y = get_unit_vector_sums(*get_centered_coordinates(wall_points, pos))
+    return target_function_cont_sums(t, sum_x, sum_y, len(wall_points), lam)
 
 
 def target_function_cont_d(t, wall_points, pos, lam=0.0):
@@ -59,23 +122,8 @@ def target_function_cont_d(t, wall_points, pos, lam=0.0):
     :param lam: float, l-2 regularization factor, default 0.
     :return: float, Loss function value of the give target angle (will always be <= 0).
     """
-    sum_x = 0
-    sum_y = 0
-    pos_x, pos_y = pos
-    t = deg2rad(t)  # angles in radians
-    for i, j in wall_points:
-        # compute coordinates for each pixel, such that self.pos is the origin.
-        x = i - pos_x
-        y = j - pos_y
-        # project onto unit-sphere
-        if not x == y == 0:
-            x_norm = x / sqrt(x ** 2 + y ** 2)
-            y_norm = y / sqrt(x ** 2 + y ** 2)
-        else:
-            x_norm = y_norm = 0
-        sum_x += x_norm
-        sum_y += y_norm
-    return -2 / len(wall_points) * sin(t) * sum_x + 2 / len(wall_points) * cos(t) * sum_y + lam * t
+    sum_x, sum_y = get_unit_vector_sums(*get_centered_coordinates(wall_points, pos))
+    return target_function_cont_sums_d(t, sum_x, sum_y, len(wall_points), lam)
 
 
 def target_function_cont_dd(t, wall_points, pos, lam=0.0):
@@ -89,20 +137,5 @@ def target_function_cont_dd(t, wall_points, pos, lam=0.0):
     :param lam: float, l-2 regularization factor, default 0.
     :return: float, Loss function value of the give target angle (will always be <= 0).
     """
-    sum_x = 0
-    sum_y = 0
-    pos_x, pos_y = pos
-    t = deg2rad(t)  # angles in radians
-    for i, j in wall_points:
-        # compute coordinates for each pixel, such that self.pos is the origin.
-        x = i - pos_x
-        y = j - pos_y
-        # project onto unit-sphere
-        if not x == y == 0:
-            x_norm = x / sqrt(x ** 2 + y ** 2)
-            y_norm = y / sqrt(x ** 2 + y ** 2)
-        else:
-            x_norm = y_norm = 0
-        sum_x += x_norm
-        sum_y += y_norm
-    return 2 / len(wall_points) * cos(t) * sum_x - 2 / len(wall_points) * sin(t) * sum_y + lam
+    sum_x, sum_y = get_unit_vector_sums(*get_centered_coordinates(wall_points, pos))
+    return target_function_cont_sums_dd(t, sum_x, sum_y, len(wall_points), lam)
@@ -1,10 +1,134 @@
-from Screens import GUI
+from argparse import ArgumentParser
 
 
 def run():
+    from Screens import GUI
     gui = GUI.GUI()
     gui.mainloop()
 
 
+def parse_item_names(items):
+    if items is None:
+        return None
+    return [] if items == "none" else items.split(",")
+
+
+def run_simulation(args):
+    from Engine.BatchRunner import simulate, format_report
+    from Engine.TickProfilerClass import TickProfiler
+    profiler = TickProfiler(window=100000) if args.profile else None
+    results = simulate(strategy_names=args.bots.split(","), rounds=args.rounds, item_names=parse_item_names(args.items),
+                       max_ticks=args.max_ticks, seed=args.seed, profiler=profiler, record_directory=args.record)
+    print(format_report(results))
+    if profiler is not None:
+        profiler.export(args.profile)
+        print("")
+        print(profiler.format_overlay())
+
+
+def run_replay(args):
+    from Engine.ReplayClass import Replay, play_replay
+    replay = Replay.load(args.file)
+    if args.render:
+        from Screens import GUI
+        gui = GUI.GUI()
+        gui.show_frame("Game")
+        gui.frames["Game"].start_replay(replay)
+        gui.mainloop()
+        return
+    simulation, round_over = play_replay(replay)
+    print("Played {} ticks of {} recorded ticks, round {}.".format(simulation.tick_count - replay.start_tick,
+                                                                   replay.ticks, "over" if round_over else "not over"))
+    for p in simulation.controller.players:
+        print("{:<20}{}".format(p.name, "alive" if p.alive else "crashed"))
+
+
+def run_benchmark(args):
+    from Benchmarks.BenchmarkSuite import (run_benchmarks, save_baseline, load_baseline, find_regressions,
+                                           format_benchmark_report)
+    results = run_benchmarks(name_filter=args.filter)
+    baseline = load_baseline(args.compare) if args.compare else None
+    print(format_benchmark_report(results, baseline))
+    if args.save:
+        save_baseline(results, args.save)
+        print("Wrote baseline to " + args.save)
+    if baseline is not None:
+        regressions = find_regressions(results, baseline, tolerance=args.tolerance)
+        if regressions:
+            print("Slower than the baseline by more than {:.0%}: {}".format(args.tolerance, ", ".join(regressions)))
+            raise SystemExit(1)
+
+
+def run_tournament(args):
+    from Engine.TournamentRunner import run_tournament, format_tournament_report
+    results = run_tournament(strategy_names=args.bots.split(","), rounds=args.rounds,
+                             bots_per_round=args.bots_per_round, item_names=parse_item_names(args.items),
+                             max_ticks=args.max_ticks, seed=args.seed, workers=args.workers)
+    print(format_tournament_report(results))
+
+
+def main(argv=None):
+    parser = ArgumentParser(prog="wallrun", description="Wall Run: \"Achtung, die Kurve!\". "
+                                                        "Starts the game if no command is given.")
+    subparsers = parser.add_subparsers(dest="command")
+    parser_simulate = subparsers.add_parser("simulate", help="play rounds between bots without rendering or waiting")
+    parser_simulate.add_argument("--rounds", type=int, default=100, help="number of rounds to play (default 100)")
+    parser_simulate.add_argument("--bots", default="cone,contloss",
+                                 help="comma separated bot strategies, one bot per entry (default cone,contloss)")
+    parser_simulate.add_argument("--items", default=None,
+                                 help="comma separated item names that may spawn, 'none' disables items "
+                                      "(default all items)")
+    parser_simulate.add_argument("--max-ticks", type=int, default=5000,
+                                 help="ticks after which a round counts as draw (default 5000)")
+    parser_simulate.add_argument("--seed", type=int, default=None, help="seed of the simulation (default random)")
+    parser_simulate.add_argument("--profile", default=None, metavar="FILE",
+                                 help="write per-phase tick timings to FILE, as CSV if it ends with .csv, else JSON")
+    parser_simulate.add_argument("--record", default=None, metavar="DIR",
+                                 help="write the replay of every round to DIR, see the replay command")
+    parser_replay = subparsers.add_parser("replay", help="reproduce a recorded round")
+    parser_replay.add_argument("file", help="replay file written by simulate --record or the Replay button")
+    parser_replay.add_argument("--render", action="store_true",
+                               help="show the round on the game screen instead of fast-forwarding headless")
+    parser_tournament = subparsers.add_parser("tournament",
+                                              help="play a round-robin between bot strategies on all cpu cores")
+    parser_tournament.add_argument("--rounds", type=int, default=1000,
+                                   help="number of rounds per combination of strategies (default 1000)")
+    parser_tournament.add_argument("--bots", default="cone,contloss",
+                                   help="comma separated bot strategies taking part (default cone,contloss)")
+    parser_tournament.add_argument("--bots-per-round", type=int, default=2,
+                                   help="number of bots playing each round (default 2)")
+    parser_tournament.add_argument("--items", default=None,
+                                   help="comma separated item names that may spawn, 'none' disables items "
+                                        "(default all items)")
+    parser_tournament.add_argument("--max-ticks", type=int, default=5000,
+                                   help="ticks after which a round counts as draw (default 5000)")
+    parser_tournament.add_argument("--seed", type=int, default=0, help="master seed of the tournament (default 0)")
+    parser_tournament.add_argument("--workers", type=int, default=None,
+                                   help="number of worker processes (default number of cpu cores)")
+    parser_benchmark = subparsers.add_parser("benchmark", help="measure the hot paths of the game")
+    parser_benchmark.add_argument("--filter", default=None, help="only run benchmarks whose name contains FILTER")
+    parser_benchmark.add_argument("--save", default=None, metavar="FILE", help="write the results as baseline to FILE")
+    parser_benchmark.add_argument("--compare", default=None, metavar="FILE",
+                                  help="compare to the baseline in FILE and fail on regressions")
+    parser_benchmark.add_argument("--tolerance", type=float, default=0.2,
+                                  help="relative slow down accepted by --compare (default 0.2)")
+    args = parser.parse_args(argv)
+
+    if args.command == "simulate":
+        if len(args.bots.split(",")) < 2:
+            parser.error("at least two bots are needed to decide a round")
+        run_simulation(args)
+    elif args.command == "benchmark":
+        run_benchmark(args)
+    elif args.command == "replay":
+        run_replay(args)
+    elif args.command == "tournament":
+        if not 2 <= args.bots_per_round <= 6:
+            parser.error("between two and six bots are needed to decide a round")
+        run_tournament(args)
+    else:
+        run()
+
+
 if __name__ == "__main__":
-    run()
+    main()